@@ -3,60 +3,29 @@ import os
 from datetime import datetime, timedelta
 
 from dotenv import load_dotenv
-from flask import (Flask, flash, jsonify, redirect, render_template_string,
+from flask import (Blueprint, Flask, flash, jsonify, redirect, render_template_string,
                    request, session, url_for)
 
-from modules.gemini_chat import GeminiChat
-from modules.sheets_db import SheetsDatabase
-# Import the admin blueprint
-from routes.admin import admin_bp
+from config import Config
+from modules import geo, pricing, services
+from modules.proposals import PROPOSAL_FORMATS
+from modules.services import chat, db, proposals
+from utils.compression import Compression
+from utils.prerender import PrerenderedPage
+from utils.session_store import ServerSideSessions, regenerate_session
 
 # Load environment variables
 load_dotenv()
 
-app = Flask(__name__)
-app.secret_key = os.environ.get('SECRET_KEY', 'dev-key-change-in-production')
-
-# Register the admin blueprint
-app.register_blueprint(admin_bp)
-
-# Initialize services
-db = SheetsDatabase()
-chat = GeminiChat()
+# The main site: public pages, quote form, logins and the chat API
+main_bp = Blueprint('main', __name__)
 
 # Business Info
 BUSINESS_NAME = "Baez Cleaning Services"
 BUSINESS_PHONE = "(555) 123-4567"
 BUSINESS_EMAIL = "info@baezcleaningservices.com"
 
-# Quote Configuration (matching Google Sheets)
-QUOTE_CONFIG = {
-    'propertyRates': {
-        'office': 0.05,
-        'medical': 0.08,
-        'retail': 0.04,
-        'restaurant': 0.06,
-        'warehouse': 0.03,
-        'residential': 0.06
-    },
-    'serviceMultipliers': {
-        'regular': 1.0,
-        'deep-clean': 2.0,
-        'post-construction': 2.5,
-        'move-in-out': 1.8
-    },
-    'frequencyDiscounts': {
-        'one-time': 0,
-        'daily': 0.25,
-        'weekly': 0.20,
-        'bi-weekly': 0.15,
-        'monthly': 0.10
-    },
-    'taxRate': 0.0625,
-    'defaultProfitMargin': 35
-}
-
-@app.route('/admin-login', methods=['GET', 'POST'])
+@main_bp.route('/admin-login', methods=['GET', 'POST'])
 def admin_login():
     if request.method == 'POST':
         username = request.form.get('username')
@@ -64,9 +33,10 @@ def admin_login():
 
         try:
             if db.verify_admin(username, password):
+                regenerate_session()
                 session['is_admin'] = True
+                session['admin_user'] = username
                 session.permanent = True
-                app.permanent_session_lifetime = timedelta(hours=4)
                 flash('Welcome back, Administrator!', 'success')
                 return redirect(url_for('admin.dashboard'))
             else:
@@ -104,7 +74,7 @@ def admin_login():
 </html>
     '''
 
-@app.route('/api/chat', methods=['POST'])
+@main_bp.route('/api/chat', methods=['POST'])
 def chat_api():
     data = request.json
     message = data.get('message', '')
@@ -115,8 +85,8 @@ def chat_api():
     response = chat.get_response(message)
     return jsonify({'response': response})
 
-@app.route('/')
-def index():
+def render_index():
+    """Home page HTML; only depends on the business constants"""
     return f'''
 <!DOCTYPE html>
 <html lang="en">
@@ -561,8 +531,8 @@ def index():
 </html>
     '''
 
-@app.route('/quote')
-def quote():
+def render_quote():
+    """Quote form HTML; only depends on the business constants"""
     return f'''
 <!DOCTYPE html>
 <html lang="en">
@@ -600,6 +570,12 @@ def quote():
             </div>
         </div>
 
+        <!-- Live estimate from /api/quote/price -->
+        <div id="live-price" class="hidden mb-6 text-center">
+            <span class="text-gray-600">Estimated price per visit:</span>
+            <span id="live-price-amount" class="text-2xl font-bold text-purple-600"></span>
+        </div>
+
         <div class="bg-white rounded-3xl shadow-2xl p-8">
             <!-- PERSONALIZED SERVICE NOTICE -->
             <div class="bg-blue-50 border-2 border-blue-400 rounded-xl p-4 mb-6">
@@ -633,25 +609,25 @@ def quote():
                 <p class="text-gray-600 mb-8">What type of space needs our magic touch?</p>
 
                 <div class="grid md:grid-cols-2 gap-4">
-                    <div onclick="selectPropertyType('residential', 0.15)" class="property-card cursor-pointer border-2 border-gray-200 rounded-xl p-6 hover:border-purple-400 transition">
+                    <div onclick="selectPropertyType('residential')" class="property-card cursor-pointer border-2 border-gray-200 rounded-xl p-6 hover:border-purple-400 transition">
                         <div class="text-4xl mb-3">🏠</div>
                         <h3 class="text-xl font-semibold mb-2">Residential</h3>
                         <p class="text-gray-600 text-sm">Homes, Apartments, Condos</p>
                         <p class="text-purple-600 font-semibold mt-2">Most Popular!</p>
                     </div>
-                    <div onclick="selectPropertyType('commercial', 0.08)" class="property-card cursor-pointer border-2 border-gray-200 rounded-xl p-6 hover:border-purple-400 transition">
+                    <div onclick="selectPropertyType('commercial')" class="property-card cursor-pointer border-2 border-gray-200 rounded-xl p-6 hover:border-purple-400 transition">
                         <div class="text-4xl mb-3">🏢</div>
                         <h3 class="text-xl font-semibold mb-2">Commercial</h3>
                         <p class="text-gray-600 text-sm">Offices, Retail, Warehouses</p>
                         <p class="text-green-600 font-semibold mt-2">Best Value!</p>
                     </div>
-                    <div onclick="selectPropertyType('medical', 0.12)" class="property-card cursor-pointer border-2 border-gray-200 rounded-xl p-6 hover:border-purple-400 transition">
+                    <div onclick="selectPropertyType('medical')" class="property-card cursor-pointer border-2 border-gray-200 rounded-xl p-6 hover:border-purple-400 transition">
                         <div class="text-4xl mb-3">🏥</div>
                         <h3 class="text-xl font-semibold mb-2">Medical</h3>
                         <p class="text-gray-600 text-sm">Clinics, Dental, Medical Offices</p>
                         <p class="text-blue-600 font-semibold mt-2">Specialized Cleaning</p>
                     </div>
-                    <div onclick="selectPropertyType('restaurant', 0.10)" class="property-card cursor-pointer border-2 border-gray-200 rounded-xl p-6 hover:border-purple-400 transition">
+                    <div onclick="selectPropertyType('restaurant')" class="property-card cursor-pointer border-2 border-gray-200 rounded-xl p-6 hover:border-purple-400 transition">
                         <div class="text-4xl mb-3">🍽️</div>
                         <h3 class="text-xl font-semibold mb-2">Restaurant</h3>
                         <p class="text-gray-600 text-sm">Restaurants, Cafes, Kitchens</p>
@@ -939,6 +915,7 @@ def quote():
                     <input type="hidden" id="final-sqft" name="sqft">
                     <input type="hidden" id="final-services" name="services">
                     <input type="hidden" id="final-frequency" name="frequency">
+                    <input type="hidden" id="final-bathrooms" name="bathrooms">
                     <input type="hidden" id="uploaded-photos" name="photos">
 
                     <div class="grid md:grid-cols-2 gap-4">
@@ -956,12 +933,16 @@ def quote():
                         <label class="block text-sm font-medium text-gray-700 mb-2">
                             📍 Service Location
                         </label>
-                        <input type="text" name="city" placeholder="City (e.g., Boston, Cambridge, Quincy)" required
-                            class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-purple-600 mb-2">
+                        <div class="grid grid-cols-3 gap-2 mb-2">
+                            <input type="text" name="city" placeholder="City (e.g., Boston, Cambridge, Quincy)" required
+                                class="col-span-2 w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-purple-600">
+                            <input type="text" name="zip" id="zip" placeholder="ZIP" required inputmode="numeric" pattern="[0-9]{{5}}" maxlength="5"
+                                class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-purple-600">
+                        </div>
                         <input type="text" name="address" placeholder="Full Address (Street, City, State, ZIP)" required
                             class="w-full px-4 py-3 border border-gray-300 rounded-lg focus:ring-2 focus:ring-purple-600">
                         <p class="text-xs text-gray-600 mt-2">
-                            Your location helps us assign the best team for your area.
+                            Your location helps us assign the best team for your area. Travel beyond {pricing.get_rules().free_travel_miles:g} miles is added to the estimate.
                         </p>
                     </div>
 
@@ -1000,7 +981,6 @@ def quote():
         let uploadedPhotos = [];
         let quoteData = {{
             propertyType: '',
-            baseRate: 0,
             sqft: 2000,
             services: [],
             frequency: 'bi-weekly',
@@ -1032,13 +1012,13 @@ def quote():
             quoteData.photos = uploadedPhotos;
         }}
 
-        function selectPropertyType(type, rate) {{
+        function selectPropertyType(type) {{
             document.querySelectorAll('.property-card').forEach(card => card.classList.remove('selected'));
             event.currentTarget.classList.add('selected');
             quoteData.propertyType = type;
-            quoteData.baseRate = rate;
 
             document.getElementById('room-details').style.display = type === 'residential' ? 'block' : 'none';
+            updatePrice();
             setTimeout(() => nextStep(), 500);
         }}
 
@@ -1048,6 +1028,46 @@ def quote():
             updatePrice();
         }}
 
+        // Prices come from the server's pricing engine, the same one quote-submit uses
+        let priceTimer = null;
+        let priceRequest = null;
+
+        function updatePrice() {{
+            clearTimeout(priceTimer);
+            priceTimer = setTimeout(fetchPrice, 250);
+        }}
+
+        function fetchPrice() {{
+            if (!quoteData.propertyType) return;
+            if (priceRequest) priceRequest.abort();
+            priceRequest = new AbortController();
+
+            const params = new URLSearchParams({{
+                property_type: quoteData.propertyType,
+                sqft: quoteData.sqft,
+                services: getSelectedServices().join(','),
+                frequency: getSelectedFrequency(),
+                bathrooms: document.getElementById('bathrooms').value,
+                zip: document.getElementById('zip').value
+            }});
+            fetch('/api/quote/price?' + params, {{ signal: priceRequest.signal }})
+                .then(response => response.ok ? response.json() : null)
+                .then(data => {{
+                    if (!data) return;
+                    const amount = document.getElementById('live-price-amount');
+                    amount.textContent = '$' + data.total.toLocaleString('en-US', {{ minimumFractionDigits: 2, maximumFractionDigits: 2 }});
+                    amount.classList.remove('price-pop');
+                    void amount.offsetWidth;
+                    amount.classList.add('price-pop');
+                    document.getElementById('live-price').classList.remove('hidden');
+                }})
+                .catch(() => {{}});
+        }}
+
+        document.querySelectorAll('.service-option input, input[name="frequency"], #bathrooms, #zip').forEach(input => {{
+            input.addEventListener('change', updatePrice);
+        }});
+
         function nextStep() {{
             if (currentStep < totalSteps) {{
                 document.getElementById('step' + currentStep).classList.remove('active');
@@ -1059,11 +1079,12 @@ def quote():
                 document.getElementById('progress-text').textContent = 'Step ' + currentStep + ' of ' + totalSteps;
 
                 if (currentStep === totalSteps) {{
-                    // Prepare final data without pricing
+                    // Prepare final data for quote-submit
                     document.getElementById('final-property-type').value = quoteData.propertyType;
                     document.getElementById('final-sqft').value = quoteData.sqft;
                     document.getElementById('final-services').value = getSelectedServices().join(',');
                     document.getElementById('final-frequency').value = getSelectedFrequency();
+                    document.getElementById('final-bathrooms').value = document.getElementById('bathrooms').value;
                     document.getElementById('uploaded-photos').value = JSON.stringify(uploadedPhotos);
                 }}
             }}
@@ -1081,30 +1102,56 @@ def quote():
             const checked = document.querySelector('input[name="frequency"]:checked');
             return checked ? checked.value : 'bi-weekly';
         }}
-
-        // Simplified functions without pricing
-        function updateSqft(value) {{
-            document.getElementById('sqft-display').textContent = value + ' sq ft';
-            quoteData.sqft = parseInt(value);
-        }}
-
-        function selectPropertyType(type, rate) {{
-            document.querySelectorAll('.property-card').forEach(card => card.classList.remove('selected'));
-            event.currentTarget.classList.add('selected');
-            quoteData.propertyType = type;
-            quoteData.baseRate = rate;
-
-            document.getElementById('room-details').style.display = type === 'residential' ? 'block' : 'none';
-            setTimeout(() => nextStep(), 500);
-        }}
     </script>
 </body>
 </html>
     '''
 
+# Public pages are rendered once at startup and served precompressed
+index_page = PrerenderedPage(render_index())
+quote_page = PrerenderedPage(render_quote())
+
+@main_bp.route('/')
+def index():
+    return index_page.serve()
+
+@main_bp.route('/quote')
+def quote():
+    return quote_page.serve()
+
+def quote_from_form(values):
+    """Pricing input from quote wizard fields, with the same defaults as quote_submit.
+
+    Mileage comes from the ZIP; a missing or unknown ZIP travels free.
+    """
+    return pricing.quote_input(
+        property_type=values.get('property_type', 'commercial'),
+        sqft=float(values.get('sqft', 2000)),
+        frequency=values.get('frequency', 'monthly'),
+        services=values.get('services', ''),
+        bathrooms=int(values.get('bathrooms', 2)),
+        service_type='regular',
+        miles=geo.distance_miles(values.get('zip')) or 0
+    )
+
+@main_bp.route('/api/quote/price')
+def quote_price_api():
+    """Live price for the quote wizard (called debounced as the customer edits)"""
+    try:
+        quote = quote_from_form(request.args)
+    except ValueError:
+        return jsonify({'error': 'invalid quote details'}), 400
+    if not (0 <= quote.sqft <= 1000000 and 0 <= quote.bathrooms <= 100):
+        return jsonify({'error': 'invalid quote details'}), 400
+
+    breakdown = pricing.price_cached(quote)
+    response = jsonify({'total': round(breakdown.total_amount, 2), 'version': breakdown.rules_version})
+    response.headers['Cache-Control'] = 'public, max-age=60'
+    return response
+
 # Complete Flask Quote Route - Replace your existing /quote-submit route with this
 
-@app.route('/quote-submit', methods=['POST'])
+@main_bp.route('/quote-submit', methods=['POST'])
 def quote_submit():
     """Submit quote to Google Sheets matching exact Apps Script structure"""
     try:
@@ -1143,120 +1190,17 @@ def quote_submit():
             'floors': 1
         }]
 
-        # ==================== MATERIALS DATA STRUCTURE ====================
-        # Parse selected materials/supplies from the form
-        materials_data = []
-        if 'vacuum' in form_data['services']:
-            materials_data.append({
-                'id': 'MAT001',
-                'quantity': 1
-            })
-
-        # ==================== SERVICES DATA STRUCTURE ====================
-        # Parse selected services from the form
-        services_data = []
-        services_list = form_data['services'].split(',') if form_data['services'] else []
-
-        service_mapping = {
-            'vacuum': {'id': 'SRV001', 'name': 'Vacuum Service'},
-            'mop': {'id': 'SRV002', 'name': 'Mopping Service'},
-            'bathroom': {'id': 'SRV010', 'name': 'Restroom Deep Clean'},
-            'kitchen': {'id': 'SRV009', 'name': 'Kitchen Deep Clean'},
-            'windows': {'id': 'SRV002', 'name': 'Window Washing'},
-            'laundry': {'id': 'SRV008', 'name': 'Supply Restocking'}
-        }
+        # ==================== PRICING ====================
+        # Same input (and so the same price) as the wizard's /api/quote/price calls
+        quote = quote_from_form(request.form)
+        form_data['frequency'] = quote.frequency
+        services_list = list(quote.services)
+        materials_data, services_data = pricing.catalog_entries(quote)
+        breakdown = pricing.price(quote)
 
-        for service_key in services_list:
-            service_key = service_key.strip()
-            if service_key in service_mapping:
-                services_data.append({
-                    'id': service_mapping[service_key]['id'],
-                    'quantity': 1
-                })
-
-        # ==================== PRICING CALCULATIONS ====================
-        # Get base rate from property type
-        base_rates = {
-            'office': 0.05,
-            'medical': 0.08,
-            'retail': 0.04,
-            'restaurant': 0.06,
-            'warehouse': 0.03,
-            'school': 0.04,
-            'residential': 0.06,
-            'industrial': 0.035,
-            'gym': 0.045,
-            'bank': 0.055,
-            'church': 0.04,
-            'government': 0.065
-        }
-
-        # Service type multipliers
-        service_multipliers = {
-            'regular': 1.0,
-            'deep-clean': 2.0,
-            'post-construction': 2.5,
-            'move-in-out': 1.8,
-            'disinfection': 1.5,
-            'emergency': 3.0,
-            'one-time': 1.3
-        }
-
-        # Frequency discounts
-        frequency_discounts = {
-            'one-time': 0,
-            'daily': 0.25,
-            'weekly': 0.20,
-            'bi-weekly': 0.15,
-            'monthly': 0.10,
-            'quarterly': 0.05
-        }
-
-        # Calculate base pricing
-        base_rate = base_rates.get(form_data['property_type'], 0.05)
-        service_multiplier = service_multipliers.get('regular', 1.0)  # Default to regular
-        frequency_discount = frequency_discounts.get(form_data['frequency'], 0)
-
-        # Property base cost
-        property_cost = form_data['sqft'] * base_rate * service_multiplier
-        property_cost = property_cost * (1 - frequency_discount)
-
-        # Labor calculations
-        labor_hours = max(2, form_data['sqft'] / 3000)  # Estimate hours based on sqft
-        labor_rate = 25  # $25/hour default
-        labor_cost = labor_hours * labor_rate
-
-        # Material cost estimate
-        material_cost = form_data['sqft'] * 0.01  # $0.01 per sqft for supplies
-
-        # Service cost additions
-        service_cost = 0
-        if 'windows' in services_list:
-            service_cost += 30
-        if 'laundry' in services_list:
-            service_cost += 40
-        if 'bathroom' in services_list:
-            service_cost += form_data['bathrooms'] * 25
-        if 'kitchen' in services_list:
-            service_cost += 50
-
-        # Travel cost (if provided mileage)
-        travel_cost = 0  # Can be calculated if distance is known
-
-        # Calculate totals
-        base_cost = property_cost + labor_cost + material_cost + service_cost + travel_cost
-
-        # Apply minimum charge
-        minimum_charge = 75
-        base_cost = max(base_cost, minimum_charge)
-
-        # Profit and tax calculations
-        profit_margin = 35  # 35% default profit margin
-        profit_amount = base_cost * (profit_margin / 100)
-        subtotal = base_cost + profit_amount
-        tax_rate = 0.0625  # 6.25% MA sales tax
-        tax_amount = subtotal * tax_rate
-        total_amount = subtotal + tax_amount
+        internal_notes = f"Web quote from {form_data['property_type']} property - {form_data['sqft']} sqft - {form_data['frequency']} service"
+        if not geo.in_service_area(form_data['zip']):
+            internal_notes += f" - ZIP {form_data['zip'] or 'missing'} is outside the service area"
 
         # ==================== CREATE GOOGLE SHEETS ROW ====================
         # This MUST be exactly 37 columns in the exact order
@@ -1274,30 +1218,20 @@ def quote_submit():
             json.dumps(materials_data),                           # 11. Materials (JSON string)
             json.dumps(services_data),                            # 12. Services (JSON string)
             json.dumps([]),                                       # 13. Employees (empty array)
-            round(labor_hours, 2),                                # 14. Labor_Hours
-            round(labor_cost, 2),                                 # 15. Labor_Cost
-            round(material_cost, 2),                              # 16. Material_Cost
-            round(service_cost, 2),                               # 17. Service_Cost
-            round(travel_cost, 2),                                # 18. Travel_Cost
-            round(base_cost, 2),                                  # 19. Base_Cost
-            profit_margin,                                        # 20. Profit_Margin
-            round(profit_amount, 2),                              # 21. Profit_Amount
-            round(subtotal, 2),                                   # 22. Subtotal
-            round(tax_amount, 2),                                 # 23. Tax_Amount
-            round(total_amount, 2),                               # 24. Total_Amount
+            *breakdown.sheet_values(),                            # 14-24. Labor_Hours ... Total_Amount
             'pending',                                            # 25. Status (MUST be 'pending')
             (datetime.now() + timedelta(days=30)).isoformat(),   # 26. Valid_Until (30 days from now)
             form_data.get('additional_info', ''),                # 27. Notes (customer visible)
-            f"Web quote from {form_data['property_type']} property - {form_data['sqft']} sqft - {form_data['frequency']} service", # 28. Internal_Notes
+            internal_notes,                                       # 28. Internal_Notes
             'Web Form',                                           # 29. Created_By
             '',                                                    # 30. Assigned_To (empty for now)
             '',                                                    # 31. Follow_Up_Date (empty for now)
             '',                                                    # 32. Customer_ID (empty, will be assigned if converted)
             '',                                                    # 33. Converted_Date (empty until accepted)
             '',                                                    # 34. Decline_Reason (empty unless declined)
-            'regular',                                            # 35. Service_Type
+            quote.service_type,                                   # 35. Service_Type
             form_data['frequency'],                              # 36. Frequency
-            0                                                      # 37. Mileage
+            quote.miles                                            # 37. Mileage
         ]
 
         # ==================== SAVE TO GOOGLE SHEETS ====================
@@ -1316,6 +1250,9 @@ def quote_submit():
             flash('Quote submitted but there was an issue saving. Our team will contact you.', 'warning')
         else:
             print(f"Quote {quote_id} successfully saved to Google Sheets")
+            # Render the proposal in the background so the download link is instant
+            session['proposal_quote_id'] = quote_id
+            proposals.prefetch(result['quote'])
 
         # ==================== STORE SESSION DATA FOR CONFIRMATION ====================
         session['quote_result'] = {
@@ -1329,17 +1266,17 @@ def quote_submit():
             'frequency': form_data['frequency'],
             'city': form_data['city'],
             'address': form_data['address'],
-            'estimated_price': f"${round(total_amount, 2):,.2f}",
+            'estimated_price': f"${round(breakdown.total_amount, 2):,.2f}",
             'status': 'pending',
-            'base_cost': f"${round(base_cost, 2):,.2f}",
-            'profit': f"${round(profit_amount, 2):,.2f}",
-            'tax': f"${round(tax_amount, 2):,.2f}"
+            'base_cost': f"${round(breakdown.base_cost, 2):,.2f}",
+            'profit': f"${round(breakdown.profit_amount, 2):,.2f}",
+            'tax': f"${round(breakdown.tax_amount, 2):,.2f}"
         }
 
         # ==================== SEND NOTIFICATION EMAIL (OPTIONAL) ====================
         try:
             # You can add email notification here if needed
-            # Example: send_admin_notification(quote_id, form_data, total_amount)
+            # Example: send_admin_notification(quote_id, form_data, breakdown.total_amount)
             pass
         except Exception as e:
             print(f"Email notification failed: {e}")
@@ -1374,7 +1311,7 @@ def quote_submit():
 
 
 # ==================== HELPER FUNCTION FOR TESTING ====================
-@app.route('/test-quote-structure')
+@main_bp.route('/test-quote-structure')
 def test_quote_structure():
     """Test endpoint to verify the quote structure matches Google Sheets"""
     test_data = {
@@ -1449,7 +1386,21 @@ def test_quote_structure():
         'data': test_row
     })
 
-@app.route('/quote-result')
+@main_bp.route('/quote-result/proposal.<fmt>')
+def quote_result_proposal(fmt):
+    """The proposal of the quote this visitor just submitted"""
+    from routes.admin import proposal_response
+
+    quote_id = session.get('proposal_quote_id')
+    if fmt not in PROPOSAL_FORMATS or not quote_id:
+        return redirect('/quote')
+
+    quote = db.get_quote_by_id(quote_id)
+    if not quote:
+        return redirect('/quote')
+    return proposal_response(quote, fmt, download=fmt == 'pdf')
+
+@main_bp.route('/quote-result')
 def quote_result():
     result = session.get('quote_result')
     if not result:
@@ -1458,6 +1409,18 @@ def quote_result():
     # Clear the session data after displaying
     session.pop('quote_result', None)
 
+    proposal_links = ''
+    if session.get('proposal_quote_id') == result['quote_id']:
+        proposal_links = '''
+                <div class="grid grid-cols-2 gap-3">
+                    <a href="/quote-result/proposal.pdf" class="block bg-green-600 text-white py-3 rounded-lg font-bold hover:bg-green-700 transition">
+                        📄 Download Proposal (PDF)
+                    </a>
+                    <a href="/quote-result/proposal.html" target="_blank" class="block bg-white border border-green-600 text-green-700 py-3 rounded-lg font-bold hover:bg-green-50 transition">
+                        View Proposal
+                    </a>
+                </div>'''
+
     return f'''
 <!DOCTYPE html>
 <html lang="en">
@@ -1530,6 +1493,8 @@ def quote_result():
                     We'll contact you at <strong>{result['email']}</strong> and <strong>{result['phone']}</strong>
                 </p>
 
+                {proposal_links}
+
                 <a href="/" class="block w-full bg-gray-200 text-gray-700 py-3 rounded-lg hover:bg-gray-300 transition">
                     Return to Homepage
                 </a>
@@ -1551,7 +1516,7 @@ def quote_result():
         result=result
     )
 
-@app.route('/login')
+@main_bp.route('/login')
 def login():
     return f'''
 <!DOCTYPE html>
@@ -1602,13 +1567,14 @@ def login():
 </html>
     '''
 
-@app.route('/employee-login', methods=['GET', 'POST'])
+@main_bp.route('/employee-login', methods=['GET', 'POST'])
 def employee_login():
     if request.method == 'POST':
         username = request.form.get('username')
         password = request.form.get('password')
         employee = db.verify_employee(username, password)
         if employee:
+            regenerate_session()
             session['employee'] = employee
             session['user_type'] = 'employee'
             return redirect('/employee-dashboard')
@@ -1642,7 +1608,7 @@ def employee_login():
 </html>
     '''
 
-@app.route('/employee-dashboard')
+@main_bp.route('/employee-dashboard')
 def employee_dashboard():
     if 'employee' not in session or session.get('user_type') != 'employee':
         flash('Please log in to access the dashboard.', 'error')
@@ -1706,11 +1672,62 @@ def employee_dashboard():
 </html>
     '''
 
-@app.route('/logout')
+@main_bp.route('/logout')
 def logout():
     session.clear()
+    regenerate_session()
     return redirect('/')
 
+def create_app(config_class=Config, preload=None):
+    """Build the application.
+
+    Shared services (Sheets, Gemini, email) are created once per process
+    on first use. With preload (default: Config.PRELOAD_SERVICES) they are
+    built here instead, so a preforking server that loads the app before
+    forking builds them a single time; forked workers reconnect the Google
+    clients (see modules/services.py).
+    """
+    app = Flask(__name__)
+    app.config.from_object(config_class)
+
+    # Admin logins are the only permanent sessions; keep them to 4 hours
+    app.permanent_session_lifetime = timedelta(hours=4)
+
+    # Blueprints: the main site, admin panel, JSON API and the portals
+    from routes.admin import admin_bp
+    from routes.api import api_bp
+    from routes.customer import customer_bp
+    from routes.employee import employee_bp
+    from routes.public import public_bp
+
+    app.register_blueprint(main_bp)
+    app.register_blueprint(admin_bp)
+    app.register_blueprint(api_bp)
+    app.register_blueprint(customer_bp, url_prefix='/customer')
+    app.register_blueprint(employee_bp, url_prefix='/employee')
+    # The older template-based public pages; main_bp serves the site root
+    app.register_blueprint(public_bp, url_prefix='/public')
+
+    # Compress responses for clients that accept gzip/brotli
+    Compression(app)
+
+    # Keep session data on the server; the cookie carries only the session ID
+    ServerSideSessions(app)
+
+    if config_class.PRELOAD_SERVICES if preload is None else preload:
+        services.init_services()
+
+    return app
+
+def __getattr__(name):
+    """Build the module-level app on first access (`from app import app`,
+    gunicorn app:app), so importing create_app or a helper (run.py, the
+    scripts) does not build an extra app"""
+    if name == 'app':
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
+    create_app().run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
@@ -16,9 +16,27 @@ class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY', 'dev-key-change-in-production')
     FLASK_ENV = os.environ.get('FLASK_ENV', 'production')
     
-    # Session
+    # Production server (run.py): worker processes forked after the app is
+    # loaded, threads per worker, and seconds before a stuck worker is restarted
+    WEB_WORKERS = int(os.environ.get('WEB_WORKERS', 2))
+    WEB_THREADS = int(os.environ.get('WEB_THREADS', 4))
+    WEB_TIMEOUT = int(os.environ.get('WEB_TIMEOUT', 60))
+    
+    # Build the Sheets/Gemini/email clients when the app is created instead of
+    # on first use (run.py turns this on before forking its workers)
+    PRELOAD_SERVICES = os.environ.get('PRELOAD_SERVICES', '').lower() in ('1', 'true', 'yes')
+    
+    # Cold start budget (ms) for importing the app and serving the first
+    # request, checked by scripts/profile_startup.py
+    COLD_START_TARGET_MS = int(os.environ.get('COLD_START_TARGET_MS', 1000))
+    
+    # Session ('filesystem' or 'sqlite' keep session data server-side in
+    # SESSION_DB and the cookie holds only a session ID; 'cookie' stores it
+    # all in the signed cookie)
     PERMANENT_SESSION_LIFETIME = timedelta(hours=24)
-    SESSION_TYPE = 'filesystem'
+    SESSION_TYPE = os.environ.get('SESSION_TYPE', 'filesystem')
+    SESSION_DB = os.environ.get('SESSION_DB', 'sessions.db')
+    SESSION_STORE_MAX_ENTRIES = int(os.environ.get('SESSION_STORE_MAX_ENTRIES', 10000))
     
     # File uploads
     UPLOAD_FOLDER = 'static/uploads'
@@ -31,6 +49,42 @@ class Config:
     DRIVE_FOLDER_ID = os.environ.get('GOOGLE_DRIVE_FOLDER_ID')
     GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
     
+    # Archival of closed quotes and old activity log entries
+    ARCHIVE_DIR = os.environ.get('ARCHIVE_DIR', 'archive')
+    ARCHIVE_QUOTES_AFTER_DAYS = int(os.environ.get('ARCHIVE_QUOTES_AFTER_DAYS', 90))
+    ARCHIVE_LOG_AFTER_DAYS = int(os.environ.get('ARCHIVE_LOG_AFTER_DAYS', 30))
+    
+    # Compiled templates kept for the inline-string admin pages (0 disables)
+    TEMPLATE_CACHE_SIZE = int(os.environ.get('TEMPLATE_CACHE_SIZE', 64))
+    
+    # Cache lifetime (seconds) of the prerendered public pages
+    PUBLIC_PAGE_MAX_AGE = int(os.environ.get('PUBLIC_PAGE_MAX_AGE', 86400))
+    
+    # Shared per-sheet write counters behind the admin page ETags; pages are
+    # also revalidated every DATA_VERSION_MAX_AGE seconds to catch direct
+    # spreadsheet edits (0 disables the time limit)
+    DATA_VERSION_DB = os.environ.get('DATA_VERSION_DB', 'data_versions.db')
+    DATA_VERSION_MAX_AGE = int(os.environ.get('DATA_VERSION_MAX_AGE', 300))
+    
+    # Rendered dashboard widgets kept per process (0 disables)
+    FRAGMENT_CACHE_SIZE = int(os.environ.get('FRAGMENT_CACHE_SIZE', 128))
+    
+    # Response compression (gzip, plus brotli when the Brotli package is installed)
+    COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE', 500))
+    COMPRESS_GZIP_LEVEL = int(os.environ.get('COMPRESS_GZIP_LEVEL', 6))
+    COMPRESS_BROTLI_QUALITY = int(os.environ.get('COMPRESS_BROTLI_QUALITY', 5))
+    
+    # Live dashboard updates: shared event log, how long one event stream stays
+    # open before the browser reconnects, and the keepalive interval (seconds)
+    EVENTS_DB = os.environ.get('EVENTS_DB', 'events.db')
+    EVENT_STREAM_MAX_AGE = int(os.environ.get('EVENT_STREAM_MAX_AGE', 30))
+    EVENT_STREAM_KEEPALIVE = int(os.environ.get('EVENT_STREAM_KEEPALIVE', 10))
+    # Open event streams per worker process (each holds a request thread; 0 turns
+    # streaming off, e.g. on sync-worker hosts) and how often dashboards past the
+    # cap poll instead (seconds)
+    EVENT_STREAM_MAX_CONNECTIONS = int(os.environ.get('EVENT_STREAM_MAX_CONNECTIONS', 2))
+    EVENT_POLL_SECONDS = int(os.environ.get('EVENT_POLL_SECONDS', 15))
+    
     # Email Configuration
     EMAIL_HOST = os.environ.get('EMAIL_HOST', 'smtp.gmail.com')
     EMAIL_PORT = int(os.environ.get('EMAIL_PORT', 587))
@@ -47,31 +101,26 @@ class Config:
     BUSINESS_PHONE = os.environ.get('BUSINESS_PHONE', '(555) 123-4567')
     BUSINESS_EMAIL = os.environ.get('BUSINESS_EMAIL', 'info@cleanpro.com')
     
-    # Pricing Configuration (per square foot)
-    PRICING = {
-        'office': 0.08,
-        'retail': 0.10,
-        'medical': 0.12,
-        'restaurant': 0.10,
-        'residential': 0.15
-    }
-    
-    # Service Frequency Multipliers
-    FREQUENCY_MULTIPLIERS = {
-        'one_time': 1.5,
-        'weekly': 1.0,
-        'biweekly': 1.1,
-        'monthly': 1.2
-    }
-    
-    # Minimum charge
-    MINIMUM_CHARGE = 100.00
-    
-    # Service Areas
-    SERVICE_AREAS = [
-        'Boston', 'Cambridge', 'Quincy', 'Newton', 'Brookline',
-        'Somerville', 'Watertown', 'Waltham', 'Lexington', 'Arlington'
-    ]
+    # Pricing rate tables live in modules/pricing.py (DEFAULT_RATE_TABLES)
+    # Material and service prices are re-read from the Materials_Services sheet this often (seconds)
+    CATALOG_REFRESH_SECONDS = int(os.environ.get('CATALOG_REFRESH_SECONDS', 300))
+    
+    # Quote proposals: rendered HTML/PDF kept here, keyed by quote ID and content hash
+    PROPOSAL_CACHE_DIR = os.environ.get('PROPOSAL_CACHE_DIR', 'proposals')
+    # Render threads, renders allowed to wait for one, and how long a request waits (seconds)
+    PROPOSAL_WORKERS = int(os.environ.get('PROPOSAL_WORKERS', 2))
+    PROPOSAL_QUEUE_SIZE = int(os.environ.get('PROPOSAL_QUEUE_SIZE', 8))
+    PROPOSAL_RENDER_TIMEOUT = int(os.environ.get('PROPOSAL_RENDER_TIMEOUT', 20))
+    
+    # Quote follow-ups and expiry (scripts/run_followups.py): seconds between
+    # checks in --watch mode, and quotes written per batch update
+    FOLLOW_UP_INTERVAL_SECONDS = int(os.environ.get('FOLLOW_UP_INTERVAL_SECONDS', 60))
+    FOLLOW_UP_BATCH_SIZE = int(os.environ.get('FOLLOW_UP_BATCH_SIZE', 200))
+    
+    # Service area: ZIPs (data/zip_centroids.csv) within this many miles of the office ZIP.
+    # Quote mileage and travel cost are measured from the same ZIP.
+    SERVICE_ORIGIN_ZIP = os.environ.get('SERVICE_ORIGIN_ZIP', '02108')
+    SERVICE_RADIUS_MILES = float(os.environ.get('SERVICE_RADIUS_MILES', 12))
 
 class DevelopmentConfig(Config):
     """Development configuration"""
@@ -0,0 +1,105 @@
+"""
+Archive Storage Module
+Keeps cold sheet rows in local gzip-compressed monthly segment files
+"""
+
+import gzip
+import json
+import os
+from datetime import datetime
+
+
+class ArchiveStore:
+    def __init__(self, base_dir='archive'):
+        """Initialize archive storage rooted at base_dir"""
+        self.base_dir = base_dir
+
+    def _segment_path(self, sheet_name, month):
+        """Path of the segment file holding one sheet's rows for one month"""
+        return os.path.join(self.base_dir, sheet_name, f"{month}.jsonl.gz")
+
+    @staticmethod
+    def record_month(value):
+        """Return the YYYY-MM bucket for an ISO timestamp, or None if unparseable"""
+        try:
+            return datetime.fromisoformat(str(value)).strftime('%Y-%m')
+        except ValueError:
+            return None
+
+    def append(self, sheet_name, headers, rows, date_field):
+        """Append rows to the monthly segments of a sheet.
+
+        Each call adds a new gzip member to the segment files it touches, so
+        existing segments are never rewritten. Returns a list of
+        (path, previous_size) receipts that can be passed to rollback().
+        """
+        date_idx = headers.index(date_field)
+        by_month = {}
+        for row in rows:
+            month = self.record_month(row[date_idx] if date_idx < len(row) else '')
+            by_month.setdefault(month or 'undated', []).append(row)
+
+        receipts = []
+        try:
+            for month, month_rows in sorted(by_month.items()):
+                path = self._segment_path(sheet_name, month)
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                previous_size = os.path.getsize(path) if os.path.exists(path) else 0
+                receipts.append((path, previous_size))
+
+                with gzip.open(path, 'at', encoding='utf-8') as f:
+                    for row in month_rows:
+                        record = dict(zip(headers, row))
+                        f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        except Exception:
+            self.rollback(receipts)
+            raise
+
+        return receipts
+
+    def rollback(self, receipts):
+        """Undo an append() by truncating segments back to their previous size"""
+        for path, previous_size in receipts:
+            try:
+                if previous_size:
+                    with open(path, 'r+b') as f:
+                        f.truncate(previous_size)
+                elif os.path.exists(path):
+                    os.remove(path)
+            except Exception as e:
+                print(f"Error rolling back archive segment {path}: {e}")
+
+    def list_segments(self, sheet_name):
+        """List the months archived for a sheet, oldest first"""
+        sheet_dir = os.path.join(self.base_dir, sheet_name)
+        if not os.path.isdir(sheet_dir):
+            return []
+        return sorted(name[:-len('.jsonl.gz')] for name in os.listdir(sheet_dir)
+                      if name.endswith('.jsonl.gz'))
+
+    def iter_records(self, sheet_name, start=None, end=None):
+        """Yield archived records for a sheet, oldest segment first.
+
+        start and end are optional dates (or datetimes); only the segments
+        whose month overlaps the range are opened. Cells are stored as the
+        sheet's strings and numericised like get_all_records() does, so
+        archived and live records carry the same types.
+        """
+        first = start.strftime('%Y-%m') if start else None
+        last = end.strftime('%Y-%m') if end else None
+        from gspread.utils import numericise  # deferred: gspread is slow to import
+
+        for month in self.list_segments(sheet_name):
+            if month != 'undated':
+                if first and month < first:
+                    continue
+                if last and month > last:
+                    continue
+            elif first or last:
+                continue
+
+            with gzip.open(self._segment_path(sheet_name, month), 'rt', encoding='utf-8') as f:
+                for line in f:
+                    if line.strip():
+                        yield {key: numericise(value) if isinstance(value, str) else value
+                               for key, value in json.loads(line).items()}
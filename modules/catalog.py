@@ -0,0 +1,129 @@
+"""
+Catalog Module
+In-memory copy of the Materials_Services sheet keyed by item ID (MAT001,
+SRV001...), stamped with a version derived from its content. A background
+thread re-reads the sheet every CATALOG_REFRESH_SECONDS; when prices change
+the pricing engine is recompiled with them, so pricing a quote never reads
+the sheet.
+"""
+
+import hashlib
+import json
+import threading
+from collections import namedtuple
+from datetime import datetime
+from types import MappingProxyType
+
+from config import Config
+from modules import pricing
+
+CatalogItem = namedtuple('CatalogItem', [
+    'id', 'type', 'category', 'name', 'unit_type', 'cost', 'price', 'active'
+])
+
+# Active column values that mean the item is offered
+ACTIVE_VALUES = ('yes', 'true', '1', 'active')
+
+
+def _amount(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class Catalog:
+    def __init__(self, db=None, refresh_interval=Config.CATALOG_REFRESH_SECONDS, base_rules=None):
+        """Catalog read from db (a SheetsDatabase, or a callable returning one).
+
+        Catalog prices are applied on top of base_rules (default: the rules
+        in effect now), so an item that is deactivated falls back to them.
+        """
+        self._db = db
+        self.refresh_interval = refresh_interval
+        self.base_rules = base_rules or pricing.get_rules()
+        self.items = MappingProxyType({})
+        self.version = None
+        self.loaded_at = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def get(self, item_id):
+        """The CatalogItem with this ID, or None"""
+        return self.items.get(item_id)
+
+    def price(self, item_id, default=None):
+        item = self.items.get(item_id)
+        return item.price if item is not None else default
+
+    def cost(self, item_id, default=None):
+        item = self.items.get(item_id)
+        return item.cost if item is not None else default
+
+    def active_prices(self):
+        """{ID: (price, unit_type)} of the items currently offered"""
+        return {item.id: (item.price, item.unit_type) for item in self.items.values() if item.active}
+
+    def refresh(self):
+        """Re-read the sheet; swap in the new catalog and pricing rules if it changed.
+
+        Returns True when the catalog changed.
+        """
+        db = self._db() if callable(self._db) else self._db
+        records = db.get_records('Materials_Services')
+
+        items = {}
+        for record in records:
+            item_id = str(record.get('ID', '')).strip()
+            if not item_id:
+                continue
+            items[item_id] = CatalogItem(
+                item_id,
+                str(record.get('Type', '')),
+                str(record.get('Category', '')),
+                str(record.get('Name', '')),
+                str(record.get('Unit_Type', '')).strip().lower(),
+                _amount(record.get('Cost')),
+                _amount(record.get('Price')),
+                str(record.get('Active', '')).strip().lower() in ACTIVE_VALUES
+            )
+
+        canonical = json.dumps(sorted(items.values()), separators=(',', ':'))
+        version = hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:12]
+
+        with self._lock:
+            self.loaded_at = datetime.now()
+            if version == self.version:
+                return False
+            self.items = MappingProxyType(items)
+            self.version = version
+            pricing.set_rules(self.base_rules.with_catalog(self.active_prices()))
+        return True
+
+    # ==================== BACKGROUND REFRESH ====================
+
+    def start(self):
+        """Refresh now and then every refresh_interval seconds, in a daemon thread"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='catalog-refresh', daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def reconnect(self):
+        """After a fork the refresh thread is gone; start a new one in the child"""
+        self._lock = threading.Lock()
+        self._thread = None
+        self.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Error refreshing catalog: {e}")
+            self._stop.wait(self.refresh_interval)
@@ -0,0 +1,99 @@
+"""
+Data Version Module
+Per-sheet write counters shared by every worker process through a small
+SQLite file. SheetsDatabase bumps a sheet's counter on each write, so pages
+built from that sheet can tell whether anything changed without reading it.
+"""
+
+import os
+import sqlite3
+import threading
+import uuid
+from collections import Counter
+
+
+class DataVersions:
+    def __init__(self, path='data_versions.db'):
+        """Counters stored in the SQLite file at path.
+
+        With path=None the counters live in this process only, which is
+        enough for scripts and benchmarks that own their data.
+        """
+        self.path = path
+        self._local = threading.local()
+        self._memory = Counter()
+        self._memory_epoch = uuid.uuid4().hex[:8]
+        self._lock = threading.Lock()
+
+    def _connection(self):
+        """One connection per thread and process (connections must not cross a fork)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute('CREATE TABLE IF NOT EXISTS versions (sheet TEXT PRIMARY KEY, version INTEGER NOT NULL)')
+        conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)')
+        # A fresh file gets a new epoch, so restarted counters never repeat old versions
+        conn.execute('INSERT OR IGNORE INTO meta VALUES (?, ?)', ('epoch', uuid.uuid4().hex[:8]))
+        conn.commit()
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def bump(self, *sheets):
+        """Record a write to one or more sheets"""
+        if self.path is None:
+            with self._lock:
+                for sheet in sheets:
+                    self._memory[sheet] += 1
+            return
+
+        try:
+            conn = self._connection()
+            with conn:
+                conn.executemany(
+                    'INSERT INTO versions VALUES (?, 1) '
+                    'ON CONFLICT(sheet) DO UPDATE SET version = version + 1',
+                    [(sheet,) for sheet in sheets])
+        except Exception as e:
+            print(f"Error bumping data version for {sheets}: {e}")
+
+    def get(self, *sheets):
+        """Current {sheet: version} for the given sheets (all sheets if none given).
+
+        Returns None when the counters cannot be read.
+        """
+        if self.path is None:
+            with self._lock:
+                return {s: self._memory[s] for s in sheets} if sheets else dict(self._memory)
+
+        try:
+            rows = self._connection().execute('SELECT sheet, version FROM versions').fetchall()
+        except Exception as e:
+            print(f"Error reading data versions: {e}")
+            return None
+        versions = dict(rows)
+        return {s: versions.get(s, 0) for s in sheets} if sheets else versions
+
+    def epoch(self):
+        if self.path is None:
+            return self._memory_epoch
+        try:
+            row = self._connection().execute("SELECT value FROM meta WHERE key = 'epoch'").fetchone()
+            return row[0] if row else ''
+        except Exception as e:
+            print(f"Error reading data version epoch: {e}")
+            return None
+
+    def token(self, *sheets):
+        """Compact string that changes whenever any of the sheets is written.
+
+        Returns None when the counters cannot be read, so callers never
+        treat unknown data as unchanged.
+        """
+        versions = self.get(*sheets)
+        epoch = self.epoch()
+        if versions is None or not epoch:
+            return None
+        return epoch + ':' + ','.join(f"{s}={versions[s]}" for s in sorted(versions))
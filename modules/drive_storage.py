@@ -3,25 +3,29 @@ Google Drive Storage Module
 Handles file uploads and storage in Google Drive
 """
 
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
-from googleapiclient.http import MediaFileUpload
 import os
 import tempfile
 
 class DriveStorage:
     def __init__(self, credentials_file='credentials.json', folder_id=None):
         """Initialize Google Drive connection"""
+        # Imported here so loading this module does not pull in the Google API client
+        from google.oauth2.service_account import Credentials
         
         scope = ['https://www.googleapis.com/auth/drive.file']
         self.creds = Credentials.from_service_account_file(credentials_file, scopes=scope)
-        self.service = build('drive', 'v3', credentials=self.creds)
+        self.reconnect()
         self.folder_id = folder_id
         
         # Create folder if not specified
         if not self.folder_id:
             self.folder_id = self._create_folder('Cleaning_Business_Files')
     
+    def reconnect(self):
+        """(Re)build the Drive client (forked worker processes must not share its connections)"""
+        from googleapiclient.discovery import build
+        self.service = build('drive', 'v3', credentials=self.creds)
+    
     def _create_folder(self, folder_name):
         """Create a folder in Google Drive"""
         file_metadata = {
@@ -52,6 +56,7 @@ class DriveStorage:
             'parents': [self.folder_id] if self.folder_id else []
         }
         
+        from googleapiclient.http import MediaFileUpload
         media = MediaFileUpload(file_path, resumable=True)
         
         file = self.service.files().create(
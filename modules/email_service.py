@@ -4,6 +4,7 @@ Handles email notifications for quotes, appointments, etc.
 """
 
 import smtplib
+from email.mime.application import MIMEApplication
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
@@ -22,25 +23,33 @@ class EmailService:
         self.business_name = Config.BUSINESS_NAME
         self.business_phone = Config.BUSINESS_PHONE
     
-    def send_email(self, to_email, subject, html_body, text_body=None):
-        """Send email with HTML and text content"""
+    def send_email(self, to_email, subject, html_body, text_body=None, attachments=None):
+        """Send email with HTML and text content, plus (filename, bytes, mime type) attachments"""
         if not self.username or not self.password:
             print("Email not configured")
             return False
         
         try:
-            msg = MIMEMultipart('alternative')
+            msg = MIMEMultipart('mixed' if attachments else 'alternative')
             msg['Subject'] = subject
             msg['From'] = f"{self.business_name} <{self.from_email}>"
             msg['To'] = to_email
+            body = MIMEMultipart('alternative') if attachments else msg
             
             # Add text and HTML parts
             if text_body:
                 part1 = MIMEText(text_body, 'plain')
-                msg.attach(part1)
+                body.attach(part1)
             
             part2 = MIMEText(html_body, 'html')
-            msg.attach(part2)
+            body.attach(part2)
+            
+            if attachments:
+                msg.attach(body)
+                for filename, content, mime_type in attachments:
+                    part = MIMEApplication(content, _subtype=mime_type.split('/')[-1])
+                    part.add_header('Content-Disposition', 'attachment', filename=filename)
+                    msg.attach(part)
             
             # Send email
             with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
@@ -107,6 +116,64 @@ class EmailService:
         
         self.send_email(self.from_email, admin_subject, admin_html)
     
+    def send_follow_up_reminders(self, quotes):
+        """Send the office one digest of quotes (Quotes row dicts) due for a follow-up"""
+        
+        rows = ''.join(f"""
+                    <tr>
+                        <td style="padding: 6px;">{quote.get('ID')}</td>
+                        <td style="padding: 6px;">{quote.get('Customer_Name', '')}</td>
+                        <td style="padding: 6px;">{quote.get('Customer_Phone', '')}</td>
+                        <td style="padding: 6px;">{quote.get('Status', '')}</td>
+                        <td style="padding: 6px; text-align: right;">${float(quote.get('Total_Amount') or 0):,.2f}</td>
+                    </tr>""" for quote in quotes)
+        
+        subject = f"{len(quotes)} Quote Follow-Up{'s' if len(quotes) != 1 else ''} Due"
+        html = f"""
+        <html>
+            <body style="font-family: Arial, sans-serif;">
+                <h2>Quote Follow-Ups Due</h2>
+                <table style="border-collapse: collapse;">
+                    <tr style="background: #f5f5f5;">
+                        <th style="padding: 6px;">Quote</th><th style="padding: 6px;">Customer</th>
+                        <th style="padding: 6px;">Phone</th><th style="padding: 6px;">Status</th>
+                        <th style="padding: 6px;">Total</th>
+                    </tr>{rows}
+                </table>
+                <p><strong>Time:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
+            </body>
+        </html>
+        """
+        
+        return self.send_email(self.from_email, subject, html)
+    
+    def send_proposal(self, quote, pdf_content):
+        """Send a quote's proposal (a Quotes row dict) to the customer with the PDF attached"""
+        
+        subject = f"Your Cleaning Proposal {quote.get('ID')} - {self.business_name}"
+        html = f"""
+        <html>
+            <body style="font-family: Arial, sans-serif; padding: 20px;">
+                <h2>Your Cleaning Proposal</h2>
+                <p>Dear {quote.get('Customer_Name', '')},</p>
+                <p>Thank you for your interest in {self.business_name}. Your proposal is attached.</p>
+                
+                <div style="background: #f5f5f5; padding: 15px; border-radius: 5px; margin: 20px 0;">
+                    <p><strong>Quote ID:</strong> {quote.get('ID')}</p>
+                    <p><strong>Total per visit:</strong> ${float(quote.get('Total_Amount') or 0):,.2f}</p>
+                </div>
+                
+                <p>If you have any questions, please call us at {self.business_phone}.</p>
+                
+                <p>Best regards,<br>
+                {self.business_name} Team</p>
+            </body>
+        </html>
+        """
+        
+        attachment = (f"proposal-{quote.get('ID')}.pdf", pdf_content, 'application/pdf')
+        return self.send_email(quote.get('Customer_Email'), subject, html, attachments=[attachment])
+    
     def send_appointment_confirmation(self, customer_email, customer_name, 
                                     date, time, address, employee):
         """Send appointment confirmation to customer"""
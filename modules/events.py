@@ -0,0 +1,122 @@
+"""
+Events Module
+Small append-only log of data changes (quote created, updated or status
+changed, job checked in, job completed) shared by every worker process
+through a SQLite file. SheetsDatabase publishes to it from its write paths
+and the admin live-update stream tails it, so open dashboards get deltas
+instead of polling the sheets.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+# Event types published by SheetsDatabase
+EVENT_TYPES = ('quote_created', 'quote_updated', 'quote_status_changed', 'job_checked_in',
+               'job_completed')
+
+
+class EventLog:
+    def __init__(self, path='events.db', keep=1000):
+        """Events stored in the SQLite file at path, keeping the newest `keep`.
+
+        With path=None events only reach subscribers in this process, which
+        is enough for scripts and benchmarks that own their data.
+        """
+        self.path = path
+        self.keep = keep
+        self._local = threading.local()
+        self._memory = deque(maxlen=keep)
+        self._memory_id = 0
+        self._published = 0
+        self._changed = threading.Condition()
+
+    def _connection(self):
+        """One connection per thread and process (connections must not cross a fork)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute('CREATE TABLE IF NOT EXISTS events ('
+                     'id INTEGER PRIMARY KEY AUTOINCREMENT, type TEXT NOT NULL, '
+                     'data TEXT NOT NULL, created TEXT NOT NULL)')
+        conn.commit()
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def publish(self, event_type, data):
+        """Append an event and wake up local subscribers. Returns its id, or None"""
+        created = datetime.now().isoformat(timespec='seconds')
+        if self.path is None:
+            with self._changed:
+                self._memory_id += 1
+                event_id = self._memory_id
+                self._memory.append({'id': event_id, 'type': event_type,
+                                     'data': data, 'created': created})
+                self._changed.notify_all()
+            return event_id
+
+        try:
+            conn = self._connection()
+            with conn:
+                cursor = conn.execute('INSERT INTO events (type, data, created) VALUES (?, ?, ?)',
+                                      (event_type, json.dumps(data, default=str), created))
+                event_id = cursor.lastrowid
+                self._published += 1
+                if self._published % 100 == 0:
+                    conn.execute('DELETE FROM events WHERE id <= ?', (event_id - self.keep,))
+        except Exception as e:
+            print(f"Error publishing {event_type} event: {e}")
+            return None
+
+        with self._changed:
+            self._changed.notify_all()
+        return event_id
+
+    def since(self, last_id, limit=100):
+        """Events newer than last_id, oldest first"""
+        if self.path is None:
+            with self._changed:
+                return [e for e in self._memory if e['id'] > last_id][:limit]
+
+        try:
+            rows = self._connection().execute(
+                'SELECT id, type, data, created FROM events WHERE id > ? ORDER BY id LIMIT ?',
+                (last_id, limit)).fetchall()
+        except Exception as e:
+            print(f"Error reading events: {e}")
+            return []
+        return [{'id': r[0], 'type': r[1], 'data': json.loads(r[2]), 'created': r[3]}
+                for r in rows]
+
+    def latest_id(self):
+        """Id of the newest event (0 if there is none)"""
+        if self.path is None:
+            return self._memory_id
+        try:
+            row = self._connection().execute('SELECT MAX(id) FROM events').fetchone()
+            return row[0] or 0
+        except Exception as e:
+            print(f"Error reading latest event id: {e}")
+            return 0
+
+    def wait(self, last_id, timeout):
+        """Block until there are events newer than last_id or timeout seconds pass.
+
+        Events published in this process wake the caller at once; events
+        from other worker processes are picked up by polling once a second.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            events = self.since(last_id)
+            remaining = deadline - time.monotonic()
+            if events or remaining <= 0:
+                return events
+            with self._changed:
+                self._changed.wait(min(remaining, 1.0))
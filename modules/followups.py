@@ -0,0 +1,231 @@
+"""
+Follow-Ups Module
+Acts on the Quotes sheet's Follow_Up_Date and Valid_Until columns. Due
+dates are kept in a min-heap, built from one streaming read of the sheet
+and then kept current from the event log (every quote write publishes an
+event), so a run only pops what is due: open quotes whose follow-up date
+arrived get a reminder, and pending quotes past Valid_Until are expired,
+each batch in one read and one write.
+"""
+
+import heapq
+from datetime import datetime, timedelta
+
+from config import Config
+
+# Quotes still waiting on the customer
+OPEN_QUOTE_STATUSES = ('pending', 'contacted')
+
+FOLLOW_UP = 'follow_up'
+EXPIRY = 'expiry'
+
+# Events read per event-log query while catching up
+EVENT_PAGE_SIZE = 500
+
+
+def due_at(value, end_of_day=False):
+    """datetime a Follow_Up_Date / Valid_Until cell comes due, or None.
+
+    A bare date is due at the start of that day, or once it is over with
+    end_of_day (a quote valid until the 5th expires on the 6th).
+    """
+    value = str(value or '').strip()
+    if not value:
+        return None
+    try:
+        due = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if end_of_day and len(value) <= 10:
+        due += timedelta(days=1)
+    return due
+
+
+def _is_due(due, now):
+    return due is not None and due <= now
+
+
+class FollowUpScheduler:
+    def __init__(self, db):
+        """Scheduler over db (a SheetsDatabase); call load() or run_due() to build it"""
+        self.db = db
+        self._heap = []   # (due, kind, quote ID); entries no longer in _due are skipped
+        self._due = {}    # (kind, quote ID) -> due
+        self._last_event_id = None
+
+    def __len__(self):
+        return len(self._due)
+
+    def load(self):
+        """Rebuild the heap from one pass over the Quotes sheet"""
+        self._last_event_id = self.db.events.latest_id()
+        self._heap = []
+        self._due = {}
+        for quote in self.db.iter_records('Quotes'):
+            self.schedule(quote, push=False)
+        self._heap = [(due, kind, quote_id) for (kind, quote_id), due in self._due.items()]
+        heapq.heapify(self._heap)
+        return len(self._due)
+
+    def schedule(self, quote, push=True):
+        """(Re)schedule a quote from its row; closed quotes are dropped"""
+        quote_id = str(quote.get('ID', ''))
+        status = quote.get('Status', '')
+        follow_up = due_at(quote.get('Follow_Up_Date')) if status in OPEN_QUOTE_STATUSES else None
+        expiry = due_at(quote.get('Valid_Until'), end_of_day=True) if status == 'pending' else None
+        self._set(FOLLOW_UP, quote_id, follow_up, push)
+        self._set(EXPIRY, quote_id, expiry, push)
+
+    def unschedule(self, quote_id):
+        self._due.pop((FOLLOW_UP, quote_id), None)
+        self._due.pop((EXPIRY, quote_id), None)
+
+    def _set(self, kind, quote_id, due, push=True):
+        key = (kind, quote_id)
+        if due is None:
+            self._due.pop(key, None)
+        elif self._due.get(key) != due:
+            self._due[key] = due
+            if push:
+                heapq.heappush(self._heap, (due, kind, quote_id))
+                if len(self._heap) > 2 * len(self._due) + 64:
+                    # Mostly superseded entries: rebuild from the live schedule
+                    self._heap = [(d, k, q) for (k, q), d in self._due.items()]
+                    heapq.heapify(self._heap)
+
+    def sync(self):
+        """Apply quote writes published since the last sync (or load)"""
+        if self._last_event_id is None:
+            return self.load()
+
+        applied = 0
+        while True:
+            events = self.db.events.since(self._last_event_id, EVENT_PAGE_SIZE)
+            if events and events[0]['id'] > self._last_event_id + 1 and self._last_event_id:
+                # Older events were trimmed from the log before we read them
+                return self.load()
+            for event in events:
+                self._last_event_id = event['id']
+                self._apply(event['type'], event['data'])
+                applied += 1
+            if len(events) < EVENT_PAGE_SIZE:
+                return applied
+
+    def _apply(self, event_type, data):
+        if event_type in ('quote_created', 'quote_updated'):
+            self.schedule(data)
+        elif event_type == 'quote_status_changed':
+            quote_id = str(data.get('ID', ''))
+            if data.get('Status') not in OPEN_QUOTE_STATUSES:
+                self.unschedule(quote_id)
+            elif data.get('Previous_Status') not in OPEN_QUOTE_STATUSES:
+                # Re-opened: the event has no dates, read them from the row
+                _, quote = self.db.find_row('Quotes', quote_id)
+                if quote:
+                    self.schedule(quote)
+
+    def pop_due(self, now=None, limit=None):
+        """[(kind, quote ID)] due by now, earliest first, removed from the schedule"""
+        now = now or datetime.now()
+        due = []
+        while self._heap and self._heap[0][0] <= now and (limit is None or len(due) < limit):
+            when, kind, quote_id = heapq.heappop(self._heap)
+            if self._due.get((kind, quote_id)) != when:
+                continue  # rescheduled or dropped since it was pushed
+            del self._due[(kind, quote_id)]
+            due.append((kind, quote_id))
+        return due
+
+    def peek_due(self, now=None):
+        """[(due, kind, quote ID)] due by now, without removing them"""
+        now = now or datetime.now()
+        return sorted((due, kind, quote_id) for (kind, quote_id), due in self._due.items()
+                      if due <= now)
+
+    def next_due(self):
+        """The earliest pending due datetime, or None"""
+        while self._heap and self._due.get(self._heap[0][1:]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    # ==================== RUNNING ====================
+
+    def run_due(self, now=None, batch_size=Config.FOLLOW_UP_BATCH_SIZE, email_service=None):
+        """Expire and remind everything due by now, batch_size quotes per write.
+
+        Expired quotes get Status 'expired'. Follow-ups are sent to the
+        office as one digest per batch, and only once the digest is sent is
+        their Follow_Up_Date cleared, so each date reminds once (set a new
+        date to be reminded again). When the email fails, or no
+        email_service is given, the dates stay and the quotes are put back
+        in the schedule for the next run. Each quote is re-checked against
+        its current row, so a quote converted meanwhile is left alone.
+        """
+        now = now or datetime.now()
+        self.sync()
+        result = {'success': True, 'expired': [], 'reminded': [], 'skipped': [], 'failed': [],
+                  'emailed': 0}
+
+        def follow_up_due(quote):
+            return (quote.get('Status') in OPEN_QUOTE_STATUSES
+                    and _is_due(due_at(quote.get('Follow_Up_Date')), now))
+
+        while True:
+            due = self.pop_due(now, batch_size)
+            if not due:
+                break
+            expiring = [quote_id for kind, quote_id in due if kind == EXPIRY]
+            following = [quote_id for kind, quote_id in due if kind == FOLLOW_UP]
+
+            if expiring:
+                update = self.db.update_quotes(
+                    {quote_id: {'Status': 'expired'} for quote_id in expiring},
+                    condition=lambda q: (q.get('Status') == 'pending'
+                                         and _is_due(due_at(q.get('Valid_Until'), end_of_day=True), now)),
+                    action='Quotes Expired')
+                if not self._record(update, 'expired', result):
+                    break
+
+            if following:
+                # Send first, clear after: a date is only used up by a reminder that went out
+                current = self.db.find_rows('Quotes', following)
+                reminding = [quote for _, quote in current.values() if follow_up_due(quote)]
+                reminding_ids = {quote['ID'] for quote in reminding}
+                result['skipped'].extend(quote_id for quote_id in following if quote_id not in reminding_ids)
+                if not reminding:
+                    continue
+                if email_service is None or not email_service.send_follow_up_reminders(reminding):
+                    result['failed'].extend(quote['ID'] for quote in reminding)
+                    continue
+                result['emailed'] += len(reminding)
+                update = self.db.update_quotes(
+                    {quote['ID']: {'Follow_Up_Date': ''} for quote in reminding},
+                    condition=follow_up_due,
+                    action='Follow-Up Reminders')
+                if not self._record(update, 'reminded', result):
+                    break
+
+        if result['failed'] and result['success']:
+            result['success'] = False
+            result['error'] = f"Follow-up email not sent for {len(result['failed'])} quotes; will retry"
+
+        # Quotes skipped because their row changed outside the app, and
+        # reminders whose email failed: schedule them from what the sheet
+        # says now (failed ones still have their Follow_Up_Date)
+        if result['skipped'] or result['failed']:
+            for _, quote in self.db.find_rows('Quotes', result['skipped'] + result['failed']).values():
+                self.schedule(quote)
+
+        # Our own writes come back as events; apply them now
+        self.sync()
+        return result
+
+    def _record(self, update, key, result):
+        if not update.get('success'):
+            result['success'] = False
+            result['error'] = update.get('error')
+            self._last_event_id = None  # popped entries were not written; rebuild next run
+            return False
+        result[key].extend(update['updated'])
+        result['skipped'].extend(update['skipped'])
+        return True
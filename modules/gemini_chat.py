@@ -1,4 +1,3 @@
-import google.generativeai as genai
 import os
 from dotenv import load_dotenv
 
@@ -12,6 +11,8 @@ class GeminiChat:
         
         if self.api_key:
             try:
+                # Imported on first use: the SDK takes most of a second to load
+                import google.generativeai as genai
                 genai.configure(api_key=self.api_key)
                 self.model = genai.GenerativeModel('gemini-pro')
                 self.initialized = True
@@ -0,0 +1,119 @@
+"""
+Geo Module
+ZIP code centroids for the service region (data/zip_centroids.csv, one
+approximate point per ZIP), loaded once into memory. Distances are
+straight-line (haversine) miles between centroids, memoized per ZIP pair;
+the distance from the office ZIP gives a quote its Mileage (priced by the
+pricing engine's per-mile travel rate) and decides whether a ZIP is inside
+the service area.
+"""
+
+import csv
+import math
+import os
+import threading
+from collections import namedtuple
+
+from config import Config
+
+CENTROIDS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                              'data', 'zip_centroids.csv')
+
+EARTH_RADIUS_MILES = 3958.8
+
+ZipCentroid = namedtuple('ZipCentroid', ['zip', 'city', 'state', 'lat', 'lon'])
+
+
+def normalize_zip(value):
+    """'02101', '02101-1234' and 2101 (the sheet drops leading zeros) -> '02101'; '' if not a ZIP"""
+    value = str(value if value is not None else '').strip().split('-')[0]
+    if value.endswith('.0'):
+        value = value[:-2]
+    if not value.isdigit() or len(value) > 5:
+        return ''
+    return value.zfill(5)
+
+def haversine_miles(lat1, lon1, lat2, lon2):
+    """Great-circle distance in miles between two points in degrees"""
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = (math.sin((lat2 - lat1) / 2) ** 2
+         + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2)
+    return 2 * EARTH_RADIUS_MILES * math.asin(math.sqrt(a))
+
+
+class ZipTable:
+    """In-memory ZIP centroids with memoized distances from an origin ZIP"""
+
+    def __init__(self, path=CENTROIDS_FILE, origin_zip=None, radius_miles=None):
+        self.origin_zip = normalize_zip(origin_zip or Config.SERVICE_ORIGIN_ZIP)
+        self.radius_miles = Config.SERVICE_RADIUS_MILES if radius_miles is None else radius_miles
+        self.centroids = {}
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                zip_code = normalize_zip(row['Zip'])
+                self.centroids[zip_code] = ZipCentroid(zip_code, row['City'], row['State'],
+                                                       float(row['Latitude']), float(row['Longitude']))
+        if self.origin_zip not in self.centroids:
+            raise ValueError(f"Service origin ZIP {self.origin_zip!r} is not in {path}")
+        # (zip, zip) -> miles; bounded by the table size since only known ZIPs are kept
+        self._distances = {}
+
+    def __len__(self):
+        return len(self.centroids)
+
+    def __contains__(self, zip_code):
+        return normalize_zip(zip_code) in self.centroids
+
+    def get(self, zip_code):
+        return self.centroids.get(normalize_zip(zip_code))
+
+    def distance_between(self, zip_a, zip_b):
+        """Miles between two ZIP centroids, rounded to 0.1, or None if either is unknown"""
+        key = tuple(sorted((normalize_zip(zip_a), normalize_zip(zip_b))))
+        miles = self._distances.get(key)
+        if miles is None:
+            a, b = self.centroids.get(key[0]), self.centroids.get(key[1])
+            if a is None or b is None:
+                return None
+            miles = self._distances[key] = round(haversine_miles(a.lat, a.lon, b.lat, b.lon), 1)
+        return miles
+
+    def distance_miles(self, zip_code):
+        """Miles from the office ZIP, or None for a ZIP outside the table"""
+        return self.distance_between(self.origin_zip, zip_code)
+
+    def in_service_area(self, zip_code):
+        miles = self.distance_miles(zip_code)
+        return miles is not None and miles <= self.radius_miles
+
+    def service_area_cities(self):
+        """Names of the cities with a ZIP inside the service area, nearest first"""
+        nearest = {}
+        for zip_code, centroid in self.centroids.items():
+            miles = self.distance_miles(zip_code)
+            if miles <= self.radius_miles and miles < nearest.get(centroid.city, float('inf')):
+                nearest[centroid.city] = miles
+        return sorted(nearest, key=lambda city: (nearest[city], city))
+
+
+_table = None
+_table_lock = threading.Lock()
+
+def get_table():
+    """The ZIP table for the configured office and radius, loaded on first use"""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                _table = ZipTable()
+    return _table
+
+def distance_miles(zip_code):
+    """Miles from the office to a ZIP, or None if the ZIP is not in the table"""
+    return get_table().distance_miles(zip_code)
+
+def in_service_area(zip_code):
+    return get_table().in_service_area(zip_code)
+
+def service_area_cities():
+    return get_table().service_area_cities()
@@ -0,0 +1,320 @@
+"""
+Offline Sheets Module
+In-memory stand-in for a gspread Spreadsheet, used for local development,
+synthetic datasets and benchmarks. Worksheets can be saved to and loaded
+from a SQLite file (one table per sheet) or a directory of CSV files.
+"""
+
+import csv
+import os
+import re
+import sqlite3
+import time
+from collections import Counter
+
+
+class WorksheetNotFound(Exception):
+    """Raised when a worksheet title does not exist"""
+
+
+def _numericise(value):
+    """Convert a cell string to int/float the way gspread's get_all_records does"""
+    if value == '' or '_' in value or value[0] not in '0123456789+-.':
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+def _column_number(letters):
+    """Convert column letters (A, AK...) to a 1-based column number"""
+    number = 0
+    for char in letters.upper():
+        number = number * 26 + ord(char) - ord('A') + 1
+    return number
+
+
+def _parse_range(range_name):
+    """Parse A1 notation into (first_row, first_col, last_row, last_col).
+
+    Missing bounds come back as None, so '2:1001' is (2, None, 1001, None)
+    and 'A2' is (2, 1, 2, 1).
+    """
+    def parse_cell(cell):
+        match = re.fullmatch(r'([A-Za-z]*)(\d*)', cell)
+        letters, digits = match.groups()
+        return (int(digits) if digits else None,
+                _column_number(letters) if letters else None)
+
+    range_name = range_name.split('!')[-1]
+    if ':' in range_name:
+        first, last = range_name.split(':')
+    else:
+        first = last = range_name
+    first_row, first_col = parse_cell(first)
+    last_row, last_col = parse_cell(last)
+    return first_row, first_col, last_row, last_col
+
+
+class OfflineWorksheet:
+    def __init__(self, spreadsheet, title, sheet_id, rows=1000, cols=26):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.id = sheet_id
+        self.row_count = rows
+        self.col_count = cols
+        self.values = []
+
+    def _call(self, name):
+        """Count an API call and apply the simulated latency"""
+        self.spreadsheet.record_call(name)
+
+    def _set_cell(self, row, col, value):
+        while len(self.values) < row:
+            self.values.append([])
+        cells = self.values[row - 1]
+        while len(cells) < col:
+            cells.append('')
+        cells[col - 1] = '' if value is None else str(value)
+        self.row_count = max(self.row_count, row)
+        self.col_count = max(self.col_count, col)
+
+    def _last_row(self):
+        """Number of the last non-empty row"""
+        last = len(self.values)
+        while last and not any(self.values[last - 1]):
+            last -= 1
+        return last
+
+    def _trimmed(self):
+        """Values without trailing empty rows, like the Sheets API returns them"""
+        return self.values[:self._last_row()]
+
+    # ---- reads ----
+
+    def get_all_values(self):
+        self._call('get_all_values')
+        return [list(row) for row in self._trimmed()]
+
+    def get_all_records(self, head=1, default_blank=''):
+        self._call('get_all_records')
+        values = self._trimmed()
+        if len(values) < head:
+            return []
+        headers = values[head - 1]
+        records = []
+        for row in values[head:]:
+            row = row + [''] * (len(headers) - len(row))
+            records.append({h: _numericise(v) if v != '' else default_blank
+                            for h, v in zip(headers, row)})
+        return records
+
+    def row_values(self, row):
+        self._call('row_values')
+        return list(self.values[row - 1]) if row <= len(self.values) else []
+
+    def col_values(self, col):
+        self._call('col_values')
+        return [row[col - 1] if col <= len(row) else '' for row in self._trimmed()]
+
+    def get(self, range_name):
+        self._call('get')
+        return self._read_range(range_name)
+
+    def batch_get(self, ranges, **kwargs):
+        self._call('batch_get')
+        return [self._read_range(range_name) for range_name in ranges]
+
+    def _read_range(self, range_name):
+        first_row, first_col, last_row, last_col = _parse_range(range_name)
+        first_row = first_row or 1
+        last_row = last_row or len(self.values)
+        rows = []
+        for row in self.values[first_row - 1:last_row]:
+            start = (first_col or 1) - 1
+            rows.append(list(row[start:last_col] if last_col else row[start:]))
+        while rows and not any(rows[-1]):
+            rows.pop()
+        return rows
+
+    # ---- writes ----
+
+    def append_row(self, values, **kwargs):
+        self._call('append_row')
+        self._append([values])
+
+    def append_rows(self, values, **kwargs):
+        self._call('append_rows')
+        self._append(values)
+
+    def _append(self, rows):
+        del self.values[self._last_row():]
+        for row in rows:
+            self.values.append(['' if v is None else str(v) for v in row])
+        self.row_count = max(self.row_count, len(self.values))
+
+    def update_cell(self, row, col, value):
+        self._call('update_cell')
+        self._set_cell(row, col, value)
+
+    def update(self, range_name, values=None, **kwargs):
+        self._call('update')
+        self._write_range(range_name, values)
+
+    def batch_update(self, data, **kwargs):
+        self._call('batch_update')
+        for item in data:
+            self._write_range(item['range'], item['values'])
+
+    def _write_range(self, range_name, values):
+        first_row, first_col, _, _ = _parse_range(range_name)
+        for r, row in enumerate(values):
+            for c, value in enumerate(row):
+                self._set_cell((first_row or 1) + r, (first_col or 1) + c, value)
+
+    def delete_rows(self, start_index, end_index=None):
+        self._call('delete_rows')
+        del self.values[start_index - 1:end_index or start_index]
+        self.row_count -= (end_index or start_index) - start_index + 1
+
+    def resize(self, rows=None, cols=None):
+        self._call('resize')
+        if rows is not None:
+            del self.values[rows:]
+            self.row_count = rows
+        if cols is not None:
+            self.col_count = cols
+
+    def clear(self):
+        self._call('clear')
+        self.values = []
+
+    def format(self, *args, **kwargs):
+        self._call('format')
+
+
+class OfflineSpreadsheet:
+    def __init__(self, title='Offline Database', latency=0.0):
+        """Create an empty offline spreadsheet.
+
+        latency adds a sleep (in seconds) to every simulated API call.
+        """
+        self.title = title
+        self.latency = latency
+        self.api_calls = Counter()
+        self._sheets = {}
+
+    def record_call(self, name):
+        """Count one simulated API call"""
+        self.api_calls[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def worksheet(self, title):
+        self.record_call('worksheet')
+        if title not in self._sheets:
+            raise WorksheetNotFound(title)
+        return self._sheets[title]
+
+    def worksheets(self):
+        return list(self._sheets.values())
+
+    def add_worksheet(self, title, rows=1000, cols=26):
+        self.record_call('add_worksheet')
+        sheet = OfflineWorksheet(self, title, len(self._sheets), rows, cols)
+        self._sheets[title] = sheet
+        return sheet
+
+    def del_worksheet(self, worksheet):
+        self.record_call('del_worksheet')
+        self._sheets.pop(worksheet.title, None)
+
+    def fetch_sheet_metadata(self, params=None):
+        """Sheet properties in the shape the Sheets API returns them"""
+        self.record_call('fetch_sheet_metadata')
+        return {'properties': {'title': self.title},
+                'sheets': [{'properties': {'sheetId': sheet.id, 'title': sheet.title,
+                                           'gridProperties': {'rowCount': sheet.row_count,
+                                                              'columnCount': sheet.col_count}}}
+                           for sheet in self._sheets.values()]}
+
+    def batch_update(self, body):
+        """Apply spreadsheet-level requests (only row deletions are supported)"""
+        self.record_call('batch_update')
+        sheets_by_id = {sheet.id: sheet for sheet in self._sheets.values()}
+        for item in body.get('requests', []):
+            rng = item['deleteDimension']['range']
+            sheet = sheets_by_id[rng['sheetId']]
+            del sheet.values[rng['startIndex']:rng['endIndex']]
+            sheet.row_count -= rng['endIndex'] - rng['startIndex']
+
+    # ---- persistence ----
+
+    def save_sqlite(self, path):
+        """Write every worksheet to a SQLite file, one table per sheet"""
+        conn = sqlite3.connect(path)
+        try:
+            for sheet in self._sheets.values():
+                values = sheet._trimmed()
+                headers = values[0] if values else []
+                write_sqlite_table(conn, sheet.title, headers, values[1:])
+            conn.commit()
+        finally:
+            conn.close()
+
+    @classmethod
+    def load_sqlite(cls, path, **kwargs):
+        """Load a spreadsheet saved with save_sqlite (or written by the dataset generator)"""
+        spreadsheet = cls(title=os.path.basename(path), **kwargs)
+        conn = sqlite3.connect(path)
+        try:
+            tables = [r[0] for r in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' ORDER BY rowid")]
+            for table in tables:
+                cursor = conn.execute(f'SELECT * FROM "{table}" ORDER BY rowid')
+                headers = [d[0] for d in cursor.description]
+                sheet = OfflineWorksheet(spreadsheet, table, len(spreadsheet._sheets))
+                sheet.values = [headers] + [['' if v is None else str(v) for v in row]
+                                            for row in cursor]
+                sheet.row_count = len(sheet.values)
+                sheet.col_count = len(headers)
+                spreadsheet._sheets[table] = sheet
+        finally:
+            conn.close()
+        return spreadsheet
+
+    def save_csv(self, directory):
+        """Write every worksheet to <directory>/<title>.csv"""
+        os.makedirs(directory, exist_ok=True)
+        for sheet in self._sheets.values():
+            with open(os.path.join(directory, f"{sheet.title}.csv"), 'w', newline='',
+                      encoding='utf-8') as f:
+                csv.writer(f).writerows(sheet._trimmed())
+
+    @classmethod
+    def load_csv(cls, directory, **kwargs):
+        """Load every <title>.csv file in a directory as a worksheet"""
+        spreadsheet = cls(title=os.path.basename(os.path.normpath(directory)), **kwargs)
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith('.csv'):
+                continue
+            with open(os.path.join(directory, name), newline='', encoding='utf-8') as f:
+                sheet = OfflineWorksheet(spreadsheet, name[:-len('.csv')], len(spreadsheet._sheets))
+                sheet.values = [row for row in csv.reader(f)]
+                sheet.row_count = len(sheet.values)
+                spreadsheet._sheets[sheet.title] = sheet
+        return spreadsheet
+
+
+def write_sqlite_table(conn, table, headers, rows):
+    """(Re)create a table with one TEXT column per header and insert rows"""
+    columns = ', '.join(f'"{h}" TEXT' for h in headers)
+    placeholders = ', '.join('?' for _ in headers)
+    conn.execute(f'DROP TABLE IF EXISTS "{table}"')
+    conn.execute(f'CREATE TABLE "{table}" ({columns})')
+    conn.executemany(f'INSERT INTO "{table}" VALUES ({placeholders})',
+                     ((row + [''] * len(headers))[:len(headers)] for row in rows))
@@ -0,0 +1,457 @@
+"""
+Pricing Engine
+The single place quotes are priced. The rate tables are compiled once into
+an immutable, versioned PricingRules object, and price(quote_input)
+returns the full breakdown stored in the Quotes sheet (Labor_Hours ...
+Total_Amount). The web quote form, the public blueprint, customer booking,
+admin quote edits and the data scripts all price through here.
+"""
+
+import hashlib
+import json
+import math
+import threading
+from collections import namedtuple
+from functools import lru_cache
+from types import MappingProxyType
+
+# Rate tables of the web quote form (the Google Apps Script pricing)
+DEFAULT_RATE_TABLES = {
+    # $ per square foot by property type
+    'property_rates': {
+        'office': 0.05,
+        'medical': 0.08,
+        'retail': 0.04,
+        'restaurant': 0.06,
+        'warehouse': 0.03,
+        'school': 0.04,
+        'residential': 0.06,
+        'industrial': 0.035,
+        'gym': 0.045,
+        'bank': 0.055,
+        'church': 0.04,
+        'government': 0.065
+    },
+    'default_property_rate': 0.05,
+
+    # Multiplier on the property cost by service type
+    'service_multipliers': {
+        'regular': 1.0,
+        'deep-clean': 2.0,
+        'post-construction': 2.5,
+        'move-in-out': 1.8,
+        'disinfection': 1.5,
+        'emergency': 3.0,
+        'one-time': 1.3
+    },
+
+    # Discount on the property cost by visit frequency
+    'frequency_discounts': {
+        'one-time': 0,
+        'daily': 0.25,
+        'weekly': 0.20,
+        'bi-weekly': 0.15,
+        'monthly': 0.10,
+        'quarterly': 0.05
+    },
+
+    # Flat add-ons per visit, and add-ons charged per bathroom
+    'service_add_ons': {'windows': 30, 'laundry': 40, 'kitchen': 50},
+    'per_bathroom_add_ons': {'bathroom': 25},
+
+    'labor_rate': 25,            # $ per labor hour
+    'min_labor_hours': 2,
+    'sqft_per_labor_hour': 3000,
+    'material_rate': 0.01,       # supplies, $ per square foot
+    'travel_rate': 1.5,          # $ per mile from the office past the free miles
+    'free_travel_miles': 5,
+    'minimum_charge': 75,        # floor for the base cost
+    'profit_margin': 35,         # percent of the base cost
+    'tax_rate': 0.0625           # MA sales tax
+}
+
+# Form service keys -> Materials_Services catalog IDs
+SERVICE_IDS = {
+    'vacuum': 'SRV001',
+    'mop': 'SRV002',
+    'windows': 'SRV003',
+    'laundry': 'SRV008',
+    'kitchen': 'SRV009',
+    'bathroom': 'SRV010'
+}
+
+# Services that also use catalog materials
+SERVICE_MATERIALS = {'vacuum': 'MAT001'}
+
+# Catalog item priced per square foot on every quote (general supplies)
+SUPPLIES_ID = 'MAT001'
+
+# Catalog unit types charged once per bathroom instead of once per visit
+PER_BATHROOM_UNITS = ('restroom', 'bathroom')
+
+# Distinct (input, rules) results kept by price_cached
+PRICE_CACHE_SIZE = 4096
+
+# Frequency spellings used around the app -> the rate table's spelling
+FREQUENCY_ALIASES = {'biweekly': 'bi-weekly', 'onetime': 'one-time', 'once': 'one-time'}
+
+# Quotes sheet pricing columns, in sheet order, and the breakdown field behind each
+SHEET_PRICING_FIELDS = (
+    ('Labor_Hours', 'labor_hours'),
+    ('Labor_Cost', 'labor_cost'),
+    ('Material_Cost', 'material_cost'),
+    ('Service_Cost', 'service_cost'),
+    ('Travel_Cost', 'travel_cost'),
+    ('Base_Cost', 'base_cost'),
+    ('Profit_Margin', 'profit_margin'),
+    ('Profit_Amount', 'profit_amount'),
+    ('Subtotal', 'subtotal'),
+    ('Tax_Amount', 'tax_amount'),
+    ('Total_Amount', 'total_amount')
+)
+
+QuoteInput = namedtuple('QuoteInput', [
+    'property_type', 'sqft', 'frequency', 'services', 'bathrooms', 'service_type', 'miles'
+])
+
+
+class Breakdown(namedtuple('Breakdown', [
+        'property_cost', 'labor_hours', 'labor_cost', 'material_cost', 'service_cost',
+        'travel_cost', 'base_cost', 'profit_margin', 'profit_amount', 'subtotal',
+        'tax_amount', 'total_amount', 'rules_version'])):
+    """Unrounded price breakdown of one quote"""
+
+    __slots__ = ()
+
+    def sheet_fields(self):
+        """{Quotes column: rounded value} for the pricing columns.
+
+        Batch breakdowns hold NumPy arrays, rounded with ndarray.round (which
+        can differ from round() by a cent on exact half-cent values).
+        """
+        def rounded(value):
+            return value.round(2) if hasattr(value, 'round') else round(value, 2)
+        return {column: self.profit_margin if field == 'profit_margin' else rounded(getattr(self, field))
+                for column, field in SHEET_PRICING_FIELDS}
+
+    def sheet_values(self):
+        """The pricing columns as a list in sheet order (Labor_Hours ... Total_Amount)"""
+        return list(self.sheet_fields().values())
+
+
+def normalize_frequency(frequency):
+    """'Bi_Weekly', 'biweekly' and 'bi-weekly' all become 'bi-weekly'"""
+    value = str(frequency or '').strip().lower().replace('_', '-').replace(' ', '-')
+    return FREQUENCY_ALIASES.get(value, value)
+
+def parse_services(services):
+    """Comma-separated string or iterable of service keys -> sorted tuple of unique keys"""
+    if isinstance(services, str):
+        services = services.split(',')
+    return tuple(sorted({str(s).strip().lower() for s in services or () if str(s).strip()}))
+
+def quote_input(property_type='office', sqft=0, frequency='one-time', services=(),
+                bathrooms=0, service_type='regular', miles=0):
+    """Build a normalized QuoteInput (equal inputs compare and hash equal).
+
+    miles is the distance from the office (modules/geo.py), kept to 0.1 mile
+    as the Quotes sheet's Mileage column stores it.
+    """
+    return QuoteInput(
+        str(property_type or '').strip().lower(),
+        float(sqft or 0),
+        normalize_frequency(frequency),
+        parse_services(services),
+        int(bathrooms or 0),
+        str(service_type or 'regular').strip().lower().replace('_', '-'),
+        round(float(miles or 0), 1)
+    )
+
+def catalog_entries(quote):
+    """(materials, services) JSON lists for the Quotes sheet Materials/Services columns"""
+    materials = [{'id': SERVICE_MATERIALS[s], 'quantity': 1}
+                 for s in quote.services if s in SERVICE_MATERIALS]
+    services = [{'id': SERVICE_IDS[s], 'quantity': 1} for s in quote.services if s in SERVICE_IDS]
+    return materials, services
+
+def quote_input_from_record(record, rules=None):
+    """Rebuild the QuoteInput of a Quotes sheet row (dict keyed by column)"""
+    def parse(value):
+        try:
+            parsed = json.loads(value) if isinstance(value, str) else value
+        except ValueError:
+            return []
+        return parsed if isinstance(parsed, list) else []
+
+    properties = parse(record.get('Properties')) or [{}]
+    prop = properties[0] if isinstance(properties[0], dict) else {}
+    ids = [entry.get('id') for entry in parse(record.get('Services')) if isinstance(entry, dict)]
+    keys_by_id = {service_id: key for key, service_id in SERVICE_IDS.items()}
+    services = [keys_by_id[i] for i in ids if i in keys_by_id and i != 'SRV002']
+
+    # Rows written before windows had its own ID list both mop and windows as
+    # SRV002; two entries mean both, one entry is told apart by Service_Cost
+    legacy = ids.count('SRV002')
+    if legacy:
+        services.append('mop')
+    if legacy > 1:
+        services.append('windows')
+    elif legacy == 1 and 'windows' not in services:
+        rules = rules or get_rules()
+        windows = rules.service_add_ons.get('windows', 0)
+        guess = quote_input(services=services, bathrooms=prop.get('restrooms') or 0)
+        explained = rules.price(guess).service_cost
+        try:
+            if windows and abs(float(record.get('Service_Cost') or 0) - explained - windows) < 0.01:
+                services[-1] = 'windows'
+        except (TypeError, ValueError):
+            pass
+
+    return quote_input(
+        property_type=prop.get('facilityType') or prop.get('type') or '',
+        sqft=prop.get('squareFeet') or prop.get('sqft') or 0,
+        frequency=record.get('Frequency') or 'one-time',
+        services=services,
+        bathrooms=prop.get('restrooms') or 0,
+        service_type=record.get('Service_Type') or 'regular',
+        miles=record.get('Mileage') or 0
+    )
+
+def _freeze(value):
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    return value
+
+def _thaw(value):
+    if isinstance(value, MappingProxyType):
+        return {k: _thaw(v) for k, v in value.items()}
+    return value
+
+# Rate table entries, each exposed as a PricingRules attribute
+TABLE_FIELDS = tuple(DEFAULT_RATE_TABLES)
+
+
+class PricingRules:
+    """Compiled, read-only rate tables with a version derived from their content"""
+
+    __slots__ = ('tables', 'version') + TABLE_FIELDS
+
+    def __init__(self, tables):
+        tables = json.loads(json.dumps(tables))  # private deep copy
+        missing = [name for name in TABLE_FIELDS if name not in tables]
+        if missing:
+            raise ValueError(f"Missing rate tables: {', '.join(missing)}")
+        for name in TABLE_FIELDS:
+            object.__setattr__(self, name, _freeze(tables[name]))
+        object.__setattr__(self, 'tables', _freeze(tables))
+        canonical = json.dumps(tables, sort_keys=True, separators=(',', ':'))
+        object.__setattr__(self, 'version', hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:12])
+
+    def __setattr__(self, name, value):
+        raise AttributeError('PricingRules are immutable; compile new rules instead')
+
+    def __repr__(self):
+        return f"<PricingRules {self.version}>"
+
+    @classmethod
+    def compile(cls, tables=None, **overrides):
+        """Compile rate tables (default: DEFAULT_RATE_TABLES) with optional top-level overrides"""
+        merged = dict(DEFAULT_RATE_TABLES if tables is None else tables)
+        merged.update(overrides)
+        return cls(merged)
+
+    def to_dict(self):
+        """Plain-dict copy of the rate tables (to edit and compile again)"""
+        return _thaw(self.tables)
+
+    @property
+    def property_types(self):
+        return tuple(self.property_rates)
+
+    @property
+    def frequencies(self):
+        return tuple(self.frequency_discounts)
+
+    @property
+    def service_types(self):
+        return tuple(self.service_multipliers)
+
+    def price(self, quote):
+        """Price a QuoteInput (or a dict of quote_input arguments) -> Breakdown"""
+        if not isinstance(quote, QuoteInput):
+            quote = quote_input(**quote)
+        sqft = quote.sqft
+
+        # Property cost, discounted by frequency
+        base_rate = self.property_rates.get(quote.property_type, self.default_property_rate)
+        service_multiplier = self.service_multipliers.get(quote.service_type, 1.0)
+        property_cost = sqft * base_rate * service_multiplier
+        property_cost = property_cost * (1 - self.frequency_discounts.get(quote.frequency, 0))
+
+        labor_hours = max(self.min_labor_hours, sqft / self.sqft_per_labor_hour)
+        labor_cost = labor_hours * self.labor_rate
+        material_cost = sqft * self.material_rate
+
+        service_cost = 0
+        for service in quote.services:
+            if service in self.service_add_ons:
+                service_cost += self.service_add_ons[service]
+            if service in self.per_bathroom_add_ons:
+                service_cost += quote.bathrooms * self.per_bathroom_add_ons[service]
+
+        travel_cost = max(0, quote.miles - self.free_travel_miles) * self.travel_rate
+
+        base_cost = property_cost + labor_cost + material_cost + service_cost + travel_cost
+        base_cost = max(base_cost, self.minimum_charge)
+
+        profit_amount = base_cost * (self.profit_margin / 100)
+        subtotal = base_cost + profit_amount
+        tax_amount = subtotal * self.tax_rate
+        total_amount = subtotal + tax_amount
+
+        return Breakdown(property_cost, labor_hours, labor_cost, material_cost, service_cost,
+                         travel_cost, base_cost, self.profit_margin, profit_amount, subtotal,
+                         tax_amount, total_amount, self.version)
+
+    def price_batch(self, columns):
+        """Price many quotes at once from columnar inputs -> Breakdown of NumPy arrays.
+
+        columns maps quote_input argument names to equal-length sequences
+        (property_type, sqft, frequency, services, bathrooms, service_type, miles;
+        missing columns take quote_input's defaults). Each element of the
+        result equals price() of the same row, computed with vectorized
+        float64 operations in the same order.
+        """
+        import numpy as np
+
+        sqft = np.asarray(columns['sqft'], dtype=np.float64)
+        count = len(sqft)
+        bathrooms = np.asarray(columns.get('bathrooms', np.zeros(count)), dtype=np.float64)
+        miles = np.asarray(columns.get('miles', np.zeros(count)), dtype=np.float64)
+
+        def lookup(name, missing, normalize, table, default):
+            values = columns.get(name)
+            if values is None:
+                return np.full(count, table.get(normalize(missing), default), dtype=np.float64)
+            # Normalize and look up each distinct value once, then gather
+            codes = {}
+            index = np.fromiter((codes.setdefault(v, len(codes)) for v in values),
+                                dtype=np.intp, count=count)
+            rates = np.array([table.get(normalize(v), default) for v in codes], dtype=np.float64)
+            return rates[index]
+
+        base_rate = lookup('property_type', 'office', lambda v: str(v or '').strip().lower(),
+                           self.property_rates, self.default_property_rate)
+        service_multiplier = lookup('service_type', 'regular',
+                                    lambda v: str(v or 'regular').strip().lower().replace('_', '-'),
+                                    self.service_multipliers, 1.0)
+        discount = lookup('frequency', 'one-time', normalize_frequency, self.frequency_discounts, 0)
+
+        # Services: flat add-ons plus per-bathroom add-ons, per distinct service list
+        flat = np.zeros(count)
+        per_bathroom = np.zeros(count)
+        if columns.get('services') is not None:
+            cache = {}
+            for i, value in enumerate(columns['services']):
+                key = value if isinstance(value, str) else tuple(value or ())
+                amounts = cache.get(key)
+                if amounts is None:
+                    selected = parse_services(value)
+                    amounts = cache[key] = (
+                        sum(self.service_add_ons.get(s, 0) for s in selected),
+                        sum(self.per_bathroom_add_ons.get(s, 0) for s in selected))
+                flat[i], per_bathroom[i] = amounts
+
+        property_cost = sqft * base_rate * service_multiplier
+        property_cost = property_cost * (1 - discount)
+
+        labor_hours = np.maximum(self.min_labor_hours, sqft / self.sqft_per_labor_hour)
+        labor_cost = labor_hours * self.labor_rate
+        material_cost = sqft * self.material_rate
+        service_cost = flat + bathrooms * per_bathroom
+        travel_cost = np.maximum(0, miles - self.free_travel_miles) * self.travel_rate
+
+        base_cost = property_cost + labor_cost + material_cost + service_cost + travel_cost
+        base_cost = np.maximum(base_cost, self.minimum_charge)
+
+        profit_amount = base_cost * (self.profit_margin / 100)
+        subtotal = base_cost + profit_amount
+        tax_amount = subtotal * self.tax_rate
+        total_amount = subtotal + tax_amount
+
+        return Breakdown(property_cost, labor_hours, labor_cost, material_cost, service_cost,
+                         travel_cost, base_cost, np.full(count, self.profit_margin), profit_amount,
+                         subtotal, tax_amount, total_amount, self.version)
+
+    def with_catalog(self, prices):
+        """Rules with material and service rates taken from catalog prices.
+
+        prices maps catalog IDs to (price, unit_type) for active items; items
+        missing from it keep this object's rates.
+        """
+        tables = self.to_dict()
+        if SUPPLIES_ID in prices:
+            tables['material_rate'] = prices[SUPPLIES_ID][0]
+        for service, item_id in SERVICE_IDS.items():
+            if item_id not in prices:
+                continue
+            price, unit_type = prices[item_id]
+            tables['service_add_ons'].pop(service, None)
+            tables['per_bathroom_add_ons'].pop(service, None)
+            table = 'per_bathroom_add_ons' if unit_type in PER_BATHROOM_UNITS else 'service_add_ons'
+            tables[table][service] = price
+        return PricingRules(tables)
+
+    def with_total(self, breakdown, total_amount):
+        """The breakdown re-balanced to a negotiated total: costs stay, profit absorbs the change"""
+        if not math.isfinite(total_amount) or total_amount <= 0:
+            raise ValueError(f"Total must be a positive amount, not {total_amount}")
+        subtotal = total_amount / (1 + self.tax_rate)
+        profit_amount = subtotal - breakdown.base_cost
+        profit_margin = round(profit_amount / breakdown.base_cost * 100, 2) if breakdown.base_cost else 0
+        return breakdown._replace(profit_margin=profit_margin, profit_amount=profit_amount,
+                                  subtotal=subtotal, tax_amount=total_amount - subtotal,
+                                  total_amount=total_amount)
+
+
+_rules = PricingRules.compile()
+_rules_lock = threading.Lock()
+
+def get_rules():
+    """The pricing rules currently in effect"""
+    return _rules
+
+def set_rules(rules):
+    """Swap in newly compiled rules (one reference swap; readers never see a mix)"""
+    global _rules
+    with _rules_lock:
+        _rules = rules
+    return rules
+
+def price(quote, rules=None):
+    """Price a quote with the current (or given) rules -> Breakdown"""
+    return (rules or _rules).price(quote)
+
+@lru_cache(maxsize=PRICE_CACHE_SIZE)
+def _price_cached(quote, rules):
+    return rules.price(quote)
+
+def price_cached(quote, rules=None):
+    """price() memoized on the normalized QuoteInput and the rules in effect.
+
+    Rules are part of the key, so results priced under replaced rules are
+    never returned (they just age out of the LRU).
+    """
+    return _price_cached(quote, rules or _rules)
+
+def price_batch(columns, rules=None):
+    """Price columnar quote inputs with the current (or given) rules -> Breakdown of arrays"""
+    return (rules or _rules).price_batch(columns)
+
+def columns_from_records(records, rules=None):
+    """Columnar pricing inputs (for price_batch) from Quotes sheet rows"""
+    columns = {field: [] for field in QuoteInput._fields}
+    for record in records:
+        for field, value in zip(QuoteInput._fields, quote_input_from_record(record, rules)):
+            columns[field].append(value)
+    return columns
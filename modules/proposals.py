@@ -0,0 +1,327 @@
+"""
+Proposals Module
+Customer-facing HTML and PDF proposals rendered from a stored Quotes row.
+Rendering runs on a small bounded worker pool instead of the request
+threads, and each output is kept on disk under the quote ID and a hash of everything it shows: downloading
+or re-sending an unchanged quote never renders it again, and editing the
+quote changes the hash so the next request renders the new version.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from jinja2 import Environment
+
+from config import Config
+from modules import pricing
+from utils import pdf
+
+PROPOSAL_FORMATS = {'html': 'text/html', 'pdf': 'application/pdf'}
+
+# Bump when the layout changes, so cached proposals are rendered again
+TEMPLATE_VERSION = 1
+HASH_LENGTH = 16
+
+SERVICE_LABELS = {
+    'vacuum': 'Vacuuming',
+    'mop': 'Mopping',
+    'windows': 'Window Cleaning',
+    'laundry': 'Laundry',
+    'kitchen': 'Kitchen Deep Clean',
+    'bathroom': 'Bathroom Sanitization'
+}
+
+PROPOSAL_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <title>Proposal {{ p.quote_id }} - {{ p.business_name }}</title>
+    <style>
+        body { font-family: Arial, sans-serif; color: #1f2937; max-width: 720px; margin: 40px auto; padding: 0 20px; }
+        h1 { margin: 0; color: #047857; }
+        .muted { color: #6b7280; font-size: 14px; }
+        .box { background: #f3f4f6; border-radius: 8px; padding: 16px; margin: 20px 0; }
+        table { width: 100%; border-collapse: collapse; }
+        td { padding: 6px 0; }
+        td.amount { text-align: right; }
+        tr.total td { border-top: 2px solid #047857; font-weight: bold; font-size: 18px; padding-top: 10px; }
+    </style>
+</head>
+<body>
+    <h1>{{ p.business_name }}</h1>
+    <div class="muted">{{ p.business_phone }} &middot; {{ p.business_email }}</div>
+
+    <h2>Cleaning Proposal {{ p.quote_id }}</h2>
+    <div class="muted">Issued {{ p.date_created }}{% if p.valid_until %} &middot; Valid until {{ p.valid_until }}{% endif %}</div>
+
+    <div class="box">
+        <strong>Prepared for</strong><br>
+        {{ p.customer_name }}<br>
+        {% if p.address %}{{ p.address }}<br>{% endif %}
+        {% if p.email %}{{ p.email }}{% endif %}{% if p.phone %} &middot; {{ p.phone }}{% endif %}
+    </div>
+
+    <h3>Property</h3>
+    <table>
+        <tr><td>Property type</td><td class="amount">{{ p.property_type }}</td></tr>
+        <tr><td>Square feet</td><td class="amount">{{ p.square_feet }}</td></tr>
+        <tr><td>Bathrooms</td><td class="amount">{{ p.bathrooms }}</td></tr>
+        <tr><td>Service</td><td class="amount">{{ p.service_type }}</td></tr>
+        <tr><td>Frequency</td><td class="amount">{{ p.frequency }}</td></tr>
+    </table>
+
+    <h3>Included services</h3>
+    <ul>
+        {% for service in p.services %}<li>{{ service }}</li>{% else %}<li>Standard cleaning</li>{% endfor %}
+    </ul>
+
+    <h3>Price per visit</h3>
+    <table>
+        <tr><td>Subtotal</td><td class="amount">{{ p.subtotal }}</td></tr>
+        <tr><td>Tax</td><td class="amount">{{ p.tax }}</td></tr>
+        <tr class="total"><td>Total</td><td class="amount">{{ p.total }}</td></tr>
+    </table>
+
+    {% if p.notes %}<h3>Notes</h3><p>{{ p.notes }}</p>{% endif %}
+
+    <p class="muted">Questions? Call {{ p.business_phone }} quoting {{ p.quote_id }}.</p>
+</body>
+</html>
+"""
+
+_environment = Environment(autoescape=True)
+_template = None
+
+
+class ProposalBusy(Exception):
+    """Every render slot is taken; the caller should retry shortly"""
+
+
+def _money(value):
+    try:
+        return f"${float(value):,.2f}"
+    except (TypeError, ValueError):
+        return '$0.00'
+
+def _date(value):
+    try:
+        return datetime.fromisoformat(str(value)).strftime('%B %d, %Y')
+    except ValueError:
+        return str(value or '')
+
+def proposal_context(quote):
+    """Everything a proposal shows, as strings, from a Quotes row dict"""
+    quote_input = pricing.quote_input_from_record(quote)
+    zip_code = str(quote.get('Customer_Zip') or '')
+    if zip_code.isdigit():
+        zip_code = zip_code.zfill(5)  # the sheet reads 02101 back as the number 2101
+    address = ', '.join(str(part) for part in (
+        quote.get('Customer_Address'), quote.get('Customer_City'),
+        ' '.join(str(p) for p in (quote.get('Customer_State'), zip_code) if p)
+    ) if part)
+    return {
+        'business_name': Config.BUSINESS_NAME,
+        'business_phone': Config.BUSINESS_PHONE,
+        'business_email': Config.BUSINESS_EMAIL,
+        'quote_id': str(quote.get('ID', '')),
+        'date_created': _date(quote.get('Date_Created')),
+        'valid_until': _date(quote.get('Valid_Until')),
+        'customer_name': str(quote.get('Customer_Name', '')),
+        'email': str(quote.get('Customer_Email', '')),
+        'phone': str(quote.get('Customer_Phone', '')),
+        'address': address,
+        'property_type': quote_input.property_type.title(),
+        'square_feet': f"{quote_input.sqft:,.0f}",
+        'bathrooms': str(quote_input.bathrooms),
+        'service_type': quote_input.service_type.replace('-', ' ').title(),
+        'frequency': quote_input.frequency.replace('-', ' ').title(),
+        'services': [SERVICE_LABELS.get(s, s.title()) for s in quote_input.services],
+        'subtotal': _money(quote.get('Subtotal')),
+        'tax': _money(quote.get('Tax_Amount')),
+        'total': _money(quote.get('Total_Amount')),
+        'notes': str(quote.get('Notes', '') or '')
+    }
+
+def content_hash(context):
+    """Short hash of a proposal's content and layout version"""
+    canonical = json.dumps([TEMPLATE_VERSION, context], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha1(canonical.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+
+# ==================== RENDERING ====================
+
+def render_html(context):
+    global _template
+    if _template is None:
+        _template = _environment.from_string(PROPOSAL_HTML)
+    return _template.render(p=context).encode('utf-8')
+
+def render_pdf(context):
+    doc = pdf.PDFDocument(title=f"Proposal {context['quote_id']}")
+    left, right = 60, pdf.PAGE_WIDTH - 60
+    green, grey = (0.02, 0.47, 0.34), (0.42, 0.45, 0.5)
+
+    doc.text(left, 70, context['business_name'], size=22, bold=True, color=green)
+    doc.text(left, 88, f"{context['business_phone']}  |  {context['business_email']}", size=10, color=grey)
+    doc.text(left, 125, f"Cleaning Proposal {context['quote_id']}", size=16, bold=True)
+    issued = f"Issued {context['date_created']}"
+    if context['valid_until']:
+        issued += f"  |  Valid until {context['valid_until']}"
+    doc.text(left, 142, issued, size=10, color=grey)
+
+    y = 165
+    customer = [line for line in (context['customer_name'], context['address'],
+                                  '  |  '.join(v for v in (context['email'], context['phone']) if v)) if line]
+    doc.rect(left, y, right - left, 28 + 15 * len(customer))
+    doc.text(left + 12, y + 20, 'Prepared for', size=11, bold=True)
+    for i, line in enumerate(customer):
+        doc.text(left + 12, y + 36 + 15 * i, line, size=11)
+    y += 28 + 15 * len(customer) + 35
+
+    def section(title, rows, y):
+        doc.text(left, y, title, size=13, bold=True)
+        y += 8
+        for label, value in rows:
+            y += 18
+            doc.text(left, y, label, size=11)
+            doc.text_right(right, y, value, size=11)
+            doc.line(left, y + 6, right, y + 6)
+        return y + 35
+
+    y = section('Property', [
+        ('Property type', context['property_type']),
+        ('Square feet', context['square_feet']),
+        ('Bathrooms', context['bathrooms']),
+        ('Service', context['service_type']),
+        ('Frequency', context['frequency'])
+    ], y)
+
+    doc.text(left, y, 'Included services', size=13, bold=True)
+    for service in context['services'] or ['Standard cleaning']:
+        y += 18
+        doc.text(left + 12, y, f"-  {service}", size=11)
+    y += 35
+
+    y = section('Price per visit', [('Subtotal', context['subtotal']), ('Tax', context['tax'])], y)
+    y -= 17
+    doc.line(left, y - 14, right, y - 14, width=1.5, color=green)
+    doc.text(left, y, 'Total', size=14, bold=True)
+    doc.text_right(right, y, context['total'], size=14, bold=True)
+    y += 40
+
+    if context['notes']:
+        doc.text(left, y, 'Notes', size=13, bold=True)
+        for line in pdf.wrap(context['notes'], 11, right - left):
+            y += 16
+            if y > pdf.PAGE_HEIGHT - 60:
+                doc.add_page()
+                y = 60
+            doc.text(left, y, line, size=11)
+        y += 35
+
+    doc.text(left, min(y, pdf.PAGE_HEIGHT - 40),
+             f"Questions? Call {context['business_phone']}, quoting {context['quote_id']}.",
+             size=10, color=grey)
+    return doc.to_bytes()
+
+RENDERERS = {'html': render_html, 'pdf': render_pdf}
+
+
+class ProposalRenderer:
+    def __init__(self, cache_dir=Config.PROPOSAL_CACHE_DIR, workers=Config.PROPOSAL_WORKERS,
+                 queue_size=Config.PROPOSAL_QUEUE_SIZE):
+        """Render on `workers` threads with up to queue_size more renders waiting"""
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self.queue_size = queue_size
+        self.hits = 0
+        self.renders = 0
+        self._lock = threading.Lock()
+        self._start()
+
+    def _start(self):
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='proposal')
+        self._slots = threading.BoundedSemaphore(self.workers + self.queue_size)
+        self._in_flight = {}  # cache path -> Future
+
+    def reconnect(self):
+        """After a fork the pool's threads are gone; start a new pool in the child"""
+        self._lock = threading.Lock()
+        self._start()
+
+    def _path(self, quote_id, digest, fmt):
+        safe_id = re.sub(r'[^A-Za-z0-9_-]', '_', quote_id)
+        return os.path.join(self.cache_dir, f"{safe_id}-{digest}.{fmt}")
+
+    def get(self, quote, fmt='pdf', timeout=Config.PROPOSAL_RENDER_TIMEOUT):
+        """(content bytes, content hash) of a quote's proposal, rendering only on a cache miss.
+
+        Raises ProposalBusy when the render queue is full and
+        concurrent.futures.TimeoutError when the render takes too long.
+        """
+        context = proposal_context(quote)
+        digest = content_hash(context)
+        path = self._path(context['quote_id'], digest, fmt)
+        try:
+            with open(path, 'rb') as f:
+                content = f.read()
+            self.hits += 1
+            return content, digest
+        except FileNotFoundError:
+            pass
+        return self._submit(context, digest, fmt).result(timeout), digest
+
+    def prefetch(self, quote):
+        """Queue every format of a quote's proposal without waiting (skipped when busy)"""
+        context = proposal_context(quote)
+        digest = content_hash(context)
+        for fmt in PROPOSAL_FORMATS:
+            if not os.path.exists(self._path(context['quote_id'], digest, fmt)):
+                try:
+                    self._submit(context, digest, fmt)
+                except ProposalBusy:
+                    return
+
+    def _submit(self, context, digest, fmt):
+        """Future of the render; concurrent requests for the same output share one"""
+        path = self._path(context['quote_id'], digest, fmt)
+        with self._lock:
+            future = self._in_flight.get(path)
+            if future is not None:
+                return future
+            if not self._slots.acquire(blocking=False):
+                raise ProposalBusy('Proposal renderer is busy')
+            future = self._executor.submit(self._render, context, fmt, path)
+            self._in_flight[path] = future
+        future.add_done_callback(lambda _: self._finished(path))
+        return future
+
+    def _finished(self, path):
+        with self._lock:
+            self._in_flight.pop(path, None)
+        self._slots.release()
+
+    def _render(self, context, fmt, path):
+        content = RENDERERS[fmt](context)
+        self.renders += 1
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+
+            # Drop the renders of earlier versions of this quote
+            prefix = path[:-(HASH_LENGTH + len(fmt) + 1)]
+            for stale in glob.glob(glob.escape(prefix) + '?' * HASH_LENGTH + f".{fmt}"):
+                if stale != path:
+                    os.remove(stale)
+        except OSError as e:
+            print(f"Error caching proposal {os.path.basename(path)}: {e}")
+        return content
@@ -0,0 +1,110 @@
+"""
+Shared Services
+One SheetsDatabase, GeminiChat, EmailService, DriveStorage, Catalog and
+ProposalRenderer per process, shared by the app and every blueprint. They
+are built on first use, or by create_app(preload=True) before a server forks
+its workers; each forked worker then reconnects the Google clients (and
+restarts the catalog refresh thread and proposal render pool) instead of
+reusing the parent's.
+"""
+
+import os
+import threading
+
+from werkzeug.local import LocalProxy
+
+
+def _sheets_database():
+    from modules.sheets_db import SheetsDatabase
+    return SheetsDatabase()
+
+def _gemini_chat():
+    from modules.gemini_chat import GeminiChat
+    return GeminiChat()
+
+def _email_service():
+    from modules.email_service import EmailService
+    return EmailService()
+
+def _drive_storage():
+    from modules.drive_storage import DriveStorage
+    return DriveStorage()
+
+def _catalog():
+    from modules.catalog import Catalog
+    return Catalog(lambda: get_service('db')).start()
+
+def _proposal_renderer():
+    from modules.proposals import ProposalRenderer
+    return ProposalRenderer()
+
+# Service name -> factory
+SERVICE_FACTORIES = {
+    'db': _sheets_database,
+    'chat': _gemini_chat,
+    'email': _email_service,
+    'drive': _drive_storage,
+    'catalog': _catalog,
+    'proposals': _proposal_renderer
+}
+
+# Built by create_app before forking; Drive is built on first upload
+PRELOADED_SERVICES = ('db', 'chat', 'email')
+
+# Started whenever the service they depend on is built (the catalog keeps
+# pricing in sync with the Materials_Services sheet once there is a db)
+COMPANION_SERVICES = {'db': ('catalog',)}
+
+_services = {}
+_lock = threading.Lock()
+
+
+def get_service(name):
+    """The process-wide instance of a service, built on first use"""
+    service = _services.get(name)
+    if service is None:
+        built = False
+        with _lock:
+            service = _services.get(name)
+            if service is None:
+                service = _services[name] = SERVICE_FACTORIES[name]()
+                built = True
+        if built:
+            for companion in COMPANION_SERVICES.get(name, ()):
+                get_service(companion)
+    return service
+
+def init_services(names=PRELOADED_SERVICES):
+    """Build services up front (in the server's master process when preloading)"""
+    for name in names:
+        get_service(name)
+
+def reinit_after_fork():
+    """Runs in every forked child: reconnect the clients inherited from the parent.
+
+    Services with a reconnect() method keep their state (opened sheets,
+    folder IDs) and only open new connections; the rest are dropped and
+    rebuilt on first use.
+    """
+    global _lock
+    _lock = threading.Lock()  # may have been held by another thread at fork time
+    for name, service in list(_services.items()):
+        reconnect = getattr(service, 'reconnect', None)
+        try:
+            if reconnect is None:
+                raise AttributeError('no reconnect()')
+            reconnect()
+        except Exception as e:
+            if reconnect is not None:
+                print(f"Error reconnecting {name} after fork: {e}")
+            _services.pop(name, None)
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=reinit_after_fork)
+
+# Module-level handles for route modules: `from modules.services import db`
+db = LocalProxy(lambda: get_service('db'))
+chat = LocalProxy(lambda: get_service('chat'))
+email_service = LocalProxy(lambda: get_service('email'))
+drive_storage = LocalProxy(lambda: get_service('drive'))
+proposals = LocalProxy(lambda: get_service('proposals'))
@@ -1,17 +1,155 @@
 # modules/sheets_db.py
 
+import atexit
 import json
 import os
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
-import gspread
-from google.oauth2.service_account import Credentials
+from modules import pricing
+from modules.archive_store import ArchiveStore
+from modules.data_version import DataVersions
+from modules.events import EventLog
+from utils.validators import validate_date, validate_email
+
+# Quote statuses that will never change again and can move to the archive
+CLOSED_QUOTE_STATUSES = ('accepted', 'converted', 'declined', 'expired', 'cancelled')
+
+# Quotes columns, matching the Google Apps Script structure (37 columns)
+QUOTE_HEADERS = [
+    'ID', 'Date_Created', 'Customer_Name', 'Customer_Email', 'Customer_Phone',
+    'Customer_Address', 'Customer_City', 'Customer_State', 'Customer_Zip',
+    'Properties', 'Materials', 'Services', 'Employees', 'Labor_Hours',
+    'Labor_Cost', 'Material_Cost', 'Service_Cost', 'Travel_Cost',
+    'Base_Cost', 'Profit_Margin', 'Profit_Amount', 'Subtotal',
+    'Tax_Amount', 'Total_Amount', 'Status', 'Valid_Until', 'Notes',
+    'Internal_Notes', 'Created_By', 'Assigned_To', 'Follow_Up_Date',
+    'Customer_ID', 'Converted_Date', 'Decline_Reason', 'Service_Type',
+    'Frequency', 'Mileage'
+]
+
+CUSTOMER_HEADERS = [
+    'ID', 'Name', 'Email', 'Phone', 'Address', 'City', 'State',
+    'Zip', 'Status', 'Created_Date', 'Type', 'Business_Name',
+    'Frequency', 'Contract_Start', 'Contract_End', 'Price_Range',
+    'Notes', 'Source', 'Assigned_Rep', 'Last_Service'
+]
+
+EMPLOYEE_HEADERS = [
+    'ID', 'Name', 'Email', 'Phone', 'Username', 'Password',
+    'Role', 'Hourly_Rate', 'Active', 'Start_Date', 'Address',
+    'City', 'State', 'Zip', 'Emergency_Contact', 'Emergency_Phone',
+    'Skills', 'Certifications', 'Notes', 'Last_Login'
+]
+
+MATERIAL_HEADERS = [
+    'ID', 'Type', 'Category', 'Name', 'Description', 'Unit_Type',
+    'Cost', 'Price', 'Active', 'Last_Updated', 'Created_By',
+    'Supplier', 'SKU', 'Min_Stock', 'Current_Stock'
+]
+
+JOB_HEADERS = [
+    'ID', 'Customer_ID', 'Customer_Name', 'Property_Address', 'Date',
+    'Time', 'Duration', 'Employees', 'Status', 'Type', 'Frequency',
+    'Total_Price', 'Labor_Cost', 'Material_Cost', 'Profit',
+    'Payment_Status', 'Payment_Method', 'Invoice_ID', 'Notes',
+    'Completed_Time', 'Created_Date', 'Created_By', 'Modified_Date',
+    'Modified_By', 'Rating'
+]
+
+PAYMENT_HEADERS = [
+    'ID', 'Customer_Name', 'Amount', 'Date', 'Method',
+    'Invoice_Number', 'Status', 'Job_IDs', 'Notes'
+]
+
+ACTIVITY_LOG_HEADERS = ['Timestamp', 'Action', 'Description', 'User', 'IP_Address']
+
+# Quotes columns that must hold numbers
+QUOTE_NUMERIC_FIELDS = (
+    'Labor_Hours', 'Labor_Cost', 'Material_Cost', 'Service_Cost', 'Travel_Cost',
+    'Base_Cost', 'Profit_Margin', 'Profit_Amount', 'Subtotal', 'Tax_Amount',
+    'Total_Amount', 'Mileage'
+)
+
+# Rows per append_rows call for bulk imports
+BULK_CHUNK_SIZE = 500
+
+# Date column of each sheet, used for date-range filters and to bucket
+# archived rows into monthly segments
+SHEET_DATE_FIELDS = {
+    'Quotes': 'Date_Created',
+    'Customers': 'Created_Date',
+    'Jobs': 'Date',
+    'Payments': 'Date',
+    'Activity_Log': 'Timestamp'
+}
+
+# Column matched by status filters on each sheet
+SHEET_STATUS_FIELDS = {
+    'Quotes': 'Status',
+    'Customers': 'Status',
+    'Jobs': 'Status',
+    'Payments': 'Status',
+    'Activity_Log': 'Action'
+}
+
+# Sheets that have archive segments
+ARCHIVED_SHEETS = ('Quotes', 'Activity_Log')
+
+# Rows fetched per API call when streaming a sheet
+STREAM_PAGE_SIZE = 1000
+
+# Repriced quote rows written per batch_update call
+REPRICE_BATCH_SIZE = 500
+
+# Buffered activity log entries are written together once this many are
+# waiting, or by a timer this many seconds after the oldest one
+LOG_BUFFER_SIZE = 20
+LOG_BUFFER_SECONDS = 60
+
+
+def id_token():
+    """Random 4-character suffix that keeps IDs minted in the same second apart,
+    in this process or another one"""
+    return os.urandom(2).hex().upper()
 
 
 class SheetsDatabase:
-    def __init__(self):
-        """Initialize Google Sheets connection"""
+    def __init__(self, spreadsheet=None):
+        """Initialize Google Sheets connection.
+
+        An already opened spreadsheet (for example an OfflineSpreadsheet) can
+        be passed in; OFFLINE_SHEETS_DB points at a SQLite file to load an
+        offline copy instead of connecting to Google.
+        """
+        self.archive = ArchiveStore(os.environ.get('ARCHIVE_DIR', 'archive'))
+        self.versions = DataVersions(os.environ.get('DATA_VERSION_DB', 'data_versions.db'))
+        self.events = EventLog(os.environ.get('EVENTS_DB', 'events.db'))
+        self.log_sheet = None
+        self._row_indexes = {}  # sheet title -> (headers, {ID: row number})
+        self._log_buffer = []
+        self._log_timer = None
+        self._log_lock = threading.Lock()
+        self._convert_lock = threading.Lock()
+        self._strict = threading.local()
+        atexit.register(self.flush_log)
+
+        if spreadsheet is None and os.environ.get('OFFLINE_SHEETS_DB'):
+            from modules.offline_sheets import OfflineSpreadsheet
+            spreadsheet = OfflineSpreadsheet.load_sqlite(os.environ['OFFLINE_SHEETS_DB'])
+
+        if spreadsheet is not None:
+            self.spreadsheet = spreadsheet
+            self.init_sheets()
+            return
+
         try:
+            # The Google client libraries are slow to import; only load them when connecting
+            import gspread
+            from google.oauth2.service_account import Credentials
+
             # Setup Google Sheets credentials
             scopes = ['https://www.googleapis.com/auth/spreadsheets',
                      'https://www.googleapis.com/auth/drive']
@@ -43,6 +181,42 @@ class SheetsDatabase:
             print(f"Error initializing Google Sheets: {e}")
             self.spreadsheet = None
 
+    @contextmanager
+    def strict_reads(self):
+        """Make this thread's sheet reads raise errors inside the block.
+
+        get_quotes, get_customers, get_jobs, get_employees and
+        get_all_payments normally print an error and return []; callers that
+        cache what they read use this
+        to tell a failed read from an empty sheet.
+        """
+        previous = getattr(self._strict, 'active', False)
+        self._strict.active = True
+        try:
+            yield self
+        finally:
+            self._strict.active = previous
+
+    def _read_failed(self, what, error):
+        print(f"Error getting {what}: {error}")
+        if getattr(self._strict, 'active', False):
+            raise error
+
+    def reconnect(self):
+        """Open a new HTTP session for the Sheets client.
+
+        Called in forked worker processes, which must not share the
+        parent's connections; the opened worksheets are kept.
+        """
+        # Locks may have been held by another thread at fork time
+        self._log_lock = threading.Lock()
+        self._convert_lock = threading.Lock()
+        client = getattr(self, 'client', None)
+        if client is None:
+            return
+        from google.auth.transport.requests import AuthorizedSession
+        client.session = AuthorizedSession(client.auth)
+
     def init_sheets(self):
         """Initialize required sheets if they don't exist"""
         try:
@@ -58,18 +232,7 @@ class SheetsDatabase:
                 )
 
                 # Add headers matching Google Apps Script structure
-                headers = [
-                    'ID', 'Date_Created', 'Customer_Name', 'Customer_Email', 'Customer_Phone',
-                    'Customer_Address', 'Customer_City', 'Customer_State', 'Customer_Zip',
-                    'Properties', 'Materials', 'Services', 'Employees', 'Labor_Hours',
-                    'Labor_Cost', 'Material_Cost', 'Service_Cost', 'Travel_Cost',
-                    'Base_Cost', 'Profit_Margin', 'Profit_Amount', 'Subtotal',
-                    'Tax_Amount', 'Total_Amount', 'Status', 'Valid_Until', 'Notes',
-                    'Internal_Notes', 'Created_By', 'Assigned_To', 'Follow_Up_Date',
-                    'Customer_ID', 'Converted_Date', 'Decline_Reason', 'Service_Type',
-                    'Frequency', 'Mileage'
-                ]
-                self.quotes_sheet.append_row(headers)
+                self.quotes_sheet.append_row(QUOTE_HEADERS)
 
                 # Format headers
                 self.quotes_sheet.format('A1:AK1', {
@@ -94,11 +257,7 @@ class SheetsDatabase:
                 rows=1000,
                 cols=20
             )
-            headers = ['ID', 'Name', 'Email', 'Phone', 'Address', 'City', 'State',
-                      'Zip', 'Status', 'Created_Date', 'Type', 'Business_Name',
-                      'Frequency', 'Contract_Start', 'Contract_End', 'Price_Range',
-                      'Notes', 'Source', 'Assigned_Rep', 'Last_Service']
-            self.customers_sheet.append_row(headers)
+            self.customers_sheet.append_row(CUSTOMER_HEADERS)
             self.customers_sheet.format('A1:T1', {
                 'backgroundColor': {'red': 0.2, 'green': 0.3, 'blue': 0.5},
                 'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
@@ -113,11 +272,7 @@ class SheetsDatabase:
                 rows=100,
                 cols=20
             )
-            headers = ['ID', 'Name', 'Email', 'Phone', 'Username', 'Password',
-                      'Role', 'Hourly_Rate', 'Active', 'Start_Date', 'Address',
-                      'City', 'State', 'Zip', 'Emergency_Contact', 'Emergency_Phone',
-                      'Skills', 'Certifications', 'Notes', 'Last_Login']
-            self.employees_sheet.append_row(headers)
+            self.employees_sheet.append_row(EMPLOYEE_HEADERS)
             self.employees_sheet.format('A1:T1', {
                 'backgroundColor': {'red': 0.1, 'green': 0.4, 'blue': 0.3},
                 'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
@@ -132,10 +287,7 @@ class SheetsDatabase:
                 rows=500,
                 cols=15
             )
-            headers = ['ID', 'Type', 'Category', 'Name', 'Description', 'Unit_Type',
-                      'Cost', 'Price', 'Active', 'Last_Updated', 'Created_By',
-                      'Supplier', 'SKU', 'Min_Stock', 'Current_Stock']
-            self.materials_sheet.append_row(headers)
+            self.materials_sheet.append_row(MATERIAL_HEADERS)
             self.materials_sheet.format('A1:O1', {
                 'backgroundColor': {'red': 0.3, 'green': 0.2, 'blue': 0.4},
                 'textFormat': {'bold': True, 'foregroundColor': {'red': 1, 'green': 1, 'blue': 1}}
@@ -150,13 +302,7 @@ class SheetsDatabase:
                 rows=2000,
                 cols=25
             )
-            headers = ['ID', 'Customer_ID', 'Customer_Name', 'Property_Address', 'Date',
-                      'Time', 'Duration', 'Employees', 'Status', 'Type', 'Frequency',
-                      'Total_Price', 'Labor_Cost', 'Material_Cost', 'Profit',
-                      'Payment_Status', 'Payment_Method', 'Invoice_ID', 'Notes',
-                      'Completed_Time', 'Created_Date', 'Created_By', 'Modified_Date',
-                      'Modified_By', 'Rating']
-            self.jobs_sheet.append_row(headers)
+            self.jobs_sheet.append_row(JOB_HEADERS)
 
     def add_quote_full(self, quote_data):
         """Add a complete quote with all fields to Google Sheets"""
@@ -165,93 +311,86 @@ class SheetsDatabase:
                 return {'success': False, 'error': 'Sheets not initialized'}
 
             # Ensure all data is properly formatted for Google Sheets
-            formatted_data = []
-            for item in quote_data:
-                if isinstance(item, (dict, list)):
-                    formatted_data.append(json.dumps(item))
-                elif isinstance(item, datetime):
-                    formatted_data.append(item.isoformat())
-                elif item is None:
-                    formatted_data.append('')
-                else:
-                    formatted_data.append(str(item))
+            formatted_data = self._format_row(quote_data)
 
             # Append the quote data
             self.quotes_sheet.append_row(formatted_data)
+            self.bump_version('Quotes')
+            quote = dict(zip(QUOTE_HEADERS, formatted_data))
+            self.publish_event('quote_created', quote)
 
             # Log the action
             self.log_activity('Quote Created', f"New quote {formatted_data[0]} created via web form")
 
             return {
                 'success': True,
-                'quote_id': formatted_data[0]
+                'quote_id': formatted_data[0],
+                'quote': quote
             }
 
         except Exception as e:
             print(f"Error adding quote: {e}")
             return {'success': False, 'error': str(e)}
 
-    def add_quote(self, name, email, phone, property_type, sqft, frequency, price):
-        """Legacy method for simple quote addition"""
+    @staticmethod
+    def _format_row(values):
+        """Format a row of Python values as strings for Google Sheets"""
+        formatted_data = []
+        for item in values:
+            if isinstance(item, (dict, list)):
+                formatted_data.append(json.dumps(item))
+            elif isinstance(item, datetime):
+                formatted_data.append(item.isoformat())
+            elif item is None:
+                formatted_data.append('')
+            else:
+                formatted_data.append(str(item))
+        return formatted_data
+
+    def add_quote(self, name, email, phone, quote, notes='', breakdown=None):
+        """Add a quote for a pricing.QuoteInput (public quote calculator).
+
+        The breakdown columns come from the pricing engine; pass the
+        breakdown already shown to the customer to store exactly that one.
+        """
         try:
             # Generate quote ID
             quote_id = f"Q{datetime.now().strftime('%Y%m%d%H%M%S')}"
 
-            # Create minimal quote data
-            properties = [{
-                'type': property_type,
-                'sqft': sqft
-            }]
-
-            # Prepare the row data in the correct order
-            quote_data = [
-                quote_id,                           # ID
-                datetime.now().isoformat(),         # Date_Created
-                name,                               # Customer_Name
-                email,                              # Customer_Email
-                phone,                              # Customer_Phone
-                '',                                 # Customer_Address
-                '',                                 # Customer_City
-                '',                                 # Customer_State
-                '',                                 # Customer_Zip
-                json.dumps(properties),             # Properties
-                '[]',                               # Materials
-                '[]',                               # Services
-                '[]',                               # Employees
-                0,                                  # Labor_Hours
-                0,                                  # Labor_Cost
-                0,                                  # Material_Cost
-                0,                                  # Service_Cost
-                0,                                  # Travel_Cost
-                price * 0.65,                       # Base_Cost (estimate)
-                35,                                 # Profit_Margin
-                price * 0.35,                       # Profit_Amount (estimate)
-                price / 1.0625,                     # Subtotal (estimate)
-                price * 0.0625,                     # Tax_Amount (estimate)
-                price,                              # Total_Amount
-                'pending',                          # Status
-                '',                                 # Valid_Until
-                '',                                 # Notes
-                f'Web quote: {property_type}',     # Internal_Notes
-                'Web Form',                         # Created_By
-                '',                                 # Assigned_To
-                '',                                 # Follow_Up_Date
-                '',                                 # Customer_ID
-                '',                                 # Converted_Date
-                '',                                 # Decline_Reason
-                'regular',                          # Service_Type
-                frequency,                          # Frequency
-                0                                   # Mileage
-            ]
+            breakdown = breakdown or pricing.price(quote)
+            materials, services = pricing.catalog_entries(quote)
+
+            record = {
+                'Customer_Name': name,
+                'Customer_Email': email,
+                'Customer_Phone': phone,
+                'Properties': [{
+                    'id': 1,
+                    'name': f"{quote.property_type.title()} Property",
+                    'facilityType': quote.property_type,
+                    'squareFeet': quote.sqft,
+                    'restrooms': quote.bathrooms
+                }],
+                'Materials': materials,
+                'Services': services,
+                'Valid_Until': (datetime.now() + timedelta(days=30)).isoformat(),
+                'Notes': notes,
+                'Internal_Notes': f'Web quote: {quote.property_type}',
+                'Created_By': 'Web Form',
+                'Service_Type': quote.service_type,
+                'Frequency': quote.frequency,
+                'Mileage': quote.miles
+            }
+            record.update(breakdown.sheet_fields())
 
-            return self.add_quote_full(quote_data)
+            return self.add_quote_full(self._build_quote_row(quote_id, record))
 
         except Exception as e:
             print(f"Error in add_quote: {e}")
             return {'success': False, 'error': str(e)}
 
-    def get_quotes(self, status=None):
-        """Retrieve quotes from Google Sheets"""
+    def get_quotes(self, status=None, include_archived=False):
+        """Retrieve quotes from Google Sheets, optionally including archived ones"""
         try:
             if not self.quotes_sheet:
                 return []
@@ -259,6 +398,9 @@ class SheetsDatabase:
             # Get all data
             data = self.quotes_sheet.get_all_records()
 
+            if include_archived:
+                data.extend(self.archive.iter_records('Quotes'))
+
             # Filter by status if provided
             if status:
                 data = [q for q in data if q.get('Status') == status]
@@ -269,7 +411,7 @@ class SheetsDatabase:
             return data
 
         except Exception as e:
-            print(f"Error getting quotes: {e}")
+            self._read_failed('quotes', e)
             return []
 
     def update_quote_status(self, quote_id, new_status):
@@ -285,6 +427,7 @@ class SheetsDatabase:
             for i, row in enumerate(data[1:], start=2):
                 if row[0] == quote_id:  # ID is in first column
                     status_col = headers.index('Status') + 1
+                    previous_status = row[status_col - 1] if len(row) >= status_col else ''
                     self.quotes_sheet.update_cell(i, status_col, new_status)
 
                     # If accepted, update converted date
@@ -292,6 +435,12 @@ class SheetsDatabase:
                         converted_col = headers.index('Converted_Date') + 1
                         self.quotes_sheet.update_cell(i, converted_col, datetime.now().isoformat())
 
+                    self.bump_version('Quotes')
+                    self.publish_event('quote_status_changed', {
+                        'ID': quote_id, 'Status': new_status, 'Previous_Status': previous_status,
+                        'Customer_Name': row[headers.index('Customer_Name')] if 'Customer_Name' in headers else '',
+                        'Total_Amount': row[headers.index('Total_Amount')] if 'Total_Amount' in headers else ''
+                    })
                     self.log_activity('Quote Updated', f"Quote {quote_id} status changed to {new_status}")
                     return {'success': True}
 
@@ -301,6 +450,110 @@ class SheetsDatabase:
             print(f"Error updating quote status: {e}")
             return {'success': False, 'error': str(e)}
 
+    def update_quote(self, quote_id, changes):
+        """Update columns of a quote ({column: value}) in one batch update"""
+        try:
+            if not self.quotes_sheet:
+                return {'success': False, 'error': 'Sheets not initialized'}
+
+            data = self.quotes_sheet.get_all_values()
+            headers = data[0]
+
+            for i, row in enumerate(data[1:], start=2):
+                if row[0] != quote_id:
+                    continue
+
+                quote = dict(zip(headers, row))
+                fields = [field for field in changes if field in headers and field != 'ID']
+                values = self._format_row([changes[field] for field in fields])
+
+                from gspread.utils import rowcol_to_a1
+                self.quotes_sheet.batch_update([
+                    {'range': rowcol_to_a1(i, headers.index(field) + 1), 'values': [[value]]}
+                    for field, value in zip(fields, values)
+                ])
+                self.bump_version('Quotes')
+
+                previous_status = quote.get('Status', '')
+                quote.update(zip(fields, values))
+                self._publish_quote_update(quote, previous_status)
+                self.log_activity('Quote Updated', f"Quote {quote_id} updated: {', '.join(fields)}")
+                return {'success': True, 'quote': quote}
+
+            return {'success': False, 'error': 'Quote not found'}
+
+        except Exception as e:
+            print(f"Error updating quote: {e}")
+            return {'success': False, 'error': str(e)}
+
+    def update_quotes(self, changes_by_id, condition=None, action='Quotes Updated'):
+        """Update many quotes ({quote_id: {column: value}}) with one read and one write.
+
+        The rows are located through the row index and read back in one
+        batch; condition(quote) can skip a quote whose current row no longer
+        qualifies. The changes go out in a single batch update and one
+        buffered log entry records them.
+
+        Returns {'success', 'updated': [quote dicts after the change], 'skipped': [IDs]}.
+        """
+        try:
+            if not self.quotes_sheet:
+                return {'success': False, 'error': 'Sheets not initialized'}
+            if not changes_by_id:
+                return {'success': True, 'updated': [], 'skipped': []}
+
+            from gspread.utils import rowcol_to_a1
+            rows = self.find_rows('Quotes', list(changes_by_id))
+            headers = self._row_indexes['Quotes'][0]
+
+            data, updated, skipped = [], [], []
+            for quote_id, changes in changes_by_id.items():
+                number, quote = rows.get(quote_id, (None, None))
+                if quote is None or (condition is not None and not condition(quote)):
+                    skipped.append(quote_id)
+                    continue
+                fields = [field for field in changes if field in headers and field != 'ID']
+                values = self._format_row([changes[field] for field in fields])
+                data.extend({'range': rowcol_to_a1(number, headers.index(field) + 1), 'values': [[value]]}
+                            for field, value in zip(fields, values))
+                previous_status = quote.get('Status', '')
+                quote.update(zip(fields, values))
+                updated.append((quote, previous_status))
+
+            if data:
+                self.quotes_sheet.batch_update(data)
+                self.bump_version('Quotes')
+                for quote, previous_status in updated:
+                    self._publish_quote_update(quote, previous_status)
+                self.log_activity(action, f"{len(updated)} quotes: "
+                                          f"{', '.join(quote['ID'] for quote, _ in updated)}",
+                                  buffered=True)
+
+            return {'success': True, 'updated': [quote for quote, _ in updated], 'skipped': skipped}
+
+        except Exception as e:
+            print(f"Error updating quotes: {e}")
+            return {'success': False, 'error': str(e)}
+
+    def _publish_quote_update(self, quote, previous_status):
+        """Publish quote_updated (the whole row), and quote_status_changed if the status moved"""
+        self.publish_event('quote_updated', quote)
+        if quote.get('Status', '') != previous_status:
+            self.publish_event('quote_status_changed', {
+                'ID': quote.get('ID'), 'Status': quote.get('Status', ''),
+                'Previous_Status': previous_status,
+                'Customer_Name': quote.get('Customer_Name', ''),
+                'Total_Amount': quote.get('Total_Amount', '')
+            })
+
+    def get_all_quotes(self):
+        """Alias for get_quotes"""
+        return self.get_quotes()
+
+    def get_pending_quotes(self):
+        """Get pending quotes, newest first"""
+        return self.get_quotes(status='pending')
+
     def get_quote_by_id(self, quote_id):
         """Get a specific quote by ID"""
         try:
@@ -308,6 +561,11 @@ class SheetsDatabase:
             for quote in quotes:
                 if quote.get('ID') == quote_id:
                     return quote
+
+            # Closed quotes may have been moved to the archive
+            for quote in self.archive.iter_records('Quotes'):
+                if quote.get('ID') == quote_id:
+                    return quote
             return None
         except Exception as e:
             print(f"Error getting quote by ID: {e}")
@@ -353,7 +611,9 @@ class SheetsDatabase:
 
                     # Update last login
                     self.update_employee_last_login(employee.get('ID'))
-                    return employee
+
+                    # The result ends up in the session; never carry the password along
+                    return {k: v for k, v in employee.items() if k != 'Password'}
 
             return None
 
@@ -375,6 +635,7 @@ class SheetsDatabase:
                     if 'Last_Login' in headers:
                         col = headers.index('Last_Login') + 1
                         self.employees_sheet.update_cell(i, col, datetime.now().isoformat())
+                        self.bump_version('Employees')
                     break
         except Exception as e:
             print(f"Error updating last login: {e}")
@@ -393,7 +654,7 @@ class SheetsDatabase:
             return active_customers
 
         except Exception as e:
-            print(f"Error getting customers: {e}")
+            self._read_failed('customers', e)
             return []
 
     def add_customer(self, customer_data):
@@ -405,31 +666,9 @@ class SheetsDatabase:
             # Generate customer ID
             customer_id = f"C{datetime.now().strftime('%Y%m%d%H%M%S')}"
 
-            # Prepare row data
-            row = [
-                customer_id,
-                customer_data.get('name', ''),
-                customer_data.get('email', ''),
-                customer_data.get('phone', ''),
-                customer_data.get('address', ''),
-                customer_data.get('city', ''),
-                customer_data.get('state', ''),
-                customer_data.get('zip', ''),
-                'active',
-                datetime.now().isoformat(),
-                customer_data.get('type', 'commercial'),
-                customer_data.get('business_name', ''),
-                customer_data.get('frequency', 'monthly'),
-                customer_data.get('contract_start', ''),
-                customer_data.get('contract_end', ''),
-                customer_data.get('price_range', ''),
-                customer_data.get('notes', ''),
-                customer_data.get('source', 'Web Quote'),
-                customer_data.get('assigned_rep', ''),
-                ''  # Last service date
-            ]
-
+            row = self._build_customer_row(customer_id, customer_data)
             self.customers_sheet.append_row(row)
+            self.bump_version('Customers')
 
             self.log_activity('Customer Added', f"New customer {customer_data.get('name')} added")
 
@@ -439,6 +678,32 @@ class SheetsDatabase:
             print(f"Error adding customer: {e}")
             return {'success': False, 'error': str(e)}
 
+    @staticmethod
+    def _build_customer_row(customer_id, customer_data):
+        """Build a Customers row from a customer_data dict"""
+        return [
+            customer_id,
+            customer_data.get('name', ''),
+            customer_data.get('email', ''),
+            customer_data.get('phone', ''),
+            customer_data.get('address', ''),
+            customer_data.get('city', ''),
+            customer_data.get('state', ''),
+            customer_data.get('zip', ''),
+            'active',
+            datetime.now().isoformat(),
+            customer_data.get('type', 'commercial'),
+            customer_data.get('business_name', ''),
+            customer_data.get('frequency', 'monthly'),
+            customer_data.get('contract_start', ''),
+            customer_data.get('contract_end', ''),
+            customer_data.get('price_range', ''),
+            customer_data.get('notes', ''),
+            customer_data.get('source', 'Web Quote'),
+            customer_data.get('assigned_rep', ''),
+            ''  # Last service date
+        ]
+
     def get_jobs(self, employee_id=None, status=None):
         """Get jobs from the database"""
         try:
@@ -460,9 +725,24 @@ class SheetsDatabase:
             return jobs
 
         except Exception as e:
-            print(f"Error getting jobs: {e}")
+            self._read_failed('jobs', e)
             return []
 
+    def get_all_jobs(self):
+        """Alias for get_jobs"""
+        return self.get_jobs()
+
+    def get_jobs_for_date(self, date):
+        """Get the jobs scheduled on one date (YYYY-MM-DD), earliest first"""
+        jobs = [j for j in self.get_jobs() if str(j.get('Date', '')) == date]
+        jobs.sort(key=lambda x: str(x.get('Time', '')))
+        return jobs
+
+    def get_recent_jobs(self, limit=10):
+        """Get the most recent jobs dated today or earlier, newest first"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        return [j for j in self.get_jobs() if str(j.get('Date', ''))[:10] <= today][:limit]
+
     def add_job(self, job_data):
         """Add a new job to the database"""
         try:
@@ -472,36 +752,9 @@ class SheetsDatabase:
             # Generate job ID
             job_id = f"J{datetime.now().strftime('%Y%m%d%H%M%S')}"
 
-            # Prepare row data
-            row = [
-                job_id,
-                job_data.get('customer_id', ''),
-                job_data.get('customer_name', ''),
-                job_data.get('property_address', ''),
-                job_data.get('date', datetime.now().date().isoformat()),
-                job_data.get('time', ''),
-                job_data.get('duration', ''),
-                json.dumps(job_data.get('employees', [])),
-                job_data.get('status', 'scheduled'),
-                job_data.get('type', 'regular'),
-                job_data.get('frequency', ''),
-                job_data.get('total_price', 0),
-                job_data.get('labor_cost', 0),
-                job_data.get('material_cost', 0),
-                job_data.get('profit', 0),
-                job_data.get('payment_status', 'pending'),
-                job_data.get('payment_method', ''),
-                job_data.get('invoice_id', ''),
-                job_data.get('notes', ''),
-                '',  # Completed time
-                datetime.now().isoformat(),  # Created date
-                job_data.get('created_by', 'System'),
-                '',  # Modified date
-                '',  # Modified by
-                ''   # Rating
-            ]
-
+            row = self._build_job_row(job_id, job_data)
             self.jobs_sheet.append_row(row)
+            self.bump_version('Jobs')
 
             self.log_activity('Job Created', f"New job {job_id} scheduled for {job_data.get('customer_name')}")
 
@@ -511,6 +764,90 @@ class SheetsDatabase:
             print(f"Error adding job: {e}")
             return {'success': False, 'error': str(e)}
 
+    def check_in_job(self, job_id):
+        """Mark a job as in progress when the crew arrives"""
+        return self._update_job_status(job_id, 'in_progress', 'job_checked_in', 'Job Check-In')
+
+    def complete_job(self, job_id, notes=''):
+        """Mark a job as completed, stamping the completion time"""
+        return self._update_job_status(job_id, 'completed', 'job_completed', 'Job Completed',
+                                       notes=notes)
+
+    def _update_job_status(self, job_id, status, event_type, action, notes=''):
+        """Set a job's status (and Completed_Time/Notes) in one batch update"""
+        try:
+            if not self.jobs_sheet:
+                return {'success': False, 'error': 'Sheets not initialized'}
+
+            data = self.jobs_sheet.get_all_values()
+            headers = data[0]
+            now = datetime.now().isoformat()
+
+            for i, row in enumerate(data[1:], start=2):
+                if row[0] != job_id:
+                    continue
+
+                job = dict(zip(headers, row))
+                changes = {'Status': status, 'Modified_Date': now}
+                if status == 'completed':
+                    changes['Completed_Time'] = now
+                if notes:
+                    changes['Notes'] = f"{job.get('Notes', '')}\n{notes}".strip()
+
+                from gspread.utils import rowcol_to_a1
+                self.jobs_sheet.batch_update([
+                    {'range': rowcol_to_a1(i, headers.index(field) + 1),
+                     'values': [[value]]}
+                    for field, value in changes.items() if field in headers
+                ])
+                self.bump_version('Jobs')
+
+                event = {'Previous_Status': job.get('Status', '')}
+                job.update(changes)
+                event.update({field: job.get(field, '')
+                              for field in ('ID', 'Customer_Name', 'Date', 'Time', 'Status',
+                                            'Total_Price', 'Completed_Time')})
+                self.publish_event(event_type, event)
+                self.log_activity(action, f"Job {job_id} for {job.get('Customer_Name', '')} is now {status}")
+                return {'success': True}
+
+            return {'success': False, 'error': 'Job not found'}
+
+        except Exception as e:
+            print(f"Error updating job status: {e}")
+            return {'success': False, 'error': str(e)}
+
+    @staticmethod
+    def _build_job_row(job_id, job_data):
+        """Build a Jobs row from a job_data dict"""
+        return [
+            job_id,
+            job_data.get('customer_id', ''),
+            job_data.get('customer_name', ''),
+            job_data.get('property_address', ''),
+            job_data.get('date', datetime.now().date().isoformat()),
+            job_data.get('time', ''),
+            job_data.get('duration', ''),
+            json.dumps(job_data.get('employees', [])),
+            job_data.get('status', 'scheduled'),
+            job_data.get('type', 'regular'),
+            job_data.get('frequency', ''),
+            job_data.get('total_price', 0),
+            job_data.get('labor_cost', 0),
+            job_data.get('material_cost', 0),
+            job_data.get('profit', 0),
+            job_data.get('payment_status', 'pending'),
+            job_data.get('payment_method', ''),
+            job_data.get('invoice_id', ''),
+            job_data.get('notes', ''),
+            '',  # Completed time
+            datetime.now().isoformat(),  # Created date
+            job_data.get('created_by', 'System'),
+            '',  # Modified date
+            '',  # Modified by
+            ''   # Rating
+        ]
+
     def get_employees(self):
         """Get all employees from the database"""
         try:
@@ -525,7 +862,7 @@ class SheetsDatabase:
             return active_employees
 
         except Exception as e:
-            print(f"Error getting employees: {e}")
+            self._read_failed('employees', e)
             return []
 
     def get_all_employees(self):
@@ -570,6 +907,7 @@ class SheetsDatabase:
             ]
 
             self.employees_sheet.append_row(row)
+            self.bump_version('Employees')
 
             self.log_activity('Employee Added', f"New employee {employee_data.get('name')} added")
 
@@ -579,31 +917,75 @@ class SheetsDatabase:
             print(f"Error adding employee: {e}")
             return {'success': False, 'error': str(e)}
 
-    def log_activity(self, action, description):
-        """Log an activity to the activity log"""
+    def get_all_payments(self):
+        """Get all payments, newest first"""
         try:
-            # Try to get or create Activity_Log sheet
+            payments = self.get_sheet('Payments').get_all_records()
+            payments.sort(key=lambda x: str(x.get('Date', '')), reverse=True)
+            return payments
+        except Exception as e:
+            self._read_failed('payments', e)
+            return []
+
+    def get_log_sheet(self):
+        """Get (or create) the Activity_Log sheet, cached after the first lookup"""
+        if self.log_sheet is None:
             try:
-                log_sheet = self.spreadsheet.worksheet('Activity_Log')
+                self.log_sheet = self.spreadsheet.worksheet('Activity_Log')
             except:
-                log_sheet = self.spreadsheet.add_worksheet(
+                self.log_sheet = self.spreadsheet.add_worksheet(
                     title='Activity_Log',
-                    rows=5000,
+                    rows=1000,
                     cols=5
                 )
-                headers = ['Timestamp', 'Action', 'Description', 'User', 'IP_Address']
-                log_sheet.append_row(headers)
-
-            # Add log entry
-            log_entry = [
-                datetime.now().isoformat(),
-                action,
-                description,
-                'System',  # In production, get actual user
-                ''  # In production, get IP address
-            ]
-
-            log_sheet.append_row(log_entry)
+                self.log_sheet.append_row(ACTIVITY_LOG_HEADERS)
+        return self.log_sheet
+
+    def log_activity(self, action, description, buffered=False):
+        """Log an activity to the activity log.
+
+        Buffered entries are held in memory and written with the next
+        unbuffered entry, once LOG_BUFFER_SIZE are waiting, by a timer
+        LOG_BUFFER_SECONDS after the oldest one arrived, or by flush_log()
+        (also run at exit).
+        """
+        # Add log entry
+        log_entry = [
+            datetime.now().isoformat(),
+            action,
+            description,
+            'System',  # In production, get actual user
+            ''  # In production, get IP address
+        ]
+
+        with self._log_lock:
+            self._log_buffer.append((time.monotonic(), log_entry))
+            due = (not buffered or len(self._log_buffer) >= LOG_BUFFER_SIZE
+                   or time.monotonic() - self._log_buffer[0][0] >= LOG_BUFFER_SECONDS)
+            if not due and self._log_timer is None:
+                # An idle worker has no next call to notice the age, so a timer flushes
+                self._log_timer = threading.Timer(LOG_BUFFER_SECONDS, self.flush_log)
+                self._log_timer.daemon = True
+                self._log_timer.start()
+        if due:
+            self.flush_log()
+
+    def flush_log(self):
+        """Write every buffered activity log entry in one append"""
+        with self._log_lock:
+            entries, self._log_buffer = self._log_buffer, []
+            timer, self._log_timer = self._log_timer, None
+        if timer is not None:
+            timer.cancel()
+        if not entries:
+            return
+        try:
+            log_sheet = self.get_log_sheet()
+            if len(entries) == 1:
+                log_sheet.append_row(entries[0][1])
+            else:
+                log_sheet.append_rows([entry for _, entry in entries])
+            self.bump_version('Activity_Log')
 
         except Exception as e:
             print(f"Error logging activity: {e}")
@@ -622,47 +1004,754 @@ class SheetsDatabase:
                 'monthly_revenue': 0,
                 'total_employees': 0,
                 'active_employees': 0,
-                'jobs_today': 0
+                'jobs_today': 0,
+                'completed_today': 0,
+                'upcoming_jobs': 0,
+                'revenue_today': 0,
+                'revenue_month': 0
             }
 
-            # Get quotes stats
             if self.quotes_sheet:
-                quotes = self.get_quotes()
-                stats['total_quotes'] = len(quotes)
-                stats['pending_quotes'] = len([q for q in quotes if q.get('Status') == 'pending'])
-                stats['accepted_quotes'] = len([q for q in quotes if q.get('Status') == 'accepted'])
-
-                # Calculate revenue from accepted quotes
-                for quote in quotes:
-                    if quote.get('Status') == 'accepted':
-                        try:
-                            stats['total_revenue'] += float(quote.get('Total_Amount', 0))
-                        except:
-                            pass
-
-            # Get customer stats
+                stats.update(self.get_quote_stats())
             if self.customers_sheet:
-                customers = self.get_customers()
-                stats['total_customers'] = len(customers)
-
-            # Get job stats
+                stats.update(self.get_customer_stats())
             if self.jobs_sheet:
-                jobs = self.get_jobs()
-                stats['active_jobs'] = len([j for j in jobs if j.get('Status') == 'scheduled'])
-                stats['completed_jobs'] = len([j for j in jobs if j.get('Status') == 'completed'])
-                
-                # Jobs today
-                today = datetime.now().date().isoformat()
-                stats['jobs_today'] = len([j for j in jobs if j.get('Date') == today])
-
-            # Get employee stats
+                stats.update(self.get_job_stats())
             if self.employees_sheet:
-                employees = self.get_employees()
-                stats['total_employees'] = len(employees)
-                stats['active_employees'] = len([e for e in employees if e.get('Active') == 'yes'])
+                stats.update(self.get_employee_stats())
 
             return stats
 
         except Exception as e:
             print(f"Error getting dashboard stats: {e}")
-            return {}
\ No newline at end of file
+            return {}
+
+    def get_quote_stats(self):
+        """Dashboard statistics that only depend on the Quotes sheet"""
+        quotes = self.get_quotes()
+        stats = {
+            'total_quotes': len(quotes),
+            'pending_quotes': len([q for q in quotes if q.get('Status') == 'pending']),
+            'accepted_quotes': len([q for q in quotes if q.get('Status') == 'accepted']),
+            'total_revenue': 0
+        }
+
+        # Calculate revenue from accepted quotes
+        for quote in quotes:
+            if quote.get('Status') == 'accepted':
+                try:
+                    stats['total_revenue'] += float(quote.get('Total_Amount', 0))
+                except:
+                    pass
+        return stats
+
+    def get_customer_stats(self):
+        """Dashboard statistics that only depend on the Customers sheet"""
+        return {'total_customers': len(self.get_customers())}
+
+    def get_job_stats(self):
+        """Dashboard statistics that only depend on the Jobs sheet"""
+        jobs = self.get_jobs()
+        today = datetime.now().date().isoformat()
+        stats = {
+            'active_jobs': len([j for j in jobs if j.get('Status') == 'scheduled']),
+            'completed_jobs': len([j for j in jobs if j.get('Status') == 'completed']),
+            'jobs_today': len([j for j in jobs if j.get('Date') == today]),
+            'upcoming_jobs': len([j for j in jobs if j.get('Status') == 'scheduled'
+                                  and str(j.get('Date', '')) >= today]),
+            'completed_today': 0,
+            'revenue_today': 0,
+            'revenue_month': 0
+        }
+
+        # Revenue from completed jobs, today and this month
+        for job in jobs:
+            if job.get('Status') != 'completed':
+                continue
+            job_date = str(job.get('Date', ''))
+            try:
+                price = float(job.get('Total_Price') or 0)
+            except (TypeError, ValueError):
+                price = 0
+            if job_date == today:
+                stats['completed_today'] += 1
+                stats['revenue_today'] += price
+            if job_date[:7] == today[:7]:
+                stats['revenue_month'] += price
+        stats['monthly_revenue'] = stats['revenue_month']
+        return stats
+
+    def get_employee_stats(self):
+        """Dashboard statistics that only depend on the Employees sheet"""
+        employees = self.get_employees()
+        return {
+            'total_employees': len(employees),
+            'active_employees': len([e for e in employees if e.get('Active') == 'yes'])
+        }
+
+    # ==================== DATA VERSIONS ====================
+
+    def bump_version(self, *titles):
+        """Record a write to one or more sheets"""
+        self.versions.bump(*titles)
+
+    def get_data_version(self, *titles):
+        """Token that changes whenever any of the sheets is written.
+
+        Reads only the local version counters, never Google Sheets. Returns
+        None if the counters are unavailable.
+        """
+        return self.versions.token(*titles)
+
+    # ==================== LIVE EVENTS ====================
+
+    def publish_event(self, event_type, data):
+        """Tell open dashboards about a change (see modules/events.py)"""
+        return self.events.publish(event_type, data)
+
+    # ==================== STREAMING ====================
+
+    def get_sheet(self, title):
+        """Get a worksheet by title, reusing the handles opened at startup"""
+        known = {
+            'Quotes': 'quotes_sheet',
+            'Customers': 'customers_sheet',
+            'Employees': 'employees_sheet',
+            'Materials_Services': 'materials_sheet',
+            'Jobs': 'jobs_sheet'
+        }
+        if title == 'Activity_Log':
+            return self.get_log_sheet()
+        if title in known and getattr(self, known[title], None):
+            return getattr(self, known[title])
+        return self.spreadsheet.worksheet(title)
+
+    def get_records(self, title):
+        """Get every record of a sheet as dicts (numbers parsed, like get_all_records)"""
+        return self.get_sheet(title).get_all_records()
+
+    def get_headers(self, title):
+        """Get the header row of a sheet"""
+        return self.get_sheet(title).row_values(1)
+
+    def iter_records(self, title, start=None, end=None, status=None,
+                     include_archived=False, page_size=STREAM_PAGE_SIZE):
+        """Stream a sheet's records page by page instead of loading it whole.
+
+        start and end are inclusive YYYY-MM-DD strings matched against the
+        sheet's date column; status is matched against its status column.
+        With include_archived, archived records are yielded first.
+        """
+        date_field = SHEET_DATE_FIELDS.get(title)
+        status_field = SHEET_STATUS_FIELDS.get(title)
+
+        def matches(record):
+            if date_field and (start or end):
+                day = str(record.get(date_field, ''))[:10]
+                if start and day < start:
+                    return False
+                if end and day > end:
+                    return False
+            if status and str(record.get(status_field, '')) != status:
+                return False
+            return True
+
+        if include_archived and title in ARCHIVED_SHEETS:
+            first = datetime.strptime(start, '%Y-%m-%d') if start else None
+            last = datetime.strptime(end, '%Y-%m-%d') if end else None
+            for record in self.archive.iter_records(title, first, last):
+                if matches(record):
+                    yield record
+
+        for _, record in self._iter_sheet_rows(self.get_sheet(title), page_size):
+            if matches(record):
+                yield record
+
+    @staticmethod
+    def _iter_sheet_rows(sheet, page_size=STREAM_PAGE_SIZE):
+        """Stream (row number, record) pairs of a sheet, one page per API call.
+
+        Pages run to the sheet's row count, since the API trims blank rows
+        from the end of each page and a gap of blank rows is not the end of
+        the data; blank rows themselves are skipped. The row count is read
+        fresh from the API (see _grid_rows), and no page reaches past it.
+        Cells are numericised like get_all_records does, so streamed rows
+        have the same types as archived records and get_quotes() rows.
+        """
+        from gspread.utils import numericise  # deferred: gspread is slow to import
+
+        headers = sheet.row_values(1)
+        row_count = SheetsDatabase._grid_rows(sheet)
+        first_row = 2
+        while first_row <= row_count:
+            page = sheet.get(f"{first_row}:{min(first_row + page_size - 1, row_count)}")
+            for offset, row in enumerate(page):
+                if any(cell != '' for cell in row):
+                    cells = [numericise(cell) for cell in row] + [''] * (len(headers) - len(row))
+                    yield first_row + offset, dict(zip(headers, cells))
+            first_row += page_size
+
+    @staticmethod
+    def _grid_rows(sheet):
+        """The sheet's current number of grid rows, fetched from the API.
+
+        Worksheet.row_count is cached when the worksheet is opened and only
+        follows appends made through that object, so it misses rows added by
+        other workers or Apps Script and rows removed by the archiver.
+        """
+        metadata = sheet.spreadsheet.fetch_sheet_metadata({'fields': 'sheets.properties'})
+        for item in metadata.get('sheets', []):
+            properties = item.get('properties', {})
+            if properties.get('sheetId') == sheet.id:
+                return properties['gridProperties']['rowCount']
+        return sheet.row_count
+
+    # ==================== BULK IMPORT ====================
+
+    def bulk_add_customers(self, customers, chunk_size=BULK_CHUNK_SIZE, dry_run=False):
+        """Validate customer dicts in memory and append them in large chunks"""
+        return self._bulk_add(getattr(self, 'customers_sheet', None), 'C', customers,
+                              self._validate_customer, self._build_customer_row,
+                              'Customers Imported', chunk_size, dry_run)
+
+    def bulk_add_jobs(self, jobs, chunk_size=BULK_CHUNK_SIZE, dry_run=False):
+        """Validate job dicts in memory and append them in large chunks"""
+        return self._bulk_add(getattr(self, 'jobs_sheet', None), 'J', jobs,
+                              self._validate_job, self._build_job_row,
+                              'Jobs Imported', chunk_size, dry_run)
+
+    def bulk_add_quotes(self, quotes, chunk_size=BULK_CHUNK_SIZE, dry_run=False):
+        """Validate quote dicts (keyed by Quotes column name) and append them in large chunks"""
+        lookup = {header.lower(): header for header in QUOTE_HEADERS}
+        quotes = ({lookup.get(str(k).lower(), k): v for k, v in quote.items()} for quote in quotes)
+        return self._bulk_add(getattr(self, 'quotes_sheet', None), 'Q', quotes,
+                              self._validate_quote, self._build_quote_row,
+                              'Quotes Imported', chunk_size, dry_run)
+
+    def _bulk_add(self, sheet, id_prefix, records, validate, build_row, action,
+                  chunk_size=BULK_CHUNK_SIZE, dry_run=False):
+        """Validate records, then write the valid ones with chunked append_rows.
+
+        Invalid records are skipped and reported by their 1-based position.
+        A single summary entry is written to the activity log.
+        """
+        try:
+            if not sheet and not dry_run:
+                return {'success': False, 'error': 'Sheets not initialized'}
+
+            # Bulk rows share one timestamp, so IDs get a sequence suffix; the
+            # token keeps two imports within the same second apart
+            stamp = datetime.now().strftime('%Y%m%d%H%M%S') + id_token()
+            rows = []
+            ids = []
+            errors = []
+            for number, record in enumerate(records, start=1):
+                error = validate(record)
+                if error:
+                    errors.append({'row': number, 'error': error})
+                    continue
+
+                record_id = f"{id_prefix}{stamp}{len(ids) + 1:05d}"
+                row = self._format_row(build_row(record_id, record))
+                ids.append(row[0])
+                rows.append(row)
+
+            result = {'success': True, 'added': 0, 'ids': [], 'errors': errors}
+            if dry_run:
+                result['valid'] = len(rows)
+                return result
+
+            try:
+                for start in range(0, len(rows), chunk_size):
+                    chunk = rows[start:start + chunk_size]
+                    sheet.append_rows(chunk)
+                    result['added'] += len(chunk)
+                    self.bump_version(sheet.title)
+            except Exception as e:
+                print(f"Error in bulk append: {e}")
+                result['success'] = False
+                result['error'] = str(e)
+
+            result['ids'] = ids[:result['added']]
+            if result['added']:
+                self.log_activity(action, f"Imported {result['added']} rows into {sheet.title} "
+                                          f"({len(errors)} rejected)")
+
+            return result
+
+        except Exception as e:
+            print(f"Error in bulk import: {e}")
+            return {'success': False, 'error': str(e)}
+
+    @staticmethod
+    def _validate_customer(customer):
+        """Return an error message for an invalid customer dict, or None"""
+        if not str(customer.get('name', '')).strip():
+            return 'Name is required'
+        if customer.get('email') and not validate_email(customer['email']):
+            return f"Invalid email: {customer['email']}"
+        return None
+
+    @staticmethod
+    def _validate_job(job):
+        """Return an error message for an invalid job dict, or None"""
+        if not str(job.get('customer_name', '')).strip() and not job.get('customer_id'):
+            return 'Customer name or ID is required'
+        if job.get('date') and not validate_date(job['date']):
+            return f"Invalid date: {job['date']}"
+        for field in ('total_price', 'labor_cost', 'material_cost', 'profit'):
+            try:
+                float(job.get(field) or 0)
+            except (TypeError, ValueError):
+                return f"Invalid {field}: {job.get(field)}"
+        return None
+
+    @staticmethod
+    def _validate_quote(quote):
+        """Return an error message for an invalid quote dict, or None"""
+        unknown = [k for k in quote if k not in QUOTE_HEADERS]
+        if unknown:
+            return f"Unknown columns: {', '.join(map(str, unknown))}"
+        if not str(quote.get('Customer_Name', '')).strip():
+            return 'Customer_Name is required'
+        if quote.get('Customer_Email') and not validate_email(quote['Customer_Email']):
+            return f"Invalid email: {quote['Customer_Email']}"
+        for field in QUOTE_NUMERIC_FIELDS:
+            try:
+                float(quote.get(field) or 0)
+            except (TypeError, ValueError):
+                return f"Invalid {field}: {quote.get(field)}"
+        return None
+
+    @staticmethod
+    def _build_quote_row(quote_id, quote):
+        """Build a 37-column Quotes row from a dict keyed by column name"""
+        defaults = {
+            'ID': quote_id,
+            'Date_Created': datetime.now().isoformat(),
+            'Properties': '[]',
+            'Materials': '[]',
+            'Services': '[]',
+            'Employees': '[]',
+            'Status': 'pending',
+            'Created_By': 'Bulk Import',
+            'Service_Type': 'regular'
+        }
+        for field in QUOTE_NUMERIC_FIELDS:
+            defaults[field] = 0
+
+        return [quote.get(header) if quote.get(header) not in (None, '') else defaults.get(header, '')
+                for header in QUOTE_HEADERS]
+
+    # ==================== ROW INDEX ====================
+
+    def find_row(self, title, record_id):
+        """(row number, record dict) of the row with this ID, or (None, None)"""
+        return self.find_rows(title, [record_id]).get(record_id, (None, None))
+
+    def find_rows(self, title, record_ids):
+        """{ID: (row number, record dict)} for the IDs found, read in one batch.
+
+        Row numbers come from an index of the sheet's ID column, built with
+        one column read and kept between calls. The rows themselves are
+        always re-read and their IDs checked, so an index made stale by rows
+        added or removed elsewhere is rebuilt (once) instead of trusted.
+        """
+        sheet = self.get_sheet(title)
+        found = {}
+        missing = list(dict.fromkeys(record_ids))
+        for rebuild in (False, True):
+            if rebuild or title not in self._row_indexes:
+                ids = sheet.col_values(1)
+                self._row_indexes[title] = (
+                    sheet.row_values(1),
+                    {str(value): number for number, value in enumerate(ids, start=1) if number > 1}
+                )
+            headers, index = self._row_indexes[title]
+            numbers = [(record_id, index[record_id]) for record_id in missing if record_id in index]
+            if numbers:
+                pages = sheet.batch_get([f"{number}:{number}" for _, number in numbers])
+                for (record_id, number), page in zip(numbers, pages):
+                    row = list(page[0]) if page else []
+                    if row and row[0] == record_id:
+                        found[record_id] = (number, dict(zip(headers, row + [''] * (len(headers) - len(row)))))
+            missing = [record_id for record_id in missing if record_id not in found]
+            if not missing:
+                break
+        return found
+
+    def _delete_row_by_id(self, title, record_id):
+        """Delete the one row with this ID (undoing an append); True if deleted.
+
+        Nothing is deleted when the ID is missing or appears more than once,
+        since the row to undo can then not be told apart from another record.
+        """
+        sheet = self.get_sheet(title)
+        ids = sheet.col_values(1)
+        numbers = [number for number in range(2, len(ids) + 1) if ids[number - 1] == record_id]
+        if len(numbers) != 1:
+            print(f"Not removing {title} row {record_id}: found {len(numbers)} rows with that ID")
+            return False
+        sheet.delete_rows(numbers[0])
+        self._row_indexes.pop(title, None)
+        return True
+
+    # ==================== QUOTE CONVERSION ====================
+
+    def convert_quote(self, quote_id):
+        """Turn a quote into a customer as one all-or-nothing operation.
+
+        Finds the quote through the row index, appends the customer row,
+        then sets the quote's Status, Customer_ID and Converted_Date in a
+        single batch update. If that update fails the new customer row
+        (found by its unique ID) is deleted again. The log entry is buffered. Converting an already
+        converted quote returns its existing customer.
+        """
+        with self._convert_lock:
+            try:
+                if not self.quotes_sheet or not self.customers_sheet:
+                    return {'success': False, 'error': 'Sheets not initialized'}
+
+                row_number, quote = self.find_row('Quotes', quote_id)
+                if quote is None:
+                    return {'success': False, 'error': 'Quote not found'}
+                if quote.get('Status') == 'converted' and quote.get('Customer_ID'):
+                    return {'success': True, 'customer_id': quote['Customer_ID'], 'quote': quote}
+
+                # Suffixed so two conversions (or an add_customer) in the same second differ
+                customer_id = f"C{datetime.now().strftime('%Y%m%d%H%M%S')}{id_token()}"
+                customer_row = self._build_customer_row(customer_id, self._customer_from_quote(quote))
+                self.customers_sheet.append_row(customer_row)
+
+                changes = {
+                    'Status': 'converted',
+                    'Customer_ID': customer_id,
+                    'Converted_Date': datetime.now().isoformat()
+                }
+                try:
+                    from gspread.utils import rowcol_to_a1
+                    headers = self._row_indexes['Quotes'][0]
+                    self.quotes_sheet.batch_update([
+                        {'range': rowcol_to_a1(row_number, headers.index(field) + 1), 'values': [[value]]}
+                        for field, value in changes.items()
+                    ])
+                except Exception:
+                    # Compensate: the customer must not exist without its converted quote
+                    try:
+                        self._delete_row_by_id('Customers', customer_id)
+                    except Exception as e:
+                        print(f"Error removing customer {customer_id} after failed conversion: {e}")
+                    raise
+
+            except Exception as e:
+                print(f"Error converting quote: {e}")
+                return {'success': False, 'error': str(e)}
+
+        # Committed; what follows only notifies and never undoes the conversion
+        self.bump_version('Quotes', 'Customers')
+        previous_status = quote.get('Status', '')
+        quote.update(changes)
+        self._publish_quote_update(quote, previous_status)
+        self.log_activity('Quote Converted', f"Quote {quote_id} converted to customer {customer_id}",
+                          buffered=True)
+        return {'success': True, 'customer_id': customer_id, 'quote': quote}
+
+    @staticmethod
+    def _customer_from_quote(quote):
+        """customer_data (for _build_customer_row) from a Quotes row dict"""
+        try:
+            properties = json.loads(quote.get('Properties') or '[]')
+        except ValueError:
+            properties = []
+        prop = properties[0] if properties and isinstance(properties[0], dict) else {}
+        return {
+            'name': quote.get('Customer_Name', ''),
+            'email': quote.get('Customer_Email', ''),
+            'phone': quote.get('Customer_Phone', ''),
+            'address': quote.get('Customer_Address', ''),
+            'city': quote.get('Customer_City', ''),
+            'state': quote.get('Customer_State', ''),
+            'zip': quote.get('Customer_Zip', ''),
+            'type': 'residential' if prop.get('facilityType') == 'residential' else 'commercial',
+            'frequency': quote.get('Frequency') or 'monthly',
+            'price_range': quote.get('Total_Amount', ''),
+            'notes': f"Converted from quote {quote.get('ID')}",
+            'source': 'Web Quote'
+        }
+
+    # ==================== REPRICING ====================
+
+    def reprice_pending_quotes(self, rules=None, dry_run=False, include_adjusted=False,
+                               batch_size=REPRICE_BATCH_SIZE):
+        """Re-price pending quotes with the current rules and write back changed totals.
+
+        Quotes are streamed page by page. Each pending quote whose
+        Total_Amount changes gets its pricing columns (Labor_Hours ...
+        Total_Amount) rewritten, batch_size rows per batch_update call.
+        Quotes with a Profit_Margin other than the rules' were given a
+        negotiated price in admin and are skipped unless include_adjusted.
+        Before each write the batch's rows are located again by ID (see
+        find_rows), so rows archived or deleted meanwhile cannot shift new
+        prices onto other quotes; quotes that moved out of pending or were
+        edited since they were read are left alone.
+        With dry_run nothing is written; the changes are only reported.
+        """
+        started = time.perf_counter()
+        rules = rules or pricing.get_rules()
+        try:
+            if not self.quotes_sheet:
+                return {'success': False, 'error': 'Sheets not initialized'}
+
+            from gspread.utils import rowcol_to_a1
+            headers = self.quotes_sheet.row_values(1)
+            first_col = headers.index('Labor_Hours') + 1
+            last_col = headers.index('Total_Amount') + 1
+            columns = headers[first_col - 1:last_col]
+
+            scanned = pending = adjusted = updated = skipped = 0
+            changes, batch = [], {}
+
+            def write(batch):
+                """Write a batch ({ID: (total read, values)}) to the rows holding those IDs now"""
+                current = self.find_rows('Quotes', list(batch))
+                data = []
+                for quote_id, (old_total, values) in batch.items():
+                    number, quote = current.get(quote_id, (None, None))
+                    if (number is None or quote.get('Status') != 'pending'
+                            or not self._same_amount(quote.get('Total_Amount'), old_total)):
+                        continue
+                    data.append({
+                        'range': f"{rowcol_to_a1(number, first_col)}:{rowcol_to_a1(number, last_col)}",
+                        'values': [values]
+                    })
+                if data:
+                    self.quotes_sheet.batch_update(data)
+                return len(data)
+
+            for row_number, quote in self._iter_sheet_rows(self.quotes_sheet):
+                scanned += 1
+                if quote.get('Status') != 'pending':
+                    continue
+                pending += 1
+                if not include_adjusted and not self._same_amount(quote.get('Profit_Margin'),
+                                                                  rules.profit_margin):
+                    adjusted += 1
+                    continue
+
+                quote_in = pricing.quote_input_from_record(quote, rules)
+                fields = pricing.price_cached(quote_in, rules).sheet_fields()
+                if self._same_amount(quote.get('Total_Amount'), fields['Total_Amount']):
+                    continue
+
+                changes.append({
+                    'ID': quote.get('ID', ''),
+                    'Customer_Name': quote.get('Customer_Name', ''),
+                    'row': row_number,
+                    'old_total': quote.get('Total_Amount', ''),
+                    'new_total': fields['Total_Amount']
+                })
+                if dry_run:
+                    continue
+                batch[str(quote.get('ID', ''))] = (quote.get('Total_Amount'),
+                                                   [fields[column] for column in columns])
+                if len(batch) >= batch_size:
+                    written = write(batch)
+                    updated += written
+                    skipped += len(batch) - written
+                    batch = {}
+
+            if batch:
+                written = write(batch)
+                updated += written
+                skipped += len(batch) - written
+            if updated:
+                self.bump_version('Quotes')
+                self.log_activity('Quotes Repriced',
+                                  f"{updated} pending quotes repriced with rules {rules.version}")
+
+            seconds = time.perf_counter() - started
+            return {
+                'success': True,
+                'rules_version': rules.version,
+                'scanned': scanned,
+                'pending': pending,
+                'adjusted': adjusted,
+                'changed': len(changes),
+                'updated': updated,
+                'skipped': skipped,
+                'changes': changes,
+                'seconds': seconds,
+                'rows_per_second': scanned / seconds if seconds else 0.0
+            }
+
+        except Exception as e:
+            print(f"Error repricing quotes: {e}")
+            return {'success': False, 'error': str(e)}
+
+    @staticmethod
+    def _same_amount(value, amount):
+        """Check whether a sheet value equals amount to the cent"""
+        try:
+            return abs(float(value) - float(amount)) < 0.005
+        except (TypeError, ValueError):
+            return False
+
+    # ==================== ARCHIVAL ====================
+
+    def archive_closed_quotes(self, older_than_days=90, dry_run=False):
+        """Move closed quotes created before the cutoff to the local archive"""
+        cutoff = datetime.now() - timedelta(days=older_than_days)
+
+        def is_cold(quote):
+            return (quote.get('Status') in CLOSED_QUOTE_STATUSES and
+                    self._is_older_than(quote.get('Date_Created'), cutoff))
+
+        return self._archive_sheet(self.quotes_sheet, is_cold, dry_run)
+
+    def archive_activity_log(self, older_than_days=30, dry_run=False):
+        """Move activity log entries older than the cutoff to the local archive"""
+        cutoff = datetime.now() - timedelta(days=older_than_days)
+
+        def is_cold(entry):
+            return self._is_older_than(entry.get('Timestamp'), cutoff)
+
+        return self._archive_sheet(self.get_log_sheet(), is_cold, dry_run)
+
+    def get_archived_records(self, sheet_name, start=None, end=None):
+        """Iterate archived records of a sheet dated between start and end (inclusive)"""
+        date_field = SHEET_DATE_FIELDS[sheet_name]
+
+        for record in self.archive.iter_records(sheet_name, start, end):
+            if start or end:
+                try:
+                    when = datetime.fromisoformat(str(record.get(date_field)))
+                except ValueError:
+                    continue
+                if start and when < start:
+                    continue
+                if end and when > end:
+                    continue
+            yield record
+
+    @staticmethod
+    def _is_older_than(value, cutoff):
+        """Check whether an ISO timestamp is before the cutoff"""
+        try:
+            return datetime.fromisoformat(str(value)) < cutoff
+        except (ValueError, TypeError):
+            return False
+
+    def _archive_sheet(self, sheet, is_cold, dry_run=False):
+        """Copy cold rows of a sheet to the archive, then delete them from the sheet.
+
+        The archive segments are written first; if deleting the rows fails the
+        segments are rolled back so a re-run does not archive them twice.
+        Rows are deleted by identity (ID, or the whole row for sheets without
+        one) after re-reading the sheet, so rows appended or moved meanwhile
+        are never deleted, and cold rows edited meanwhile stay in the sheet.
+        """
+        try:
+            if not sheet:
+                return {'success': False, 'error': 'Sheets not initialized'}
+
+            values = sheet.get_all_values()
+            if not values:
+                return {'success': True, 'archived': 0, 'remaining': 0}
+
+            headers = values[0]
+            cold_rows = [row for row in values[1:] if is_cold(dict(zip(headers, row)))]
+
+            result = {
+                'success': True,
+                'archived': len(cold_rows),
+                'remaining': len(values) - 1 - len(cold_rows)
+            }
+            if dry_run or not cold_rows:
+                return result
+
+            receipts = self.archive.append(sheet.title, headers, cold_rows,
+                                           SHEET_DATE_FIELDS[sheet.title])
+            try:
+                # Locate the archived rows again right before deleting them
+                cold_row_numbers, moved = self._locate_rows(sheet, headers, cold_rows)
+                if moved:
+                    # Some cold rows changed or vanished: archive only the rest
+                    self.archive.rollback(receipts)
+                    cold_rows = [row for row in cold_rows if self._row_key(headers, row) not in moved]
+                    result['remaining'] += result['archived'] - len(cold_rows)
+                    result['archived'] = len(cold_rows)
+                    if not cold_rows:
+                        return result
+                    receipts = self.archive.append(sheet.title, headers, cold_rows,
+                                                   SHEET_DATE_FIELDS[sheet.title])
+                self._delete_sheet_rows(sheet, cold_row_numbers)
+            except Exception:
+                self.archive.rollback(receipts)
+                raise
+            self.bump_version(sheet.title)
+
+            self.log_activity('Data Archived', f"Archived {len(cold_rows)} rows from {sheet.title}")
+
+            return result
+
+        except Exception as e:
+            print(f"Error archiving sheet: {e}")
+            return {'success': False, 'error': str(e)}
+
+    @staticmethod
+    def _row_key(headers, row):
+        """Identity of a sheet row: its ID, or the whole row when the sheet has no IDs"""
+        if headers and headers[0] == 'ID':
+            return row[0] if row else ''
+        return tuple(row)
+
+    def _locate_rows(self, sheet, headers, rows):
+        """(row numbers, keys not found unchanged) of rows in the sheet as it is now"""
+        wanted = {}
+        for row in rows:
+            wanted.setdefault(self._row_key(headers, row), []).append(row)
+
+        def padded(row, width):
+            return list(row) + [''] * (width - len(row))  # the API drops trailing blank cells
+
+        found = {}
+        for i, current in enumerate(sheet.get_all_values()[1:], start=2):
+            key = self._row_key(headers, current)
+            candidates = wanted.get(key)
+            if not candidates:
+                continue
+            width = max(len(current), len(candidates[0]))
+            if padded(current, width) == padded(candidates[0], width):
+                candidates.pop(0)
+                found.setdefault(key, []).append(i)
+
+        # Keys with a row that changed or went missing are left out entirely
+        moved = {key for key, remaining in wanted.items() if remaining}
+        numbers = [n for key, rows in found.items() if key not in moved for n in rows]
+        return numbers, moved
+
+    def _delete_sheet_rows(self, sheet, row_numbers):
+        """Delete the given rows in one batch request"""
+        # Group the rows into contiguous blocks and delete from the bottom up
+        # so earlier row numbers stay valid within the single batch request
+        blocks = []
+        for number in sorted(row_numbers):
+            if blocks and blocks[-1][1] == number - 1:
+                blocks[-1][1] = number
+            else:
+                blocks.append([number, number])
+
+        delete_ranges = [(first - 1, last) for first, last in blocks]
+
+        requests = [{
+            'deleteDimension': {
+                'range': {
+                    'sheetId': sheet.id,
+                    'dimension': 'ROWS',
+                    'startIndex': start_index,
+                    'endIndex': end_index
+                }
+            }
+        } for start_index, end_index in sorted(delete_ranges, reverse=True)]
+        if requests:
+            self.spreadsheet.batch_update({'requests': requests})
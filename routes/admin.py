@@ -3,11 +3,24 @@ Admin Routes - Complete Implementation
 Full CRUD operations for all business entities
 """
 
-from flask import Blueprint, render_template_string, request, redirect, url_for, flash, session, jsonify
+from flask import (Blueprint, Response, request, redirect, url_for, flash, abort,
+                   session, jsonify, stream_with_context, get_flashed_messages, make_response)
+from concurrent.futures import TimeoutError as RenderTimeout
 from datetime import datetime, timedelta
 from functools import wraps
+import csv
 import hashlib
-from modules.sheets_db import SheetsDatabase
+import json
+import os
+import threading
+import time
+from markupsafe import Markup
+from config import Config
+from modules import pricing, services
+from modules.proposals import PROPOSAL_FORMATS, ProposalBusy
+from utils.fragment_cache import fragment_cache
+from utils.template_cache import render_cached
+from utils.validators import validate_date
 
 # Create blueprint
 admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
@@ -19,7 +32,7 @@ def get_db():
     global _db_instance
     if _db_instance is None:
         try:
-            _db_instance = SheetsDatabase()
+            _db_instance = services.get_service('db')
         except Exception as e:
             print(f"Database connection failed: {e}")
             flash('Database connection failed. Please check your credentials.', 'error')
@@ -36,37 +49,254 @@ def admin_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+# Changes when this module (and so the page markup) is redeployed
+_PAGES_VERSION = str(int(os.path.getmtime(__file__)))
+
+def data_etag(*sheets):
+    """Decorator answering unchanged GETs with 304 based on sheet data versions.
+
+    The ETag covers the versions of the sheets the page reads, the admin
+    user, the full URL, today's date and a DATA_VERSION_MAX_AGE time bucket
+    (which picks up edits made directly in the spreadsheet). Pages showing
+    flash messages are never cached, and neither are pages whose sheet
+    reads failed: the view runs under strict reads, and if a read raises
+    it is rendered again as usual but sent without an ETag.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            db = get_db()
+            token = db.get_data_version(*sheets) if db else None
+            if token is None or session.get('_flashes'):
+                return f(*args, **kwargs)
+
+            max_age = Config.DATA_VERSION_MAX_AGE
+            parts = [token, session.get('admin_user', ''), request.full_path,
+                     datetime.now().date().isoformat(), _PAGES_VERSION,
+                     str(int(time.time() // max_age)) if max_age else '']
+            etag = hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+            if request.if_none_match.contains_weak(etag):
+                response = Response(status=304)
+            else:
+                try:
+                    with db.strict_reads():
+                        response = make_response(f(*args, **kwargs))
+                except Exception as e:
+                    # An empty list from a failed read must not be kept by the browser
+                    print(f"Not caching {request.path}: {e}")
+                    return f(*args, **kwargs)
+                if response.status_code != 200 or session.get('_flashes') or get_flashed_messages():
+                    return response
+
+            response.set_etag(etag, weak=True)
+            response.headers['Cache-Control'] = 'private, no-cache'
+            return response
+        return decorated_function
+    return decorator
+
+# ========== DASHBOARD WIDGETS ==========
+
+# Shown when a widget's data cannot be loaded
+EMPTY_WIDGET_CONTEXT = {
+    'stats': {
+        'total_customers': 0,
+        'jobs_today': 0,
+        'completed_today': 0,
+        'pending_quotes': 0,
+        'revenue_today': 0,
+        'revenue_month': 0,
+        'active_employees': 0,
+        'upcoming_jobs': 0
+    },
+    'jobs': [],
+    'quotes': []
+}
+
+# name -> (sheets it reads, loader returning the template context, template)
+DASHBOARD_WIDGETS = {
+    'customers_card': (
+        ('Customers',),
+        lambda db: {'stats': db.get_customer_stats()},
+        '''
+                <div class="bg-white p-6 rounded-lg shadow-md action-btn cursor-pointer" onclick="safeNavigate('/admin/customers')">
+                    <div class="text-gray-500 text-sm">Total Customers</div>
+                    <div class="text-4xl font-extrabold text-indigo-600">{{ stats.total_customers }}</div>
+                    <div class="text-sm text-indigo-500 mt-2">View all →</div>
+                </div>
+'''),
+    'jobs_cards': (
+        ('Jobs',),
+        lambda db: {'stats': db.get_job_stats()},
+        '''
+                <div class="bg-white p-6 rounded-lg shadow-md action-btn cursor-pointer" onclick="safeNavigate('/admin/schedule')">
+                    <div class="text-gray-500 text-sm">Jobs Today</div>
+                    <div class="text-4xl font-extrabold text-green-600">{{ stats.jobs_today }}</div>
+                    <div class="text-sm text-gray-600">Completed: <span data-live="completed_today">{{ stats.completed_today }}</span></div>
+                </div>
+                <div class="bg-white p-6 rounded-lg shadow-md action-btn cursor-pointer" onclick="safeNavigate('/admin/payments')">
+                    <div class="text-gray-500 text-sm">Revenue Today</div>
+                    <div class="text-4xl font-extrabold text-blue-600">$<span data-live="revenue_today">{{ "%.2f"|format(stats.revenue_today) }}</span></div>
+                    <div class="text-sm text-gray-600">This Month: $<span data-live="revenue_month">{{ "%.2f"|format(stats.revenue_month) }}</span></div>
+                </div>
+'''),
+    'quotes_card': (
+        ('Quotes',),
+        lambda db: {'stats': db.get_quote_stats()},
+        '''
+                <div class="bg-white p-6 rounded-lg shadow-md action-btn cursor-pointer" onclick="safeNavigate('/admin/quotes')">
+                    <div class="text-gray-500 text-sm">Pending Quotes</div>
+                    <div class="text-4xl font-extrabold text-orange-600" data-live="pending_quotes">{{ stats.pending_quotes }}</div>
+                    <div class="text-sm text-orange-500">View quotes →</div>
+                </div>
+'''),
+    'todays_jobs': (
+        ('Jobs',),
+        lambda db: {'jobs': db.get_jobs_for_date(datetime.now().strftime('%Y-%m-%d'))},
+        '''
+            <div class="bg-white rounded-lg shadow-md p-6">
+                <div class="flex justify-between items-center border-b pb-4 mb-4">
+                    <h2 class="text-xl font-bold">📋 Today's Jobs</h2>
+                    <a href="#" onclick="safeNavigate('/admin/jobs/add')" class="bg-indigo-500 text-white px-4 py-2 rounded-full text-sm hover:bg-indigo-600 transition-colors duration-200">Add Job</a>
+                </div>
+                {% if jobs %}
+                <table class="w-full">
+                    <thead>
+                        <tr class="text-left text-gray-600 text-sm">
+                            <th class="pb-2">Time</th>
+                            <th class="pb-2">Customer</th>
+                            <th class="pb-2">Employee</th>
+                            <th class="pb-2">Status</th>
+                            <th class="pb-2 text-right">Actions</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {% for job in jobs %}
+                        <tr class="border-t hover:bg-gray-50" data-job-id="{{ job.ID }}">
+                            <td class="py-3">{{ job.Time }}</td>
+                            <td class="py-3">{{ job.Customer_Name }}</td>
+                            <td class="py-3">{{ job.Employee or 'Unassigned' }}</td>
+                            <td class="py-3">
+                                <span class="px-2 py-1 rounded-full text-xs font-semibold
+                                    {% if job.Status == 'Completed' %}bg-green-100 text-green-800{% else %}bg-yellow-100 text-yellow-800{% endif %}" data-live="status">
+                                    {{ job.Status }}
+                                </span>
+                            </td>
+                            <td class="py-3 text-right space-x-2">
+                                <a href="#" onclick="safeNavigate('/admin/job/{{ job.ID }}/edit')" class="text-blue-600 hover:underline">Edit</a>
+                                {% if job.Status != 'Completed' %}
+                                <form method="POST" action="/admin/job/{{ job.ID }}/complete" style="display:inline;" data-live="complete">
+                                    <button type="submit" class="text-green-600 hover:underline">Complete</button>
+                                </form>
+                                {% endif %}
+                            </td>
+                        </tr>
+                        {% endfor %}
+                    </tbody>
+                </table>
+                {% else %}
+                <p class="text-gray-500 text-center py-4">No jobs scheduled for today. Time to find a new client!</p>
+                {% endif %}
+            </div>
+'''),
+    'pending_quotes': (
+        ('Quotes',),
+        lambda db: {'quotes': db.get_pending_quotes()[:5]},
+        '''
+            <div class="bg-white rounded-lg shadow-md p-6">
+                <div class="flex justify-between items-center border-b pb-4 mb-4">
+                    <h2 class="text-xl font-bold">💰 Pending Quotes</h2>
+                    <a href="#" onclick="safeNavigate('/admin/quotes')" class="text-indigo-600 text-sm hover:underline">View all →</a>
+                </div>
+                <table class="w-full">
+                    <tbody data-live="pending_quotes_list">
+                        {% for quote in quotes %}
+                        <tr class="border-t hover:bg-gray-50" data-quote-id="{{ quote.ID }}">
+                            <td class="py-3">{{ quote.Customer_Name }}</td>
+                            <td class="py-3 text-gray-600 text-sm">{{ (quote.Date_Created|string)[:10] }}</td>
+                            <td class="py-3 text-right font-semibold">${{ quote.Total_Amount }}</td>
+                        </tr>
+                        {% endfor %}
+                    </tbody>
+                </table>
+                <p class="text-gray-500 text-center py-4{% if quotes %} hidden{% endif %}" data-live="no_pending_quotes">No pending quotes.</p>
+            </div>
+'''),
+    'recent_jobs': (
+        ('Jobs',),
+        lambda db: {'jobs': db.get_recent_jobs(10)},
+        '''
+            <div class="bg-white rounded-lg shadow-md p-6">
+                <div class="flex justify-between items-center border-b pb-4 mb-4">
+                    <h2 class="text-xl font-bold">🧹 Recent Jobs</h2>
+                    <a href="#" onclick="safeNavigate('/admin/schedule')" class="text-indigo-600 text-sm hover:underline">Schedule →</a>
+                </div>
+                {% if jobs %}
+                <table class="w-full">
+                    <tbody>
+                        {% for job in jobs %}
+                        <tr class="border-t hover:bg-gray-50" data-job-id="{{ job.ID }}">
+                            <td class="py-3 text-gray-600 text-sm">{{ job.Date }}</td>
+                            <td class="py-3">{{ job.Customer_Name }}</td>
+                            <td class="py-3 text-sm" data-live="status">{{ job.Status }}</td>
+                            <td class="py-3 text-right font-semibold">${{ job.Total_Price }}</td>
+                        </tr>
+                        {% endfor %}
+                    </tbody>
+                </table>
+                {% else %}
+                <p class="text-gray-500 text-center py-4">No jobs yet.</p>
+                {% endif %}
+            </div>
+'''),
+}
+
+def render_widget(db, name):
+    """Render one dashboard widget through the fragment cache.
+
+    The cache key holds the data version of the sheets the widget reads and
+    today's date, so all admins share one rendering until one of those
+    sheets is written. Returns (html, ok); failures render the widget empty
+    and are not cached (the loader reads strictly, so a Sheets error raises
+    instead of looking like an empty sheet).
+    """
+    sheets, load, template = DASHBOARD_WIDGETS[name]
+
+    def render():
+        with db.strict_reads():
+            context = load(db)
+        return render_cached(template, **context)
+
+    try:
+        token = db.get_data_version(*sheets)
+        if token is None:
+            return Markup(render()), True
+        key = (name, token, datetime.now().date().isoformat())
+        return fragment_cache.get_or_render(key, render), True
+    except Exception as e:
+        print(f"Dashboard widget {name} error: {e}")
+        return Markup(render_cached(template, **EMPTY_WIDGET_CONTEXT)), False
+
 # ========== DASHBOARD ==========
 
 @admin_bp.route('/dashboard')
 @admin_required
+@data_etag('Quotes', 'Customers', 'Jobs', 'Employees')
 def dashboard():
     """Main admin dashboard with stats and quick actions"""
-    try:
-        db = get_db()
-        if not db:
-            return redirect('/admin-login')
+    db = get_db()
+    if not db:
+        return redirect('/admin-login')
 
-        stats = db.get_dashboard_stats()
-        todays_jobs = db.get_jobs_for_date(datetime.now().strftime('%Y-%m-%d'))
-        pending_quotes = db.get_pending_quotes()[:5]
-        recent_jobs = db.get_recent_jobs(10)
-    except Exception as e:
-        # Handle database errors gracefully
-        print(f"Dashboard error: {e}")
-        stats = {
-            'total_customers': 0,
-            'jobs_today': 0,
-            'completed_today': 0,
-            'pending_quotes': 0,
-            'revenue_today': 0,
-            'revenue_month': 0,
-            'active_employees': 0,
-            'upcoming_jobs': 0
-        }
-        todays_jobs = []
-        pending_quotes = []
-        recent_jobs = []
+    # Read before rendering, so the live stream replays anything written meanwhile
+    last_event_id = db.events.latest_id()
+
+    widgets = {}
+    failed = False
+    for name in DASHBOARD_WIDGETS:
+        widgets[name], ok = render_widget(db, name)
+        failed = failed or not ok
+    if failed:
         flash('Database connection issue. Please refresh the page.', 'warning')
     
     template = '''
@@ -122,26 +352,9 @@ def dashboard():
         <!-- Stats Grid -->
         <div class="container mx-auto mt-8 px-4">
             <div class="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6 mb-8">
-                <div class="bg-white p-6 rounded-lg shadow-md action-btn cursor-pointer" onclick="safeNavigate('/admin/customers')">
-                    <div class="text-gray-500 text-sm">Total Customers</div>
-                    <div class="text-4xl font-extrabold text-indigo-600">{{ stats.total_customers }}</div>
-                    <div class="text-sm text-indigo-500 mt-2">View all →</div>
-                </div>
-                <div class="bg-white p-6 rounded-lg shadow-md action-btn cursor-pointer" onclick="safeNavigate('/admin/schedule')">
-                    <div class="text-gray-500 text-sm">Jobs Today</div>
-                    <div class="text-4xl font-extrabold text-green-600">{{ stats.jobs_today }}</div>
-                    <div class="text-sm text-gray-600">Completed: {{ stats.completed_today }}</div>
-                </div>
-                <div class="bg-white p-6 rounded-lg shadow-md action-btn cursor-pointer" onclick="safeNavigate('/admin/payments')">
-                    <div class="text-gray-500 text-sm">Revenue Today</div>
-                    <div class="text-4xl font-extrabold text-blue-600">${{ "%.2f"|format(stats.revenue_today) }}</div>
-                    <div class="text-sm text-gray-600">This Month: ${{ "%.2f"|format(stats.revenue_month) }}</div>
-                </div>
-                <div class="bg-white p-6 rounded-lg shadow-md action-btn cursor-pointer" onclick="safeNavigate('/admin/quotes')">
-                    <div class="text-gray-500 text-sm">Pending Quotes</div>
-                    <div class="text-4xl font-extrabold text-orange-600">{{ stats.pending_quotes }}</div>
-                    <div class="text-sm text-orange-500">View quotes →</div>
-                </div>
+                {{ widgets.customers_card }}
+                {{ widgets.jobs_cards }}
+                {{ widgets.quotes_card }}
             </div>
 
             <!-- Quick Actions -->
@@ -156,63 +369,229 @@ def dashboard():
             </div>
 
             <!-- Today's Jobs -->
-            <div class="bg-white rounded-lg shadow-md p-6">
-                <div class="flex justify-between items-center border-b pb-4 mb-4">
-                    <h2 class="text-xl font-bold">📋 Today's Jobs</h2>
-                    <a href="#" onclick="safeNavigate('/admin/jobs/add')" class="bg-indigo-500 text-white px-4 py-2 rounded-full text-sm hover:bg-indigo-600 transition-colors duration-200">Add Job</a>
-                </div>
-                {% if todays_jobs %}
-                <table class="w-full">
-                    <thead>
-                        <tr class="text-left text-gray-600 text-sm">
-                            <th class="pb-2">Time</th>
-                            <th class="pb-2">Customer</th>
-                            <th class="pb-2">Employee</th>
-                            <th class="pb-2">Status</th>
-                            <th class="pb-2 text-right">Actions</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {% for job in todays_jobs %}
-                        <tr class="border-t hover:bg-gray-50">
-                            <td class="py-3">{{ job.Time }}</td>
-                            <td class="py-3">{{ job.Customer_Name }}</td>
-                            <td class="py-3">{{ job.Employee or 'Unassigned' }}</td>
-                            <td class="py-3">
-                                <span class="px-2 py-1 rounded-full text-xs font-semibold
-                                    {% if job.Status == 'Completed' %}bg-green-100 text-green-800{% else %}bg-yellow-100 text-yellow-800{% endif %}">
-                                    {{ job.Status }}
-                                </span>
-                            </td>
-                            <td class="py-3 text-right space-x-2">
-                                <a href="#" onclick="safeNavigate('/admin/job/{{ job.ID }}/edit')" class="text-blue-600 hover:underline">Edit</a>
-                                {% if job.Status != 'Completed' %}
-                                <form method="POST" action="/admin/job/{{ job.ID }}/complete" style="display:inline;">
-                                    <button type="submit" class="text-green-600 hover:underline">Complete</button>
-                                </form>
-                                {% endif %}
-                            </td>
-                        </tr>
-                        {% endfor %}
-                    </tbody>
-                </table>
-                {% else %}
-                <p class="text-gray-500 text-center py-4">No jobs scheduled for today. Time to find a new client!</p>
-                {% endif %}
+            {{ widgets.todays_jobs }}
+
+            <div class="grid grid-cols-1 lg:grid-cols-2 gap-6 mt-8 mb-8">
+                <!-- Pending Quotes -->
+                {{ widgets.pending_quotes }}
+
+                <!-- Recent Jobs -->
+                {{ widgets.recent_jobs }}
             </div>
         </div>
+
+        <script>
+            // Live updates: apply data change events in place instead of reloading.
+            // Streams when the server has a free slot, polls otherwise.
+            (function () {
+                const today = '{{ today }}';
+                const handlers = {};
+                let lastId = {{ last_event_id }};
+                let source = null;
+
+                function dispatch(type, data, id) {
+                    if (id <= lastId) return;
+                    lastId = id;
+                    if (handlers[type]) handlers[type](data);
+                }
+
+                function poll() {
+                    fetch('/admin/events/poll?last_id=' + lastId, { credentials: 'same-origin' })
+                        .then(function (response) { return response.ok ? response.json() : null; })
+                        .then(function (result) {
+                            if (result) result.events.forEach(function (e) { dispatch(e.type, e.data, e.id); });
+                            const seconds = result ? result.poll_seconds : {{ poll_seconds }};
+                            setTimeout(poll, result && result.more ? 0 : seconds * 1000);
+                        })
+                        .catch(function () { setTimeout(poll, {{ poll_seconds }} * 1000); });
+                }
+
+                function stream() {
+                    source = new EventSource('/admin/events?last_id=' + lastId);
+                    Object.keys(handlers).forEach(function (type) {
+                        source.addEventListener(type, function (e) {
+                            dispatch(type, JSON.parse(e.data), parseInt(e.lastEventId, 10));
+                        });
+                    });
+                    source.onerror = function () {
+                        // A refused stream (503) is closed for good: poll instead
+                        if (source.readyState === EventSource.CLOSED) poll();
+                    };
+                }
+
+                function live(name, root) {
+                    return (root || document).querySelector('[data-live="' + name + '"]');
+                }
+                function add(name, delta, decimals) {
+                    const el = live(name);
+                    if (el) el.textContent = ((parseFloat(el.textContent) || 0) + delta).toFixed(decimals || 0);
+                }
+                function on(type, handler) {
+                    handlers[type] = handler;
+                }
+                function setJobStatus(job) {
+                    document.querySelectorAll('[data-job-id="' + job.ID + '"]').forEach(function (row) {
+                        const status = live('status', row);
+                        if (status) status.textContent = job.Status;
+                        const complete = live('complete', row);
+                        if (complete && job.Status === 'completed') complete.remove();
+                    });
+                }
+
+                on('quote_created', function (quote) {
+                    const list = live('pending_quotes_list');
+                    if (quote.Status !== 'pending' || document.querySelector('[data-quote-id="' + quote.ID + '"]')) return;
+                    add('pending_quotes', 1);
+                    if (!list) return;
+                    const row = list.insertRow(0);
+                    row.className = 'border-t hover:bg-gray-50';
+                    row.dataset.quoteId = quote.ID;
+                    [quote.Customer_Name, String(quote.Date_Created).slice(0, 10), '$' + quote.Total_Amount].forEach(function (text, i) {
+                        const cell = row.insertCell();
+                        cell.className = ['py-3', 'py-3 text-gray-600 text-sm', 'py-3 text-right font-semibold'][i];
+                        cell.textContent = text;
+                    });
+                    while (list.rows.length > 5) list.deleteRow(-1);
+                    live('no_pending_quotes').classList.add('hidden');
+                });
+
+                on('quote_status_changed', function (quote) {
+                    if (quote.Previous_Status === 'pending' && quote.Status !== 'pending') {
+                        add('pending_quotes', -1);
+                        const row = document.querySelector('[data-quote-id="' + quote.ID + '"]');
+                        if (row) row.remove();
+                        const list = live('pending_quotes_list');
+                        if (list && !list.rows.length) live('no_pending_quotes').classList.remove('hidden');
+                    } else if (quote.Status === 'pending' && quote.Previous_Status !== 'pending') {
+                        add('pending_quotes', 1);
+                    }
+                });
+
+                on('job_checked_in', setJobStatus);
+
+                on('job_completed', function (job) {
+                    setJobStatus(job);
+                    if (job.Previous_Status === 'completed') return;
+                    const price = parseFloat(job.Total_Price) || 0;
+                    if (job.Date === today) {
+                        add('completed_today', 1);
+                        add('revenue_today', price, 2);
+                    }
+                    if (String(job.Date).slice(0, 7) === today.slice(0, 7)) add('revenue_month', price, 2);
+                });
+
+                if (window.EventSource && {{ 'true' if streaming else 'false' }}) stream(); else poll();
+            })();
+        </script>
     </body>
     </html>
     '''
     
     from flask import get_flashed_messages
-    return render_template_string(template, stats=stats, todays_jobs=todays_jobs, 
-                                 pending_quotes=pending_quotes, get_flashed_messages=get_flashed_messages)
+    return render_cached(template, widgets=widgets, get_flashed_messages=get_flashed_messages,
+                         last_event_id=last_event_id, today=datetime.now().date().isoformat(),
+                         streaming=Config.EVENT_STREAM_MAX_CONNECTIONS > 0,
+                         poll_seconds=Config.EVENT_POLL_SECONDS)
+
+# ========== LIVE EVENTS ==========
+
+def format_event(event):
+    """One Server-Sent Events message"""
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event['data'], default=str)}\n\n"
+
+# Request threads this worker lets event streams hold at once
+_stream_slots = threading.BoundedSemaphore(max(Config.EVENT_STREAM_MAX_CONNECTIONS, 1))
+
+# Events returned per poll request
+EVENT_POLL_LIMIT = 200
+
+def event_stream(events, last_id):
+    """Yield events newer than last_id as they are published.
+
+    Comments keep idle connections alive through proxies, and the stream
+    ends after EVENT_STREAM_MAX_AGE seconds so it does not hold a worker
+    for long; the browser reconnects with Last-Event-ID and misses nothing.
+    """
+    yield 'retry: 3000\n\n'
+    started = time.monotonic()
+    while time.monotonic() - started < Config.EVENT_STREAM_MAX_AGE:
+        batch = events.wait(last_id, Config.EVENT_STREAM_KEEPALIVE)
+        for event in batch:
+            last_id = event['id']
+            yield format_event(event)
+        if not batch:
+            yield ': keepalive\n\n'
+
+@admin_bp.route('/events')
+@admin_required
+def events():
+    """Server-Sent Events stream of data changes for the live dashboard.
+
+    Each open stream holds a request thread, so a worker serves at most
+    EVENT_STREAM_MAX_CONNECTIONS at once. Past that it answers 503, which
+    closes the browser's EventSource; the dashboard then polls
+    /admin/events/poll instead.
+    """
+    db = get_db()
+    if not db:
+        return Response(status=503)
+
+    last_id = requested_event_id(db)
+    if Config.EVENT_STREAM_MAX_CONNECTIONS <= 0 or not _stream_slots.acquire(blocking=False):
+        retry_ms = Config.EVENT_POLL_SECONDS * 1000
+        return Response(f'retry: {retry_ms}\n\n', status=503, mimetype='text/event-stream',
+                        headers={'Retry-After': str(Config.EVENT_POLL_SECONDS),
+                                 'Cache-Control': 'no-cache'})
+
+    released = []
+    def release():
+        if not released:
+            released.append(True)
+            _stream_slots.release()
+
+    try:
+        response = Response(event_stream(db.events, last_id), mimetype='text/event-stream')
+    except Exception:
+        release()
+        raise
+    # Runs when the server closes the response, however the stream ended
+    response.call_on_close(release)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
+
+@admin_bp.route('/events/poll')
+@admin_required
+def poll_events():
+    """Events newer than last_id as JSON, for dashboards that cannot stream"""
+    db = get_db()
+    if not db:
+        return jsonify({'error': 'Database connection failed'}), 503
+
+    last_id = requested_event_id(db)
+    batch = db.events.since(last_id, EVENT_POLL_LIMIT)
+    return jsonify({
+        'events': [{'id': e['id'], 'type': e['type'], 'data': e['data']} for e in batch],
+        'last_id': batch[-1]['id'] if batch else last_id,
+        'more': len(batch) == EVENT_POLL_LIMIT,
+        'poll_seconds': Config.EVENT_POLL_SECONDS
+    })
+
+def requested_event_id(db):
+    """Last event ID the client saw (Last-Event-ID header or last_id), clamped to the log"""
+    latest = db.events.latest_id()
+    try:
+        last_id = int(request.headers.get('Last-Event-ID') or request.args.get('last_id', latest))
+    except ValueError:
+        last_id = latest
+    # The event log was reset since the client last saw it
+    return min(last_id, latest)
 
 # ========== CUSTOMER MANAGEMENT ==========
 
 @admin_bp.route('/customers')
 @admin_required
+@data_etag('Customers')
 def customers():
     """List all customers with search and actions"""
     db = get_db()
@@ -294,7 +673,7 @@ def customers():
     </html>
     '''
     
-    return render_template_string(template, customers=customers)
+    return render_cached(template, customers=customers)
 
 @admin_bp.route('/customers/add', methods=['GET', 'POST'])
 @admin_required
@@ -410,7 +789,7 @@ def add_customer():
     </html>
     '''
     
-    return render_template_string(template)
+    return render_cached(template)
 
 @admin_bp.route('/customer/<customer_id>/edit', methods=['GET', 'POST'])
 @admin_required
@@ -532,7 +911,7 @@ def edit_customer(customer_id):
     </html>
     '''
     
-    return render_template_string(template, customer=customer)
+    return render_cached(template, customer=customer)
 
 @admin_bp.route('/customer/<customer_id>/delete', methods=['POST'])
 @admin_required
@@ -554,6 +933,7 @@ def delete_customer(customer_id):
 
 @admin_bp.route('/employees')
 @admin_required
+@data_etag('Employees')
 def employees():
     """List all employees"""
     db = get_db()
@@ -630,7 +1010,7 @@ def employees():
     </html>
     '''
     
-    return render_template_string(template, employees=employees)
+    return render_cached(template, employees=employees)
 
 @admin_bp.route('/employees/add', methods=['GET', 'POST'])
 @admin_required
@@ -716,7 +1096,7 @@ def add_employee():
     </html>
     '''
     
-    return render_template_string(template)
+    return render_cached(template)
 
 @admin_bp.route('/employee/<employee_id>/toggle', methods=['POST'])
 @admin_required
@@ -742,6 +1122,7 @@ def toggle_employee(employee_id):
 
 @admin_bp.route('/schedule')
 @admin_required
+@data_etag('Jobs')
 def schedule():
     """View job schedule"""
     db = get_db()
@@ -846,7 +1227,7 @@ def schedule():
     </html>
     '''
     
-    return render_template_string(template, week_dates=week_dates, week_jobs=week_jobs, all_jobs=all_jobs)
+    return render_cached(template, week_dates=week_dates, week_jobs=week_jobs, all_jobs=all_jobs)
 
 @admin_bp.route('/jobs/add', methods=['GET', 'POST'])
 @admin_required
@@ -958,7 +1339,7 @@ def add_job():
     </html>
     '''
     
-    return render_template_string(template, customers=customers, employees=employees, 
+    return render_cached(template, customers=customers, employees=employees, 
                                  selected_customer=selected_customer, datetime=datetime)
 
 @admin_bp.route('/job/<job_id>/complete', methods=['POST'])
@@ -970,7 +1351,7 @@ def complete_job(job_id):
         flash('Database connection failed.', 'error')
         return redirect('/admin/schedule')
     
-    if db.complete_job(job_id):
+    if db.complete_job(job_id).get('success'):
         flash('Job marked as completed!', 'success')
     else:
         flash('Error completing job', 'error')
@@ -981,6 +1362,7 @@ def complete_job(job_id):
 
 @admin_bp.route('/quotes')
 @admin_required
+@data_etag('Quotes')
 def quotes():
     """View all quotes"""
     db = get_db()
@@ -1039,6 +1421,12 @@ def quotes():
                             </td>
                             <td class="py-3 text-right space-x-2">
                                 <a href="/admin/quote/{{ quote.ID }}/edit" class="text-blue-600 hover:underline">Edit</a>
+                                <a href="/admin/quote/{{ quote.ID }}/proposal.pdf" target="_blank" class="text-purple-600 hover:underline">Proposal</a>
+                                {% if quote.Customer_Email %}
+                                <form method="POST" action="/admin/quote/{{ quote.ID }}/send-proposal" style="display:inline;">
+                                    <button type="submit" class="text-purple-600 hover:underline">Send</button>
+                                </form>
+                                {% endif %}
                                 {% if quote.Status == 'pending' %}
                                 <form method="POST" action="/admin/quote/{{ quote.ID }}/convert" style="display:inline;">
                                     <button type="submit" class="text-green-600 hover:underline">Convert</button>
@@ -1058,7 +1446,7 @@ def quotes():
     </html>
     '''
     
-    return render_template_string(template, quotes=quotes)
+    return render_cached(template, quotes=quotes)
 
 @admin_bp.route('/quote/<quote_id>/convert', methods=['POST'])
 @admin_required
@@ -1069,18 +1457,80 @@ def convert_quote(quote_id):
         flash('Database connection failed.', 'error')
         return redirect('/admin/quotes')
     
-    customer_id = db.convert_quote(quote_id)
-    if customer_id:
+    result = db.convert_quote(quote_id)
+    if result.get('success'):
         flash('Quote converted to customer successfully!', 'success')
-        return redirect(f'/admin/jobs/add?customer={customer_id}')
+        return redirect(f'/admin/jobs/add?customer={result["customer_id"]}')
     else:
-        flash('Error converting quote', 'error')
+        flash(f'Error converting quote: {result.get("error")}', 'error')
+        return redirect('/admin/quotes')
+
+# ========== QUOTE PROPOSALS ==========
+
+def proposal_response(quote, fmt, download=False):
+    """A quote's proposal (a Quotes row dict) as a response, from the renderer's cache when unchanged"""
+    try:
+        content, digest = services.get_service('proposals').get(quote, fmt)
+    except (ProposalBusy, RenderTimeout):
+        return Response('Proposal is being prepared, please try again in a moment', status=503,
+                        headers={'Retry-After': '5'}, mimetype='text/plain')
+    
+    response = Response(content, mimetype=PROPOSAL_FORMATS[fmt])
+    response.set_etag(digest)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    if fmt == 'pdf':
+        disposition = 'attachment' if download else 'inline'
+        response.headers['Content-Disposition'] = f'{disposition}; filename="proposal-{quote.get("ID")}.pdf"'
+    return response.make_conditional(request)
+
+@admin_bp.route('/quote/<quote_id>/proposal.<fmt>')
+@admin_required
+def quote_proposal(quote_id, fmt):
+    """View a quote's proposal as the customer gets it"""
+    db = get_db()
+    if not db:
+        return redirect('/admin-login')
+    if fmt not in PROPOSAL_FORMATS:
+        abort(404)
+    
+    quote = db.get_quote_by_id(quote_id)
+    if not quote:
+        flash('Quote not found', 'error')
         return redirect('/admin/quotes')
+    return proposal_response(quote, fmt, download=request.args.get('download') == '1')
+
+@admin_bp.route('/quote/<quote_id>/send-proposal', methods=['POST'])
+@admin_required
+def send_quote_proposal(quote_id):
+    """Email a quote's PDF proposal to the customer"""
+    db = get_db()
+    if not db:
+        flash('Database connection failed.', 'error')
+        return redirect('/admin/quotes')
+    
+    quote = db.get_quote_by_id(quote_id)
+    if not quote or not quote.get('Customer_Email'):
+        flash('Quote not found or has no customer email', 'error')
+        return redirect('/admin/quotes')
+    
+    try:
+        content, _ = services.get_service('proposals').get(quote, 'pdf')
+    except (ProposalBusy, RenderTimeout):
+        flash('The proposal is still being prepared, please try again in a moment', 'warning')
+        return redirect('/admin/quotes')
+    
+    if services.get_service('email').send_proposal(quote, content):
+        db.log_activity('Proposal Sent', f"Proposal for quote {quote_id} sent to {quote['Customer_Email']}")
+        flash(f'Proposal sent to {quote["Customer_Email"]}', 'success')
+    else:
+        flash('Error sending proposal email', 'error')
+    return redirect('/admin/quotes')
 
 # ========== PAYMENTS ==========
 
 @admin_bp.route('/payments')
 @admin_required
+@data_etag('Payments')
 def payments():
     """View all payments"""
     db = get_db()
@@ -1147,7 +1597,7 @@ def payments():
     </html>
     '''
     
-    return render_template_string(template, payments=payments)
+    return render_cached(template, payments=payments)
 
 @admin_bp.route('/payments/add', methods=['GET', 'POST'])
 @admin_required
@@ -1232,8 +1682,92 @@ def add_payment():
     </html>
     '''
     
-    return render_template_string(template, customers=customers)
+    return render_cached(template, customers=customers)
     
+# ========== EXPORTS ==========
+
+# Export name -> sheet title
+EXPORT_SHEETS = {
+    'quotes': 'Quotes',
+    'customers': 'Customers',
+    'jobs': 'Jobs',
+    'payments': 'Payments',
+    'activity': 'Activity_Log'
+}
+
+class _LineBuffer:
+    """File-like object that hands back what csv.writer writes to it"""
+    def write(self, value):
+        return value
+
+# Leading characters a spreadsheet app reads as the start of a formula
+FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+def csv_safe(value):
+    """Cell value with text that would open as a formula quoted with a leading '"""
+    if isinstance(value, str) and value.startswith(FORMULA_PREFIXES):
+        try:
+            float(value)  # plain numbers such as -12.50 stay numbers
+        except ValueError:
+            return "'" + value
+    return value
+
+@admin_bp.route('/export/<entity>')
+@admin_required
+def export(entity):
+    """Stream a sheet as CSV or NDJSON without loading it into memory.
+
+    Query parameters: format (csv or ndjson), start and end (YYYY-MM-DD,
+    inclusive), status, and archived=1 to include archived quotes/log entries.
+    """
+    title = EXPORT_SHEETS.get(entity)
+    if not title:
+        return jsonify({'error': f'Unknown export: {entity}'}), 404
+
+    export_format = request.args.get('format', 'csv')
+    start = request.args.get('start') or None
+    end = request.args.get('end') or None
+    status = request.args.get('status') or None
+    include_archived = request.args.get('archived') == '1'
+
+    if export_format not in ('csv', 'ndjson'):
+        return jsonify({'error': 'format must be csv or ndjson'}), 400
+    for value in (start, end):
+        if value and not validate_date(value):
+            return jsonify({'error': f'Invalid date: {value}'}), 400
+
+    db = get_db()
+    if not db:
+        return jsonify({'error': 'Database connection failed'}), 503
+
+    try:
+        headers = db.get_headers(title)
+    except Exception as e:
+        print(f"Export error: {e}")
+        return jsonify({'error': f'Sheet {title} is not available'}), 404
+
+    records = db.iter_records(title, start=start, end=end, status=status,
+                              include_archived=include_archived)
+
+    def generate_csv():
+        writer = csv.writer(_LineBuffer())
+        yield writer.writerow(headers)
+        for record in records:
+            yield writer.writerow([csv_safe(record.get(h, '')) for h in headers])
+
+    def generate_ndjson():
+        for record in records:
+            yield json.dumps(record, ensure_ascii=False) + '\n'
+
+    filename = f"{entity}-{datetime.now().strftime('%Y%m%d')}.{export_format}"
+    if export_format == 'csv':
+        body, mimetype = generate_csv(), 'text/csv'
+    else:
+        body, mimetype = generate_ndjson(), 'application/x-ndjson'
+
+    return Response(stream_with_context(body), mimetype=mimetype,
+                    headers={'Content-Disposition': f'attachment; filename={filename}'})
+
 # ========== MISSING ROUTES ==========
 
 @admin_bp.route('/job/<job_id>/edit', methods=['GET', 'POST'])
@@ -1361,7 +1895,7 @@ def edit_job(job_id):
     </html>
     '''
     
-    return render_template_string(template, job=job, employees=employees)
+    return render_cached(template, job=job, employees=employees)
 
 @admin_bp.route('/employee/<employee_id>/edit', methods=['GET', 'POST'])
 @admin_required
@@ -1479,39 +2013,80 @@ def edit_employee(employee_id):
     </html>
     '''
     
-    return render_template_string(template, employee=employee)
+    return render_cached(template, employee=employee)
+
+# Statuses offered when editing a quote
+QUOTE_EDIT_STATUSES = ('pending', 'contacted', 'accepted', 'converted', 'declined', 'expired', 'cancelled')
 
 @admin_bp.route('/quote/<quote_id>/edit', methods=['GET', 'POST'])
 @admin_required
 def edit_quote(quote_id):
-    """Edit quote - including price adjustment"""
+    """Edit quote - re-priced by the pricing engine, with an optional price adjustment"""
     db = get_db()
     if not db:
         return redirect('/admin-login')
 
-    quotes = db.get_all_quotes()
-    quote = next((q for q in quotes if q['ID'] == quote_id), None)
+    quote = db.get_quote_by_id(quote_id)
     
     if not quote:
         flash('Quote not found', 'error')
         return redirect('/admin/quotes')
     
+    rules = pricing.get_rules()
+    current = pricing.quote_input_from_record(quote, rules)
+    
     if request.method == 'POST':
-        # Update quote directly in sheets
-        for idx, q in enumerate(quotes, start=2):
-            if q['ID'] == quote_id:
-                db.quotes.update_cell(idx, 2, request.form.get('name'))  # Name
-                db.quotes.update_cell(idx, 3, request.form.get('email'))  # Email
-                db.quotes.update_cell(idx, 4, request.form.get('phone'))  # Phone
-                db.quotes.update_cell(idx, 5, request.form.get('property_type'))  # Property_Type
-                db.quotes.update_cell(idx, 6, request.form.get('square_feet'))  # Square_Feet
-                db.quotes.update_cell(idx, 7, request.form.get('service_type'))  # Service_Type
-                db.quotes.update_cell(idx, 8, request.form.get('price'))  # Calculated_Price
-                db.quotes.update_cell(idx, 10, request.form.get('status'))  # Status
-                db.quotes.update_cell(idx, 13, request.form.get('notes'))  # Notes
-                break
+        try:
+            quote_in = pricing.quote_input(
+                property_type=request.form.get('property_type'),
+                sqft=request.form.get('square_feet') or 0,
+                frequency=request.form.get('frequency'),
+                services=request.form.getlist('services'),
+                bathrooms=request.form.get('bathrooms') or 0,
+                service_type=request.form.get('service_type'),
+                miles=current.miles
+            )
+            breakdown = rules.price(quote_in)
+            override = request.form.get('price', '').strip()
+            if override:
+                breakdown = rules.with_total(breakdown, float(override))
+        except ValueError as e:
+            flash(f'Invalid quote details: {e}', 'error')
+            return redirect(f'/admin/quote/{quote_id}/edit')
+        
+        try:
+            properties = json.loads(quote.get('Properties') or '[]')
+        except ValueError:
+            properties = []
+        prop = properties[0] if properties and isinstance(properties[0], dict) else {'id': 1}
+        prop.update({'name': f"{quote_in.property_type.title()} Property",
+                     'facilityType': quote_in.property_type, 'squareFeet': quote_in.sqft,
+                     'restrooms': quote_in.bathrooms})
+        prop.pop('type', None)
+        prop.pop('sqft', None)
+        materials, services_data = pricing.catalog_entries(quote_in)
         
-        flash(f'Quote updated successfully! New price: ${request.form.get("price")}', 'success')
+        changes = {
+            'Customer_Name': request.form.get('name', '').strip(),
+            'Customer_Email': request.form.get('email', '').strip(),
+            'Customer_Phone': request.form.get('phone', '').strip(),
+            'Properties': [prop] + properties[1:],
+            'Materials': materials,
+            'Services': services_data,
+            'Status': request.form.get('status') or quote.get('Status', 'pending'),
+            'Notes': request.form.get('notes', ''),
+            'Follow_Up_Date': request.form.get('follow_up_date', '').strip(),
+            'Service_Type': quote_in.service_type,
+            'Frequency': quote_in.frequency
+        }
+        changes.update(breakdown.sheet_fields())
+        
+        result = db.update_quote(quote_id, changes)
+        if result.get('success'):
+            services.get_service('proposals').prefetch(result['quote'])
+            flash(f'Quote updated successfully! New price: ${breakdown.total_amount:,.2f}', 'success')
+        else:
+            flash(f'Error updating quote: {result.get("error")}', 'error')
         return redirect('/admin/quotes')
     
     template = '''
@@ -1535,28 +2110,27 @@ def edit_quote(quote_id):
                         <div>
                             <label class="block text-sm font-medium text-gray-700">Status</label>
                             <select name="status" class="mt-1 block w-full border border-gray-300 rounded-lg shadow-sm p-2">
-                                <option value="pending" {% if quote.Status == 'pending' %}selected{% endif %}>Pending</option>
-                                <option value="contacted" {% if quote.Status == 'contacted' %}selected{% endif %}>Contacted</option>
-                                <option value="converted" {% if quote.Status == 'converted' %}selected{% endif %}>Converted</option>
-                                <option value="lost" {% if quote.Status == 'lost' %}selected{% endif %}>Lost</option>
+                                {% for status in statuses %}
+                                <option value="{{ status }}" {% if quote.Status == status %}selected{% endif %}>{{ status|title }}</option>
+                                {% endfor %}
                             </select>
                         </div>
                         
                         <div>
                             <label class="block text-sm font-medium text-gray-700">Name</label>
-                            <input type="text" name="name" value="{{ quote.Name }}" required
+                            <input type="text" name="name" value="{{ quote.Customer_Name }}" required
                                 class="mt-1 block w-full border border-gray-300 rounded-lg shadow-sm p-2">
                         </div>
                         
                         <div class="grid grid-cols-1 md:grid-cols-2 gap-4">
                             <div>
                                 <label class="block text-sm font-medium text-gray-700">Email</label>
-                                <input type="email" name="email" value="{{ quote.Email }}" required
+                                <input type="email" name="email" value="{{ quote.Customer_Email }}" required
                                     class="mt-1 block w-full border border-gray-300 rounded-lg shadow-sm p-2">
                             </div>
                             <div>
                                 <label class="block text-sm font-medium text-gray-700">Phone</label>
-                                <input type="tel" name="phone" value="{{ quote.Phone }}" required
+                                <input type="tel" name="phone" value="{{ quote.Customer_Phone }}"
                                     class="mt-1 block w-full border border-gray-300 rounded-lg shadow-sm p-2">
                             </div>
                         </div>
@@ -1565,31 +2139,66 @@ def edit_quote(quote_id):
                             <div>
                                 <label class="block text-sm font-medium text-gray-700">Property Type</label>
                                 <select name="property_type" class="mt-1 block w-full border border-gray-300 rounded-lg shadow-sm p-2">
-                                    <option value="office" {% if quote.Property_Type == 'office' %}selected{% endif %}>Office</option>
-                                    <option value="retail" {% if quote.Property_Type == 'retail' %}selected{% endif %}>Retail</option>
-                                    <option value="medical" {% if quote.Property_Type == 'medical' %}selected{% endif %}>Medical</option>
-                                    <option value="restaurant" {% if quote.Property_Type == 'restaurant' %}selected{% endif %}>Restaurant</option>
+                                    {% for value in rules.property_types %}
+                                    <option value="{{ value }}" {% if current.property_type == value %}selected{% endif %}>{{ value|title }}</option>
+                                    {% endfor %}
                                 </select>
                             </div>
                             <div>
                                 <label class="block text-sm font-medium text-gray-700">Square Feet</label>
-                                <input type="number" name="square_feet" value="{{ quote.Square_Feet }}" required
+                                <input type="number" name="square_feet" value="{{ current.sqft|int }}" min="0" required
+                                    class="mt-1 block w-full border border-gray-300 rounded-lg shadow-sm p-2">
+                            </div>
+                            <div>
+                                <label class="block text-sm font-medium text-gray-700">Bathrooms</label>
+                                <input type="number" name="bathrooms" value="{{ current.bathrooms }}" min="0"
                                     class="mt-1 block w-full border border-gray-300 rounded-lg shadow-sm p-2">
                             </div>
+                        </div>
+                        
+                        <div class="grid grid-cols-1 md:grid-cols-2 gap-4">
                             <div>
                                 <label class="block text-sm font-medium text-gray-700">Service Type</label>
                                 <select name="service_type" class="mt-1 block w-full border border-gray-300 rounded-lg shadow-sm p-2">
-                                    <option value="weekly" {% if quote.Service_Type == 'weekly' %}selected{% endif %}>Weekly</option>
-                                    <option value="biweekly" {% if quote.Service_Type == 'biweekly' %}selected{% endif %}>Bi-Weekly</option>
-                                    <option value="monthly" {% if quote.Service_Type == 'monthly' %}selected{% endif %}>Monthly</option>
+                                    {% for value in rules.service_types %}
+                                    <option value="{{ value }}" {% if current.service_type == value %}selected{% endif %}>{{ value|replace('-', ' ')|title }}</option>
+                                    {% endfor %}
+                                </select>
+                            </div>
+                            <div>
+                                <label class="block text-sm font-medium text-gray-700">Frequency</label>
+                                <select name="frequency" class="mt-1 block w-full border border-gray-300 rounded-lg shadow-sm p-2">
+                                    {% for value in rules.frequencies %}
+                                    <option value="{{ value }}" {% if current.frequency == value %}selected{% endif %}>{{ value|replace('-', ' ')|title }}</option>
+                                    {% endfor %}
                                 </select>
                             </div>
                         </div>
                         
                         <div>
-                            <label class="block text-sm font-medium text-gray-700">💰 Quote Price (Fully Editable!)</label>
-                            <input type="number" name="price" value="{{ quote.Calculated_Price }}" step="0.01" required
+                            <label class="block text-sm font-medium text-gray-700">Services</label>
+                            <div class="mt-1 grid grid-cols-2 md:grid-cols-3 gap-2">
+                                {% for value in service_keys %}
+                                <label class="flex items-center space-x-2">
+                                    <input type="checkbox" name="services" value="{{ value }}" {% if value in current.services %}checked{% endif %}>
+                                    <span>{{ value|title }}</span>
+                                </label>
+                                {% endfor %}
+                            </div>
+                        </div>
+                        
+                        <div>
+                            <label class="block text-sm font-medium text-gray-700">💰 Quote Price (leave blank to use the calculated price)</label>
+                            <input type="number" name="price" value="" step="0.01" min="0" placeholder="{{ '%.2f'|format(calculated.total_amount) }}"
                                 class="mt-1 block w-full border border-yellow-300 rounded-lg shadow-sm p-2 bg-yellow-50 text-xl font-bold">
+                            <p class="text-sm text-gray-500 mt-1">Saved total: ${{ quote.Total_Amount }} · calculated now: ${{ '%.2f'|format(calculated.total_amount) }} (rules {{ rules.version }})</p>
+                        </div>
+                        
+                        <div>
+                            <label class="block text-sm font-medium text-gray-700">Follow-up date</label>
+                            <input type="date" name="follow_up_date" value="{{ (quote.Follow_Up_Date or '')|string|truncate(10, True, '', 0) }}"
+                                class="mt-1 block w-full border border-gray-300 rounded-lg shadow-sm p-2">
+                            <p class="text-sm text-gray-500 mt-1">Valid until {{ quote.Valid_Until or '—' }}; pending quotes expire after that date.</p>
                         </div>
                         
                         <div>
@@ -1610,4 +2219,6 @@ def edit_quote(quote_id):
     </html>
     '''
     
-    return render_template_string(template, quote=quote)
+    return render_cached(template, quote=quote, current=current, rules=rules,
+                         calculated=rules.price(current), service_keys=list(pricing.SERVICE_IDS),
+                         statuses=QUOTE_EDIT_STATUSES)
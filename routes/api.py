@@ -0,0 +1,226 @@
+"""
+JSON API Routes
+Read-only JSON endpoints for the admin entities with field projection,
+filters, sorting and cursor pagination:
+
+  GET /api/v1/quotes?fields=ID,Customer_Name,Total_Amount&Status=pending
+                    &Total_Amount__gte=500&sort=-Date_Created&limit=50
+  GET /api/v1/quotes?cursor=<next_cursor from the previous page>
+
+Filters are <Field>=value or <Field>__<op>=value with op one of ne, gt,
+gte, lt, lte and in (comma-separated values). start and end (YYYY-MM-DD,
+inclusive) filter on the sheet's date column. Sorting always ends with ID,
+so cursors stay stable while rows are added.
+"""
+
+import base64
+import bisect
+import json
+import math
+from functools import cmp_to_key, wraps
+
+from flask import Blueprint, jsonify, request, session
+
+from modules.sheets_db import SHEET_DATE_FIELDS
+from routes.admin import data_etag, get_db
+from utils.validators import validate_date
+
+# Create blueprint
+api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
+
+# Endpoint name -> sheet title
+API_SHEETS = {
+    'quotes': 'Quotes',
+    'customers': 'Customers',
+    'jobs': 'Jobs',
+    'employees': 'Employees',
+    'payments': 'Payments'
+}
+
+# Columns that are never returned or filterable
+HIDDEN_FIELDS = {'Password'}
+
+RESERVED_PARAMS = {'fields', 'sort', 'limit', 'cursor', 'start', 'end'}
+FILTER_OPERATORS = ('ne', 'gt', 'gte', 'lt', 'lte', 'in')
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+class ApiError(Exception):
+    """Bad request parameters; reported as a 400 JSON error"""
+
+def api_admin_required(f):
+    """Decorator to require admin login, answering 401 instead of redirecting"""
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if not session.get('is_admin'):
+            return jsonify({'error': 'Admin login required'}), 401
+        return f(*args, **kwargs)
+    return decorated_function
+
+# ========== QUERY HELPERS ==========
+
+def sort_value(value):
+    """Comparable form of a cell: numbers before text, numbers compared numerically.
+
+    NaN and infinities ('nan', 'inf' typed into a cell) sort as text, since
+    NaN breaks the total order the keyset cursors rely on.
+    """
+    try:
+        number = value if isinstance(value, (int, float)) else float(value)
+    except (TypeError, ValueError):
+        return (1, 0, str(value))
+    if isinstance(number, float) and not math.isfinite(number):
+        return (1, 0, str(value))
+    return (0, number, '')
+
+def parse_sort(param, headers):
+    """'-Date_Created,Customer_Name' -> [('Date_Created', True), ('Customer_Name', False), ('ID', False)]"""
+    order = []
+    for item in filter(None, (p.strip() for p in (param or '').split(','))):
+        descending = item.startswith('-')
+        field = item.lstrip('-+')
+        if field not in headers:
+            raise ApiError(f'Unknown sort field: {field}')
+        order.append((field, descending))
+    if not any(field == 'ID' for field, _ in order):
+        order.append(('ID', False))
+    return order
+
+def parse_filters(args, headers):
+    """Collect (field, op, value) filters from the query string"""
+    filters = []
+    for name, value in args.items(multi=True):
+        if name in RESERVED_PARAMS:
+            continue
+        field, _, op = name.partition('__')
+        op = op or 'eq'
+        if field not in headers:
+            raise ApiError(f'Unknown filter field: {field}')
+        if op != 'eq' and op not in FILTER_OPERATORS:
+            raise ApiError(f'Unknown filter operator: {op}')
+        filters.append((field, op, value))
+    return filters
+
+def matches(record, filters):
+    for field, op, target in filters:
+        value = record.get(field, '')
+        if op == 'eq' and str(value) != target:
+            return False
+        if op == 'ne' and str(value) == target:
+            return False
+        if op == 'in' and str(value) not in target.split(','):
+            return False
+        if op in ('gt', 'gte', 'lt', 'lte'):
+            left, right = sort_value(value), sort_value(target)
+            if left[0] != right[0]:
+                return False
+            if ((op == 'gt' and not left > right) or (op == 'gte' and not left >= right)
+                    or (op == 'lt' and not left < right) or (op == 'lte' and not left <= right)):
+                return False
+    return True
+
+def make_comparator(order):
+    """cmp function over [value per sort field] lists, honoring each field's direction"""
+    def compare(a, b):
+        for (field, descending), x, y in zip(order, a, b):
+            x, y = sort_value(x), sort_value(y)
+            if x != y:
+                result = -1 if x < y else 1
+                return -result if descending else result
+        return 0
+    return compare
+
+def encode_cursor(values):
+    return base64.urlsafe_b64encode(json.dumps(values).encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_cursor(cursor, order):
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+    except Exception:
+        raise ApiError('Invalid cursor')
+    if not isinstance(values, list) or len(values) != len(order):
+        raise ApiError('Cursor does not match the sort order')
+    return values
+
+def query_records(records, headers, args, date_field=None):
+    """Filter, sort, paginate and project records according to the query string"""
+    fields = [f.strip() for f in args.get('fields', '').split(',') if f.strip()]
+    for field in fields:
+        if field not in headers:
+            raise ApiError(f'Unknown field: {field}')
+
+    try:
+        limit = min(max(int(args.get('limit', DEFAULT_LIMIT)), 1), MAX_LIMIT)
+    except ValueError:
+        raise ApiError('limit must be a number')
+
+    start, end = args.get('start') or None, args.get('end') or None
+    for value in (start, end):
+        if value and not validate_date(value):
+            raise ApiError(f'Invalid date: {value}')
+    if (start or end) and not date_field:
+        raise ApiError('This collection has no date column')
+
+    order = parse_sort(args.get('sort'), headers)
+    filters = parse_filters(args, headers)
+
+    def in_range(record):
+        day = str(record.get(date_field, ''))[:10]
+        return (not start or day >= start) and (not end or day <= end)
+
+    selected = [r for r in records if matches(r, filters) and (not (start or end) or in_range(r))]
+
+    # Stable multi-key sort: sort by the least significant field first
+    for field, descending in reversed(order):
+        selected.sort(key=lambda r: sort_value(r.get(field, '')), reverse=descending)
+
+    key = cmp_to_key(make_comparator(order))
+    position = 0
+    if args.get('cursor'):
+        after = key(decode_cursor(args['cursor'], order))
+        keys = [key([r.get(f, '') for f, _ in order]) for r in selected]
+        position = bisect.bisect_right(keys, after)
+
+    page = selected[position:position + limit]
+    next_cursor = None
+    if position + limit < len(selected):
+        next_cursor = encode_cursor([page[-1].get(f, '') for f, _ in order])
+
+    if fields:
+        page = [{f: r.get(f, '') for f in fields} for r in page]
+
+    return {'data': page, 'count': len(page), 'total': len(selected), 'next_cursor': next_cursor}
+
+# ========== ENDPOINTS ==========
+
+def make_list_view(entity, title):
+    """Build the list endpoint for one sheet"""
+
+    @api_admin_required
+    @data_etag(title)
+    def list_view():
+        db = get_db()
+        if not db:
+            return jsonify({'error': 'Database connection failed'}), 503
+
+        try:
+            records = db.get_records(title)
+            headers = list(records[0].keys()) if records else db.get_headers(title)
+        except Exception as e:
+            print(f"API error reading {title}: {e}")
+            return jsonify({'error': f'Sheet {title} is not available'}), 404
+        headers = [h for h in headers if h not in HIDDEN_FIELDS]
+        records = [{h: r.get(h, '') for h in headers} for r in records]
+
+        try:
+            result = query_records(records, headers, request.args, SHEET_DATE_FIELDS.get(title))
+        except ApiError as e:
+            return jsonify({'error': str(e)}), 400
+        return jsonify(result)
+
+    list_view.__name__ = f"list_{entity}"
+    return list_view
+
+for _entity, _title in API_SHEETS.items():
+    api_bp.add_url_rule(f'/{_entity}', f'list_{_entity}', make_list_view(_entity, _title))
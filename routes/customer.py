@@ -4,20 +4,17 @@ Handles customer portal, bookings, payments
 """
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session
-from modules.sheets_db import SheetsDatabase
-from modules.email_service import EmailService
+from modules.services import db, email_service
+from utils.session_store import regenerate_session
 from utils.decorators import customer_required
 from utils.validators import validate_email, sanitize_input
-from utils.helpers import calculate_price
+from modules.pricing import price, quote_input
+from modules.geo import distance_miles
 from datetime import datetime
 from config import Config
 
 customer_bp = Blueprint('customer', __name__)
 
-# Initialize services
-db = SheetsDatabase()
-email_service = EmailService()
-
 @customer_bp.route('/login', methods=['GET', 'POST'])
 def login():
     """Customer login"""
@@ -26,6 +23,7 @@ def login():
         
         customer = db.verify_customer(email)
         if customer:
+            regenerate_session()
             session['user_id'] = customer['ID']
             session['user_type'] = 'customer'
             session['user_name'] = customer['Name']
@@ -89,12 +87,13 @@ def book_service():
         service_type = request.form.get('service_type', 'weekly')
         special_requests = sanitize_input(request.form.get('special_requests', ''))
         
-        # Calculate price
-        price = calculate_price(
+        # Calculate price (the form's service type is the visit frequency)
+        total = round(price(quote_input(
             customer_data['Business_Type'],
             int(customer_data['Square_Feet']),
-            service_type
-        )
+            frequency=service_type,
+            miles=distance_miles(customer_data.get('Zip')) or 0
+        )).total_amount, 2)
         
         # Create job (admin will assign employee)
         job_id = db.add_job(
@@ -104,7 +103,7 @@ def book_service():
             'Unassigned',  # Admin will assign
             customer_data['Address'],
             service_type,
-            price,
+            total,
             special_requests
         )
         
@@ -183,5 +182,6 @@ def profile():
 def logout():
     """Logout"""
     session.clear()
+    regenerate_session()
     flash('Logged out successfully', 'info')
     return redirect(url_for('public.index'))
\ No newline at end of file
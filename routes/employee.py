@@ -4,7 +4,8 @@ Handles employee login, schedule, job management
 """
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session
-from modules.sheets_db import SheetsDatabase
+from modules.services import db, drive_storage
+from utils.session_store import regenerate_session
 from utils.decorators import employee_required
 from utils.validators import sanitize_input
 from datetime import datetime, timedelta
@@ -12,9 +13,6 @@ import os
 
 employee_bp = Blueprint('employee', __name__)
 
-# Initialize database
-db = SheetsDatabase()
-
 @employee_bp.route('/login', methods=['GET', 'POST'])
 def login():
     """Employee login"""
@@ -24,6 +22,7 @@ def login():
         
         employee = db.verify_employee(username, password)
         if employee:
+            regenerate_session()
             session['user_id'] = employee['ID']
             session['user_type'] = 'employee'
             session['user_name'] = employee['Name']
@@ -125,15 +124,8 @@ def job_detail(job_id):
 @employee_required
 def checkin(job_id):
     """Check in to job"""
-    check_in_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    
-    jobs = db.jobs.get_all_records()
-    for idx, job in enumerate(jobs, start=2):
-        if job['ID'] == job_id:
-            db.jobs.update_cell(idx, 9, 'in_progress')  # Status
-            db.jobs.update_cell(idx, 12, check_in_time)  # Check_In_Time
-            flash('Checked in successfully!', 'success')
-            break
+    if db.check_in_job(job_id).get('success'):
+        flash('Checked in successfully!', 'success')
     
     return redirect(url_for('employee.job_detail', job_id=job_id))
 
@@ -157,23 +149,17 @@ def complete_job(job_id):
                 
                 # Upload to Google Drive if configured
                 try:
-                    from modules.drive_storage import DriveStorage
-                    storage = DriveStorage()
-                    photo_link = storage.upload_file(photo_path, filename)
+                    photo_link = drive_storage.upload_file(photo_path, filename)
                     os.remove(photo_path)  # Clean up temp file
                 except:
                     photo_link = f"/static/uploads/{filename}"
         
-        # Complete the job
-        success = db.complete_job(job_id, notes=notes)
-        
+        # The Jobs sheet has no photo column; keep the link with the notes
         if photo_link:
-            # Update photo link
-            jobs = db.jobs.get_all_records()
-            for idx, job in enumerate(jobs, start=2):
-                if job['ID'] == job_id:
-                    db.jobs.update_cell(idx, 14, photo_link)  # Photos column
-                    break
+            notes = f"{notes}\nPhoto: {photo_link}".strip()
+        
+        # Complete the job
+        success = db.complete_job(job_id, notes=notes).get('success')
         
         if success:
             flash('Job completed successfully!', 'success')
@@ -209,5 +195,6 @@ def profile():
 def logout():
     """Logout"""
     session.clear()
+    regenerate_session()
     flash('Logged out successfully', 'info')
     return redirect(url_for('public.index'))
\ No newline at end of file
@@ -4,23 +4,19 @@ Handles public-facing pages like home, quote calculator, etc.
 """
 
 from flask import Blueprint, render_template, request, redirect, url_for, flash, session
-from modules.sheets_db import SheetsDatabase
-from modules.email_service import EmailService
+from modules.services import db, email_service
 from utils.validators import validate_email, validate_phone, sanitize_input, validate_square_feet
-from utils.helpers import calculate_price
+from modules.pricing import get_rules, price, quote_input
+from modules.geo import service_area_cities
 from config import Config
 
 public_bp = Blueprint('public', __name__)
 
-# Initialize services
-db = SheetsDatabase()
-email_service = EmailService()
-
 @public_bp.route('/')
 def index():
     """Homepage"""
     return render_template('public/index.html',
-                         service_areas=Config.SERVICE_AREAS)
+                         service_areas=service_area_cities())
 
 @public_bp.route('/quote', methods=['GET', 'POST'])
 def quote():
@@ -55,26 +51,29 @@ def quote():
             for error in errors:
                 flash(error, 'error')
             return render_template('public/quote.html',
-                                 property_types=Config.PRICING.keys(),
+                                 property_types=get_rules().property_types,
                                  form_data=request.form)
         
-        # Calculate price
-        price = calculate_price(property_type, square_feet, service_type)
+        # Calculate price (the form's service type is the visit frequency)
+        quote = quote_input(property_type, square_feet, frequency=service_type)
+        breakdown = price(quote)
+        total = round(breakdown.total_amount, 2)
         
         # Save quote
-        quote_id = db.add_quote(name, email, phone, property_type,
-                               square_feet, service_type, price)
+        result = db.add_quote(name, email, phone, quote,
+                              notes=special_instructions, breakdown=breakdown)
+        quote_id = result.get('quote_id')
         
         # Send email notifications
         email_service.send_quote_notification(name, email, phone,
                                              property_type, square_feet,
-                                             price, quote_id)
+                                             total, quote_id)
         
         # Store in session for result page
         session['quote_result'] = {
             'quote_id': quote_id,
             'name': name,
-            'price': price,
+            'price': total,
             'square_feet': square_feet,
             'property_type': property_type,
             'service_type': service_type
@@ -83,7 +82,7 @@ def quote():
         return redirect(url_for('public.quote_result'))
     
     return render_template('public/quote.html',
-                         property_types=Config.PRICING.keys())
+                         property_types=get_rules().property_types)
 
 @public_bp.route('/quote/result')
 def quote_result():
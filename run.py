@@ -1,30 +1,71 @@
 #!/usr/bin/env python
 """
 Cleaning Business Platform - Main Runner
+Production: a preforking server (gunicorn) that loads the app once and
+forks WEB_WORKERS workers with WEB_THREADS threads each.
+Development (FLASK_ENV=development or --dev): the Flask development server.
 """
 
+import argparse
 import os
 import sys
 from app import create_app
+from config import Config
 
-# Create app instance
-app = create_app()
+# The one app instance; build the shared services before the workers fork
+# (app.py only builds its own module-level app when something asks for it)
+app = create_app(preload=True)
+
+def serve(app, port, workers, threads):
+    """Serve app with gunicorn, forking the workers from this already loaded process"""
+    from gunicorn.app.base import BaseApplication
+
+    class PreforkServer(BaseApplication):
+        def load_config(self):
+            self.cfg.set('bind', f'0.0.0.0:{port}')
+            self.cfg.set('workers', workers)
+            self.cfg.set('threads', threads)
+            self.cfg.set('worker_class', 'gthread')
+            self.cfg.set('timeout', Config.WEB_TIMEOUT)
+            self.cfg.set('preload_app', True)
+
+        def load(self):
+            return app
+
+    PreforkServer().run()
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Run the cleaning business platform')
+    parser.add_argument('--dev', action='store_true', help='use the Flask development server')
+    parser.add_argument('--workers', type=int, default=Config.WEB_WORKERS)
+    parser.add_argument('--threads', type=int, default=Config.WEB_THREADS)
+    args = parser.parse_args()
+
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('FLASK_ENV') == 'development'
+    dev_server = debug or args.dev
     
     print("=" * 50)
     print("🧹 Cleaning Business Platform")
     print(f"📍 Running on: http://localhost:{port}")
     print(f"🔧 Debug Mode: {debug}")
+    if not dev_server:
+        print(f"⚙️  Workers: {args.workers} x {args.threads} threads")
     print(f"📊 Admin Panel: http://localhost:{port}/admin")
     print(f"👷 Employee Portal: http://localhost:{port}/employee")
     print(f"👤 Customer Portal: http://localhost:{port}/customer")
     print("=" * 50)
     
+    if not dev_server:
+        try:
+            serve(app, port, args.workers, args.threads)
+            sys.exit(0)
+        except ImportError:
+            print("⚠️  gunicorn is not installed - falling back to the development server")
+    
     app.run(
         host='0.0.0.0',
         port=port,
-        debug=debug
-    )
\ No newline at end of file
+        debug=debug,
+        threaded=True
+    )
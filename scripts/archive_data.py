@@ -0,0 +1,59 @@
+"""
+Archive Old Data
+Moves closed quotes and old activity log entries out of the hot sheets
+into compressed monthly segment files. Meant to run as a scheduled task.
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+from modules.sheets_db import SheetsDatabase
+
+def archive_data(quote_days, log_days, dry_run=False):
+    """Archive cold rows from the Quotes and Activity_Log sheets"""
+
+    print("🗄️  Archiving old data...")
+    print("=" * 50)
+
+    db = SheetsDatabase()
+    if not db.spreadsheet:
+        print("❌ Could not connect to Google Sheets")
+        return False
+
+    jobs = [
+        ('Quotes', f"closed quotes older than {quote_days} days",
+         lambda: db.archive_closed_quotes(quote_days, dry_run=dry_run)),
+        ('Activity_Log', f"log entries older than {log_days} days",
+         lambda: db.archive_activity_log(log_days, dry_run=dry_run)),
+    ]
+
+    ok = True
+    for sheet_name, label, run in jobs:
+        result = run()
+        if result.get('success'):
+            verb = 'Would archive' if dry_run else 'Archived'
+            print(f"  ✅ {sheet_name}: {verb} {result['archived']} {label} "
+                  f"({result['remaining']} rows stay in the sheet)")
+        else:
+            print(f"  ❌ {sheet_name}: {result.get('error')}")
+            ok = False
+
+    print("=" * 50)
+    print(f"Archive directory: {db.archive.base_dir}")
+    return ok
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--quote-days', type=int, default=Config.ARCHIVE_QUOTES_AFTER_DAYS,
+                        help='archive closed quotes created more than this many days ago')
+    parser.add_argument('--log-days', type=int, default=Config.ARCHIVE_LOG_AFTER_DAYS,
+                        help='archive activity log entries older than this many days')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='only report how many rows would be archived')
+    args = parser.parse_args()
+
+    sys.exit(0 if archive_data(args.quote_days, args.log_days, args.dry_run) else 1)
@@ -0,0 +1,171 @@
+"""
+Benchmark SheetsDatabase Hot Paths
+Generates a seeded dataset into an offline spreadsheet at each requested
+size and measures the data-layer calls the site leans on hardest:
+get_quotes, get_jobs (employee filter), get_dashboard_stats,
+update_quote_status, verify_employee, add_quote_full and the admin
+schedule page.
+
+Each operation reports latency percentiles, simulated API calls per run
+(what the same call would cost against Google Sheets) and peak Python
+memory. Results are saved as JSON; pass --compare with an earlier result
+file to see how a change moved the numbers.
+
+Examples:
+  python scripts/benchmark_db.py
+  python scripts/benchmark_db.py --sizes 1000,10000,100000 --iterations 20
+  python scripts/benchmark_db.py --compare benchmarks/db-abc1234-20260101090000.json
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from itertools import count, cycle
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules.data_version import DataVersions
+from modules.events import EventLog
+from modules.offline_sheets import OfflineSpreadsheet
+from modules.sheets_db import SheetsDatabase
+from scripts.generate_dataset import (SpreadsheetOutput, default_counts, generate_dataset,
+                                     quote_rows)
+from utils.benchmark import environment, load_results, measure, save_results
+
+DEFAULT_SIZES = '1000,10000'
+
+def build_database(size, seed=42, latency=0.0):
+    """Generate a dataset into a fresh offline spreadsheet and open it"""
+    spreadsheet = OfflineSpreadsheet(title=f"bench-{size}")
+    generate_dataset(SpreadsheetOutput(spreadsheet), default_counts(size), seed=seed)
+    spreadsheet.latency = latency
+
+    db = SheetsDatabase(spreadsheet=spreadsheet)
+    # Keep benchmark runs away from the real archive, version counters and event log
+    db.archive.base_dir = tempfile.mkdtemp(prefix='bench-archive-')
+    db.versions = DataVersions(None)
+    db.events = EventLog(None)
+    return db
+
+def admin_client(db):
+    """Flask test client for the admin blueprint, logged in as admin"""
+    from flask import Flask
+    import routes.admin as admin_routes
+
+    app = Flask(__name__)
+    app.secret_key = 'benchmark'
+    app.register_blueprint(admin_routes.admin_bp)
+    admin_routes._db_instance = db
+
+    client = app.test_client()
+    with client.session_transaction() as sess:
+        sess['is_admin'] = True
+    return client
+
+def operations(db, size):
+    """Name -> zero-argument callable for every benchmarked operation"""
+    counts = default_counts(size)
+    quote_id = f"Q{max(1, counts['quotes'] // 2):08d}"
+    last_employee = counts['employees']
+    statuses = cycle(['sent', 'pending'])
+    quote_row = next(quote_rows(1, random.Random('bench:add_quote'), datetime(2026, 1, 1, 9),
+                                counts['customers'], counts['employees']))
+    sequence = count(1)
+
+    def update_status():
+        result = db.update_quote_status(quote_id, next(statuses))
+        assert result.get('success'), result
+
+    def add_quote():
+        row = list(quote_row)
+        row[0] = f"QB{next(sequence):08d}"
+        assert db.add_quote_full(row).get('success')
+
+    def schedule_page():
+        response = client.get('/admin/schedule?date=2026-01-05')
+        assert response.status_code == 200, response.status_code
+
+    client = admin_client(db)
+
+    return {
+        'get_quotes': lambda: db.get_quotes(),
+        'get_jobs_employee': lambda: db.get_jobs(employee_id='E000001'),
+        'get_dashboard_stats': lambda: db.get_dashboard_stats(),
+        'update_quote_status': update_status,
+        'verify_employee': lambda: db.verify_employee(f"user{last_employee}", 'password123'),
+        'add_quote_full': add_quote,
+        'admin_schedule': schedule_page,
+    }
+
+def run_benchmarks(sizes, iterations=10, latency=0.0, only=None, seed=42):
+    """Run every operation at every size and return the results document"""
+    results = {
+        'environment': environment(),
+        'settings': {'sizes': sizes, 'iterations': iterations,
+                     'simulated_latency_s': latency, 'seed': seed},
+        'results': {}
+    }
+
+    for size in sizes:
+        print(f"\n🧪 Dataset size {size:,}")
+        print("=" * 50)
+        started = time.perf_counter()
+        db = build_database(size, seed=seed, latency=latency)
+        print(f"  Generated in {time.perf_counter() - started:.1f}s")
+
+        size_results = {}
+        for name, fn in operations(db, size).items():
+            if only and name not in only:
+                continue
+            size_results[name] = measure(fn, iterations=iterations,
+                                         call_counter=db.spreadsheet.api_calls)
+            r = size_results[name]
+            print(f"  {name:<22} p50 {r['p50_ms']:>9.2f}ms  p95 {r['p95_ms']:>9.2f}ms  "
+                  f"p99 {r['p99_ms']:>9.2f}ms  calls {r['api_calls']:>5}  "
+                  f"peak {r['peak_memory_kb']:>9.0f}KB")
+
+        results['results'][str(size)] = size_results
+
+    return results
+
+def compare(current, baseline):
+    """Print p50 and API-call changes against an earlier result file"""
+    print(f"\n📊 Compared with {baseline['environment'].get('commit')} "
+          f"({baseline['environment'].get('timestamp')})")
+    print("=" * 50)
+    for size, ops in current['results'].items():
+        for name, r in ops.items():
+            before = baseline.get('results', {}).get(size, {}).get(name)
+            if not before:
+                continue
+            ratio = r['p50_ms'] / before['p50_ms'] if before['p50_ms'] else 0
+            print(f"  {size:>8} {name:<22} p50 {before['p50_ms']:>9.2f} -> {r['p50_ms']:>9.2f}ms "
+                  f"({ratio:.2f}x)  calls {before.get('api_calls')} -> {r.get('api_calls')}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark SheetsDatabase hot paths')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help='comma-separated dataset sizes (default %(default)s)')
+    parser.add_argument('--iterations', type=int, default=10, help='timed runs per operation')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='simulated seconds per API call')
+    parser.add_argument('--only', help='comma-separated operation names to run')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', help='result file (default benchmarks/db-<commit>-<time>.json)')
+    parser.add_argument('--compare', help='earlier result file to compare against')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.sizes.split(',') if s.strip()]
+    only = set(args.only.split(',')) if args.only else None
+
+    results = run_benchmarks(sizes, args.iterations, args.latency, only, args.seed)
+    path = save_results(results, args.out, name='db')
+    print("=" * 50)
+    print(f"✅ Results saved to {path}")
+
+    if args.compare:
+        compare(results, load_results(args.compare))
@@ -0,0 +1,90 @@
+"""
+Benchmark Pricing
+Micro-benchmarks for the pricing engine over the golden corpus inputs:
+single quotes (uncached price(), memoized price_cached() hits, and the
+quote form path quote_submit takes) and vectorized batches of increasing
+size. Run scripts/check_pricing.py alongside, so a speedup is only kept
+when prices are unchanged.
+
+Examples:
+  python scripts/benchmark_pricing.py
+  python scripts/benchmark_pricing.py --batch-sizes 1000,100000 --iterations 50
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules import pricing
+from scripts.check_pricing import GOLDEN_CORPUS, load_corpus
+from utils.benchmark import environment, measure, save_results
+
+DEFAULT_BATCH_SIZES = '1000,10000,100000'
+
+def batch_columns(quotes, size):
+    """Columnar inputs of `size` rows, cycling through the corpus quotes"""
+    rows = [quotes[i % len(quotes)] for i in range(size)]
+    return {field: [getattr(q, field) for q in rows] for field in pricing.QuoteInput._fields}
+
+def benchmark_pricing(batch_sizes, iterations=30, path=GOLDEN_CORPUS):
+    """Time single and batch pricing; per-quote figures are derived from the p50"""
+    from app import quote_from_form
+
+    cases = load_corpus(path)
+    quotes = [pricing.quote_input(**inputs) for inputs, _ in cases]
+    forms = [{key: str(value) for key, value in inputs.items()} for inputs, _ in cases]
+    rules = pricing.PricingRules.compile()
+    count = len(quotes)
+
+    results = {
+        'environment': environment(),
+        'settings': {'corpus_cases': count, 'iterations': iterations, 'rules_version': rules.version},
+        'single': {},
+        'batch': {}
+    }
+
+    print(f"⏱️  Pricing {count:,} corpus quotes per run")
+    print("=" * 50)
+
+    # Warm the memo so the cached path measures hits
+    for quote in quotes:
+        pricing.price_cached(quote, rules)
+
+    single = {
+        'price': lambda: [rules.price(q) for q in quotes],
+        'price_cached': lambda: [pricing.price_cached(q, rules) for q in quotes],
+        'quote_form': lambda: [rules.price(quote_from_form(form)) for form in forms]
+    }
+    for name, run in single.items():
+        result = measure(run, iterations=iterations)
+        result['us_per_quote'] = round(result['p50_ms'] * 1000 / count, 3)
+        results['single'][name] = result
+        print(f"  {name:<14} p50 {result['p50_ms']:>8.2f}ms  {result['us_per_quote']:>7.2f}µs/quote")
+
+    for size in batch_sizes:
+        columns = batch_columns(quotes, size)
+        result = measure(lambda: rules.price_batch(columns), iterations=iterations)
+        result['rows_per_second'] = round(size / (result['p50_ms'] / 1000)) if result['p50_ms'] else 0
+        result['us_per_quote'] = round(result['p50_ms'] * 1000 / size, 3)
+        results['batch'][str(size)] = result
+        print(f"  batch {size:<8,} p50 {result['p50_ms']:>8.2f}ms  {result['us_per_quote']:>7.2f}µs/quote  "
+              f"{result['rows_per_second']:>12,} rows/sec")
+
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--batch-sizes', default=DEFAULT_BATCH_SIZES,
+                        help='comma-separated batch sizes (default %(default)s)')
+    parser.add_argument('--iterations', type=int, default=30, help='timed runs per benchmark')
+    parser.add_argument('--corpus', default=GOLDEN_CORPUS)
+    parser.add_argument('--out', help='result file (default benchmarks/pricing-<commit>-<time>.json)')
+    args = parser.parse_args()
+
+    sizes = [int(s) for s in args.batch_sizes.split(',') if s.strip()]
+    results = benchmark_pricing(sizes, args.iterations, args.corpus)
+    path = save_results(results, args.out, name='pricing')
+    print("=" * 50)
+    print(f"✅ Results saved to {path}")
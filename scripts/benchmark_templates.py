@@ -0,0 +1,80 @@
+"""
+Benchmark Admin Page Rendering
+Requests the admin dashboard and list pages through a Flask test client,
+first with the compiled-template cache disabled (every request re-lexes,
+parses and compiles the inline template, as render_template_string does)
+and then with it enabled, and reports the latency of both.
+
+A small dataset is used by default so rendering, not data loading,
+dominates the numbers.
+
+Examples:
+  python scripts/benchmark_templates.py
+  python scripts/benchmark_templates.py --size 2000 --iterations 50
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from scripts.benchmark_db import admin_client, build_database
+from utils.benchmark import environment, measure, save_results
+from utils.template_cache import template_cache
+
+PAGES = {
+    'dashboard': '/admin/dashboard',
+    'quotes': '/admin/quotes',
+    'customers': '/admin/customers',
+    'payments': '/admin/payments',
+    'schedule': '/admin/schedule?date=2026-01-05',
+}
+
+def benchmark_pages(size=200, iterations=30, seed=42):
+    """Time every page with the template cache off and on"""
+    db = build_database(size, seed=seed)
+    client = admin_client(db)
+    max_templates = template_cache.max_templates or 64
+
+    results = {
+        'environment': environment(),
+        'settings': {'size': size, 'iterations': iterations, 'seed': seed},
+        'results': {}
+    }
+
+    print(f"🧪 Rendering admin pages over a {size:,}-row dataset")
+    print("=" * 50)
+    for name, url in PAGES.items():
+        def fetch():
+            response = client.get(url)
+            assert response.status_code == 200, (url, response.status_code)
+
+        page = {}
+        for mode, cache_size in (('uncached', 0), ('cached', max_templates)):
+            template_cache.clear()
+            template_cache.max_templates = cache_size
+            page[mode] = measure(fetch, iterations=iterations)
+
+        saved = page['uncached']['p50_ms'] - page['cached']['p50_ms']
+        page['p50_saved_ms'] = round(saved, 3)
+        page['speedup'] = round(page['uncached']['p50_ms'] / page['cached']['p50_ms'], 2)
+        results['results'][name] = page
+        print(f"  {name:<10} uncached p50 {page['uncached']['p50_ms']:>8.2f}ms  "
+              f"cached p50 {page['cached']['p50_ms']:>8.2f}ms  ({page['speedup']}x)")
+
+    template_cache.max_templates = max_templates
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark admin page rendering')
+    parser.add_argument('--size', type=int, default=200, help='dataset size (default %(default)s)')
+    parser.add_argument('--iterations', type=int, default=30, help='timed requests per page')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', help='result file (default benchmarks/templates-<commit>-<time>.json)')
+    args = parser.parse_args()
+
+    results = benchmark_pages(args.size, args.iterations, args.seed)
+    path = save_results(results, args.out, name='templates')
+    print("=" * 50)
+    print(f"✅ Results saved to {path}")
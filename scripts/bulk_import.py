@@ -0,0 +1,76 @@
+"""
+Bulk Import from CSV
+Loads customers, jobs or quotes from a CSV file using the chunked
+bulk_add_* methods (one append_rows call per chunk, one log entry per run).
+
+CSV headers:
+  customers - name, email, phone, address, city, state, zip, type, ...
+              (the keys accepted by SheetsDatabase.add_customer)
+  jobs      - customer_id, customer_name, property_address, date, time,
+              employees (separated by ';'), total_price, ...
+  quotes    - Quotes sheet column names (Customer_Name, Customer_Email, ...)
+"""
+
+import argparse
+import csv
+import os
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules.sheets_db import BULK_CHUNK_SIZE, SheetsDatabase
+
+ENTITIES = ('customers', 'jobs', 'quotes')
+
+def read_rows(csv_path, entity):
+    """Read CSV rows as dicts, normalizing headers for the target entity"""
+    with open(csv_path, newline='', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            row = {k.strip(): (v or '').strip() for k, v in row.items() if k}
+
+            if entity != 'quotes':
+                row = {k.lower().replace(' ', '_'): v for k, v in row.items()}
+            if entity == 'jobs' and 'employees' in row:
+                row['employees'] = [e.strip() for e in row['employees'].split(';') if e.strip()]
+
+            yield row
+
+def bulk_import(entity, csv_path, chunk_size=BULK_CHUNK_SIZE, dry_run=False):
+    """Import one CSV file into the matching sheet"""
+
+    print(f"📦 Importing {entity} from {csv_path}...")
+    print("=" * 50)
+
+    db = SheetsDatabase()
+    if not db.spreadsheet and not dry_run:
+        print("❌ Could not connect to Google Sheets")
+        return False
+
+    bulk_add = getattr(db, f"bulk_add_{entity}")
+    result = bulk_add(read_rows(csv_path, entity), chunk_size=chunk_size, dry_run=dry_run)
+
+    for error in result.get('errors', []):
+        print(f"  ⚠️  Row {error['row']}: {error['error']}")
+
+    if dry_run:
+        print(f"  ✅ {result.get('valid', 0)} valid rows, "
+              f"{len(result.get('errors', []))} rejected (dry run, nothing written)")
+    elif result.get('success'):
+        print(f"  ✅ Added {result['added']} {entity}, {len(result['errors'])} rejected")
+    else:
+        print(f"  ❌ Import stopped after {result.get('added', 0)} rows: {result.get('error')}")
+
+    print("=" * 50)
+    return result.get('success', False)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Bulk import customers, jobs or quotes from CSV')
+    parser.add_argument('entity', choices=ENTITIES)
+    parser.add_argument('csv_path')
+    parser.add_argument('--chunk-size', type=int, default=BULK_CHUNK_SIZE,
+                        help='rows per append_rows call')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='validate the file without writing anything')
+    args = parser.parse_args()
+
+    sys.exit(0 if bulk_import(args.entity, args.csv_path, args.chunk_size, args.dry_run) else 1)
@@ -0,0 +1,246 @@
+"""
+Check Pricing Against the Golden Corpus
+Prices every case in data/pricing_golden.csv through the pricing engine
+(quote form parsing, scalar, memoized and vectorized batch paths) with the
+default rate tables and compares each pricing column, to the cent, with
+the expected breakdown. Exits non-zero on any mismatch, so performance
+work on the engine cannot silently change a customer's price.
+
+The expected values come from reference_price() below: a standalone copy
+of the formula the web quote form (quote_submit) priced with before the
+engine existed, which shares no code with modules/pricing.py. When a rate
+change is intended, change both the reference and DEFAULT_RATE_TABLES and
+run with --generate to rewrite the corpus.
+
+Examples:
+  python scripts/check_pricing.py
+  python scripts/check_pricing.py --generate --count 3000
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+GOLDEN_CORPUS = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                             'data', 'pricing_golden.csv')
+
+INPUT_FIELDS = ['property_type', 'sqft', 'frequency', 'services', 'bathrooms', 'service_type']
+PRICING_COLUMNS = ['Labor_Hours', 'Labor_Cost', 'Material_Cost', 'Service_Cost', 'Travel_Cost',
+                   'Base_Cost', 'Profit_Margin', 'Profit_Amount', 'Subtotal', 'Tax_Amount',
+                   'Total_Amount']
+
+# ==================== REFERENCE FORMULA ====================
+# Copied from quote_submit as it was before modules/pricing.py. Keep it
+# independent of the engine: no imports from modules/.
+
+REFERENCE_BASE_RATES = {
+    'office': 0.05, 'medical': 0.08, 'retail': 0.04, 'restaurant': 0.06,
+    'warehouse': 0.03, 'school': 0.04, 'residential': 0.06, 'industrial': 0.035,
+    'gym': 0.045, 'bank': 0.055, 'church': 0.04, 'government': 0.065
+}
+REFERENCE_SERVICE_MULTIPLIERS = {
+    'regular': 1.0, 'deep-clean': 2.0, 'post-construction': 2.5, 'move-in-out': 1.8,
+    'disinfection': 1.5, 'emergency': 3.0, 'one-time': 1.3
+}
+REFERENCE_FREQUENCY_DISCOUNTS = {
+    'one-time': 0, 'daily': 0.25, 'weekly': 0.20, 'bi-weekly': 0.15, 'monthly': 0.10,
+    'quarterly': 0.05
+}
+
+def reference_price(property_type, sqft, frequency, services, bathrooms, service_type='regular'):
+    """The original quote_submit breakdown, as the sheet's pricing columns (rounded)"""
+    services_list = services.split(',') if services else []
+
+    base_rate = REFERENCE_BASE_RATES.get(property_type, 0.05)
+    # The form only ever priced 'regular'; the same table covers the other service types
+    service_multiplier = REFERENCE_SERVICE_MULTIPLIERS.get(service_type, 1.0)
+    frequency_discount = REFERENCE_FREQUENCY_DISCOUNTS.get(frequency, 0)
+
+    property_cost = sqft * base_rate * service_multiplier
+    property_cost = property_cost * (1 - frequency_discount)
+
+    labor_hours = max(2, sqft / 3000)
+    labor_rate = 25
+    labor_cost = labor_hours * labor_rate
+
+    material_cost = sqft * 0.01
+
+    service_cost = 0
+    if 'windows' in services_list:
+        service_cost += 30
+    if 'laundry' in services_list:
+        service_cost += 40
+    if 'bathroom' in services_list:
+        service_cost += bathrooms * 25
+    if 'kitchen' in services_list:
+        service_cost += 50
+
+    travel_cost = 0  # corpus quotes have no ZIP, so no mileage
+
+    base_cost = property_cost + labor_cost + material_cost + service_cost + travel_cost
+    minimum_charge = 75
+    base_cost = max(base_cost, minimum_charge)
+
+    profit_margin = 35
+    profit_amount = base_cost * (profit_margin / 100)
+    subtotal = base_cost + profit_amount
+    tax_rate = 0.0625
+    tax_amount = subtotal * tax_rate
+    total_amount = subtotal + tax_amount
+
+    values = [labor_hours, labor_cost, material_cost, service_cost, travel_cost, base_cost,
+              profit_margin, profit_amount, subtotal, tax_amount, total_amount]
+    return dict(zip(PRICING_COLUMNS, (round(v, 2) for v in values)))
+
+# ==================== CORPUS ====================
+
+CORPUS_PROPERTY_TYPES = list(REFERENCE_BASE_RATES) + ['commercial', 'hotel']  # last two: default rate
+CORPUS_SERVICE_TYPES = list(REFERENCE_SERVICE_MULTIPLIERS) + ['standard']      # unknown: no multiplier
+CORPUS_SERVICES = ['vacuum', 'mop', 'windows', 'laundry', 'kitchen', 'bathroom']
+
+# Boundaries worth pinning: no area, minimum charge, the 2-hour labor floor
+# (6,000 sq ft) and very large properties
+EDGE_SQFT = [0, 1, 250, 999.5, 1000, 1500, 2999, 3000, 5999, 6000, 6001, 50000, 250000]
+
+def generate_inputs(count, seed=42):
+    """count seeded quote inputs, edge cases first"""
+    rng = random.Random(seed)
+    inputs = []
+    for sqft in EDGE_SQFT:
+        for frequency in REFERENCE_FREQUENCY_DISCOUNTS:
+            inputs.append({'property_type': 'office', 'sqft': sqft, 'frequency': frequency,
+                           'services': 'bathroom,kitchen', 'bathrooms': 2, 'service_type': 'regular'})
+
+    while len(inputs) < count:
+        size = rng.random()
+        if size < 0.15:
+            sqft = rng.randint(0, 1500)                 # small jobs, mostly at the minimum charge
+        elif size < 0.9:
+            sqft = rng.randint(5, 200) * 50             # round numbers, as customers type them
+        else:
+            sqft = round(rng.uniform(1000, 250000), 1)
+        services = [s for s in CORPUS_SERVICES if rng.random() < 0.35]
+        inputs.append({
+            'property_type': rng.choice(CORPUS_PROPERTY_TYPES),
+            'sqft': sqft,
+            'frequency': rng.choice(list(REFERENCE_FREQUENCY_DISCOUNTS)),
+            'services': ','.join(services),
+            'bathrooms': rng.randint(0, 10),
+            'service_type': rng.choice(CORPUS_SERVICE_TYPES) if rng.random() < 0.4 else 'regular'
+        })
+    return inputs[:count]
+
+def write_corpus(inputs, path=GOLDEN_CORPUS):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=INPUT_FIELDS + PRICING_COLUMNS, lineterminator='\n')
+        writer.writeheader()
+        for case in inputs:
+            writer.writerow({**case, **reference_price(**case)})
+    return path
+
+def load_corpus(path=GOLDEN_CORPUS):
+    """[(inputs, expected pricing columns)] from the corpus file"""
+    cases = []
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            inputs = {field: row[field] for field in INPUT_FIELDS}
+            inputs['sqft'] = float(inputs['sqft'])
+            inputs['bathrooms'] = int(inputs['bathrooms'])
+            cases.append((inputs, {column: float(row[column]) for column in PRICING_COLUMNS}))
+    return cases
+
+# ==================== CHECKS ====================
+
+def engine_results(cases, rules):
+    """Mode name -> list of {column: rounded value} per case, from each engine path"""
+    from app import quote_from_form
+    from modules import pricing
+
+    quotes = [pricing.quote_input(**inputs) for inputs, _ in cases]
+    results = {
+        'scalar': [rules.price(q).sheet_fields() for q in quotes],
+        'cached': [pricing.price_cached(q, rules).sheet_fields() for q in quotes],
+        # Fields as the quote wizard posts them to quote_submit (which always
+        # prices the regular service type; other cases are skipped)
+        'form': [rules.price(quote_from_form({
+            'property_type': inputs['property_type'], 'sqft': str(inputs['sqft']),
+            'frequency': inputs['frequency'], 'services': inputs['services'],
+            'bathrooms': str(inputs['bathrooms'])
+        })).sheet_fields() if inputs['service_type'] == 'regular' else None for inputs, _ in cases]
+    }
+
+    batch = rules.price_batch({field: [getattr(q, field) for q in quotes]
+                               for field in pricing.QuoteInput._fields})
+    arrays = [(column, getattr(batch, field)) for column, field in pricing.SHEET_PRICING_FIELDS]
+    results['batch'] = [{column: round(float(values[i]), 2) for column, values in arrays}
+                        for i in range(len(quotes))]
+    return results
+
+def check_pricing(path=GOLDEN_CORPUS, show=10):
+    """Compare every engine path with the corpus; True when all match"""
+    from modules import pricing
+
+    print("💲 Checking pricing against the golden corpus...")
+    print("=" * 50)
+
+    try:
+        cases = load_corpus(path)
+    except FileNotFoundError:
+        print(f"❌ No corpus at {path} (create it with --generate)")
+        return False
+
+    # The reference is a copy of the formula, so check it still reproduces the corpus
+    stale = sum(reference_price(**inputs) != expected for inputs, expected in cases)
+    if stale:
+        print(f"❌ {stale:,} corpus rows no longer match reference_price(); regenerate with --generate")
+        return False
+
+    rules = pricing.PricingRules.compile()
+    print(f"Corpus: {len(cases):,} cases  |  Rules version: {rules.version}")
+
+    ok = True
+    for mode, results in engine_results(cases, rules).items():
+        mismatches = []
+        checked = [(case, actual) for case, actual in zip(cases, results) if actual is not None]
+        for (inputs, expected), actual in checked:
+            diff = {column: (expected[column], float(actual[column])) for column in PRICING_COLUMNS
+                    if float(actual[column]) != expected[column]}
+            if diff:
+                mismatches.append((inputs, diff))
+
+        if not mismatches:
+            print(f"  ✅ {mode:<7} {len(checked):,} cases match")
+            continue
+
+        ok = False
+        print(f"  ❌ {mode:<7} {len(mismatches):,} of {len(checked):,} cases differ")
+        for inputs, diff in mismatches[:show]:
+            changes = ', '.join(f"{column} {old} -> {new}" for column, (old, new) in diff.items())
+            print(f"      {inputs}: {changes}")
+
+    print("=" * 50)
+    print("✅ Pricing matches the golden corpus" if ok else "❌ Pricing changed")
+    return ok
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--corpus', default=GOLDEN_CORPUS, help='corpus file (default %(default)s)')
+    parser.add_argument('--generate', action='store_true',
+                        help='rewrite the corpus from reference_price() instead of checking')
+    parser.add_argument('--count', type=int, default=3000, help='cases to generate')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--show', type=int, default=10, help='mismatches to list per path')
+    args = parser.parse_args()
+
+    if args.generate:
+        path = write_corpus(generate_inputs(args.count, args.seed), args.corpus)
+        print(f"✅ Wrote {args.count:,} cases to {path}")
+        sys.exit(0)
+
+    sys.exit(0 if check_pricing(args.corpus, args.show) else 1)
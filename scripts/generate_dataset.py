@@ -0,0 +1,362 @@
+"""
+Generate Synthetic Dataset
+Produces realistic, seeded Quotes, Customers, Jobs, Employees, Payments,
+Materials_Services and Activity_Log rows at any volume (10k, 100k, 1M...)
+and writes them to a SQLite file, a directory of CSV files, or directly
+into an (offline) spreadsheet.
+
+Rows are generated and written in chunks, so memory stays flat for the
+SQLite and CSV outputs regardless of volume. The same seed always
+produces the same data.
+
+Examples:
+  python scripts/generate_dataset.py --size 100000 --out data/bench.db
+  python scripts/generate_dataset.py --size 10000 --out data/csv --format csv
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+from itertools import islice
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules import pricing
+from modules.offline_sheets import write_sqlite_table
+from modules.sheets_db import (ACTIVITY_LOG_HEADERS, CUSTOMER_HEADERS, EMPLOYEE_HEADERS,
+                               JOB_HEADERS, MATERIAL_HEADERS, PAYMENT_HEADERS, QUOTE_HEADERS)
+
+CHUNK_SIZE = 5000
+
+FIRST_NAMES = ['James', 'Maria', 'John', 'Linda', 'Michael', 'Sarah', 'David', 'Ana',
+               'Robert', 'Jennifer', 'Carlos', 'Emily', 'Daniel', 'Jessica', 'Luis',
+               'Ashley', 'Kevin', 'Nicole', 'Brian', 'Rosa', 'Thomas', 'Megan']
+LAST_NAMES = ['Smith', 'Garcia', 'Johnson', 'Rodriguez', 'Williams', 'Martinez', 'Brown',
+              'Lopez', 'Jones', 'Gonzalez', 'Miller', 'Perez', 'Davis', 'Sanchez',
+              'Wilson', 'Baez', 'Anderson', 'Rivera', 'Taylor', 'Nguyen', 'Thomas']
+BUSINESS_WORDS = ['Harbor', 'Summit', 'Beacon', 'Liberty', 'Charles', 'Commonwealth',
+                  'Back Bay', 'Seaport', 'Fenway', 'Cedar', 'Granite', 'Atlantic']
+BUSINESS_KINDS = ['Dental', 'Medical Group', 'Law Office', 'Bistro', 'Fitness', 'Realty',
+                  'Bank', 'Academy', 'Church', 'Warehouse', 'Cafe', 'Partners']
+STREETS = ['Main St', 'Washington St', 'Massachusetts Ave', 'Beacon St', 'Broadway',
+           'Centre St', 'Elm St', 'Highland Ave', 'Harvard St', 'Commonwealth Ave']
+CITIES = [('Boston', '02108'), ('Cambridge', '02139'), ('Quincy', '02169'),
+          ('Newton', '02458'), ('Brookline', '02445'), ('Somerville', '02143'),
+          ('Watertown', '02472'), ('Waltham', '02451'), ('Lexington', '02420'),
+          ('Arlington', '02474')]
+
+# Weighted choices: (value, weight)
+PROPERTY_TYPES = [('office', 30), ('residential', 25), ('retail', 10), ('medical', 8),
+                  ('restaurant', 8), ('warehouse', 4), ('school', 4), ('gym', 3),
+                  ('bank', 3), ('church', 2), ('industrial', 2), ('government', 1)]
+FREQUENCIES = [('monthly', 30), ('weekly', 25), ('bi-weekly', 20), ('one-time', 15),
+               ('daily', 5), ('quarterly', 5)]
+QUOTE_STATUSES = [('pending', 30), ('accepted', 20), ('converted', 10), ('declined', 20),
+                  ('expired', 20)]
+SERVICES = ['vacuum', 'mop', 'bathroom', 'kitchen', 'windows', 'laundry']
+LOG_ACTIONS = [('Quote Created', 40), ('Quote Updated', 20), ('Job Created', 20),
+               ('Customer Added', 10), ('Employee Added', 2), ('Payment Recorded', 8)]
+
+# Materials_Services catalog rows: (ID, Type, Category, Name, Unit_Type, Cost, Price)
+CATALOG = [
+    ('MAT001', 'material', 'supplies', 'General Cleaning Supplies', 'sqft', 0.006, 0.01),
+    ('MAT002', 'material', 'supplies', 'Disinfectant Concentrate', 'gallon', 18.0, 32.0),
+    ('MAT003', 'material', 'supplies', 'Microfiber Cloth Pack', 'pack', 9.0, 15.0),
+    ('MAT004', 'material', 'paper', 'Paper Towels Case', 'case', 24.0, 38.0),
+    ('MAT005', 'material', 'paper', 'Toilet Paper Case', 'case', 30.0, 45.0),
+    ('SRV001', 'service', 'floors', 'Vacuum Service', 'visit', 0.0, 0.0),
+    ('SRV002', 'service', 'floors', 'Mopping Service', 'visit', 0.0, 0.0),
+    ('SRV003', 'service', 'glass', 'Window Washing', 'visit', 12.0, 30.0),
+    ('SRV008', 'service', 'restock', 'Supply Restocking', 'visit', 15.0, 40.0),
+    ('SRV009', 'service', 'deep', 'Kitchen Deep Clean', 'visit', 20.0, 50.0),
+    ('SRV010', 'service', 'deep', 'Restroom Deep Clean', 'restroom', 10.0, 25.0),
+]
+
+ENTITIES = ('employees', 'customers', 'quotes', 'jobs', 'payments', 'activity')
+
+def default_counts(size):
+    """Row counts for each sheet given the headline dataset size"""
+    return {
+        'quotes': size,
+        'customers': max(1, size // 4),
+        'jobs': size,
+        'employees': max(5, size // 2000),
+        'payments': max(1, size // 2),
+        'activity': size
+    }
+
+def weighted(rng, choices):
+    """Pick a value from [(value, weight), ...]"""
+    values, weights = zip(*choices)
+    return rng.choices(values, weights)[0]
+
+def person_name(rng):
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+
+def business_name(rng):
+    return f"{rng.choice(BUSINESS_WORDS)} {rng.choice(BUSINESS_KINDS)}"
+
+def address(rng):
+    city, zip_code = rng.choice(CITIES)
+    return f"{rng.randint(1, 999)} {rng.choice(STREETS)}", city, zip_code
+
+def email_for(name, n):
+    return f"{name.lower().replace(' ', '.')}{n}@example.com"
+
+def phone(rng):
+    return f"({rng.choice(['617', '781', '857', '339'])}) {rng.randint(200, 999)}-{rng.randint(0, 9999):04d}"
+
+# ==================== ROW GENERATORS ====================
+
+def employee_rows(count, rng, now):
+    for n in range(1, count + 1):
+        name = person_name(rng)
+        street, city, zip_code = address(rng)
+        role = 'Admin' if n == 1 else weighted(rng, [('Cleaner', 85), ('Supervisor', 15)])
+        start = now - timedelta(days=rng.randint(30, 2000))
+        yield [
+            f"E{n:06d}", name, email_for(name, n), phone(rng), f"user{n}", 'password123',
+            role, rng.choice([18, 20, 22, 25, 28]), 'yes' if rng.random() < 0.9 else 'no',
+            start.date().isoformat(), street, city, 'MA', zip_code, person_name(rng),
+            phone(rng), 'general;floors', '', '',
+            (now - timedelta(hours=rng.randint(1, 500))).isoformat(timespec='seconds')
+        ]
+
+def customer_rows(count, rng, now, names):
+    for n in range(1, count + 1):
+        commercial = rng.random() < 0.6
+        name = business_name(rng) if commercial else person_name(rng)
+        names.append(name)
+        street, city, zip_code = address(rng)
+        created = now - timedelta(days=rng.randint(0, 730), seconds=rng.randint(0, 86399))
+        yield [
+            f"C{n:08d}", name, email_for(name, n), phone(rng), street, city, 'MA', zip_code,
+            weighted(rng, [('active', 85), ('inactive', 15)]), created.isoformat(timespec='seconds'),
+            'commercial' if commercial else 'residential', name if commercial else '',
+            weighted(rng, FREQUENCIES), created.date().isoformat(), '',
+            rng.choice(['$100-250', '$250-500', '$500-1000', '$1000+']), '',
+            rng.choice(['Web Quote', 'Referral', 'Google', 'Walk-in']), '', ''
+        ]
+
+def quote_rows(count, rng, now, customer_count, employee_count):
+    for n in range(1, count + 1):
+        name = person_name(rng)
+        street, city, zip_code = address(rng)
+        created = now - timedelta(days=rng.randint(0, 730), seconds=rng.randint(0, 86399))
+        property_type = weighted(rng, PROPERTY_TYPES)
+        frequency = weighted(rng, FREQUENCIES)
+        sqft = rng.choice([800, 1200, 1500, 2000, 2500, 3000, 4000, 5000, 8000, 12000, 20000])
+        bathrooms = rng.randint(1, 6)
+        services = rng.sample(SERVICES, rng.randint(0, 4))
+        service_type = weighted(rng, [('regular', 80), ('deep-clean', 12), ('move-in-out', 5),
+                                      ('post-construction', 3)])
+        status = weighted(rng, QUOTE_STATUSES)
+        if status == 'pending' and created < now - timedelta(days=30):
+            status = 'expired' if rng.random() < 0.7 else 'pending'
+
+        properties = [{'id': 1, 'name': f"{property_type.title()} Property",
+                       'facilityType': property_type, 'squareFeet': sqft,
+                       'restrooms': bathrooms, 'windows': 10, 'rooms': bathrooms + 3,
+                       'floors': 1}]
+        quote = pricing.quote_input(property_type, sqft, frequency, services, bathrooms, service_type)
+        materials, quote_services = pricing.catalog_entries(quote)
+        converted = status in ('accepted', 'converted')
+
+        yield [
+            f"Q{n:08d}", created.isoformat(timespec='seconds'), name, email_for(name, n),
+            phone(rng), street, city, 'MA', zip_code, json.dumps(properties),
+            json.dumps(materials), json.dumps(quote_services), '[]',
+            *pricing.price(quote).sheet_values(),
+            status, (created + timedelta(days=30)).isoformat(timespec='seconds'),
+            '', f"Web quote from {property_type} property - {sqft} sqft - {frequency} service",
+            weighted(rng, [('Web Form', 85), ('Admin', 15)]),
+            f"E{rng.randint(1, employee_count):06d}" if rng.random() < 0.3 else '',
+            (created + timedelta(days=rng.randint(2, 10))).date().isoformat() if status == 'pending' else '',
+            f"C{rng.randint(1, customer_count):08d}" if converted else '',
+            (created + timedelta(days=rng.randint(1, 20))).isoformat(timespec='seconds') if converted else '',
+            rng.choice(['Price too high', 'Went with competitor', 'No response']) if status == 'declined' else '',
+            service_type, frequency, 0
+        ]
+
+def job_rows(count, rng, now, customer_names, employee_count):
+    for n in range(1, count + 1):
+        customer = rng.randint(1, len(customer_names))
+        street, city, _ = address(rng)
+        day = now + timedelta(days=rng.randint(-365, 60))
+        past = day.date() < now.date()
+        status = (weighted(rng, [('completed', 90), ('cancelled', 10)]) if past
+                  else weighted(rng, [('scheduled', 95), ('cancelled', 5)]))
+        price = round(rng.uniform(90, 1200), 2)
+        labor = round(price * rng.uniform(0.3, 0.5), 2)
+        material = round(price * 0.05, 2)
+        crew = sorted({f"E{rng.randint(1, employee_count):06d}" for _ in range(rng.randint(1, 3))})
+        yield [
+            f"J{n:08d}", f"C{customer:08d}", customer_names[customer - 1], f"{street}, {city}",
+            day.date().isoformat(), rng.choice(['08:00', '09:00', '11:00', '13:00', '15:00', '17:00']),
+            rng.choice([2, 3, 4, 6]), json.dumps(crew), status,
+            weighted(rng, [('regular', 85), ('deep', 15)]), weighted(rng, FREQUENCIES),
+            price, labor, material, round(price - labor - material, 2),
+            'paid' if status == 'completed' and rng.random() < 0.85 else 'pending',
+            rng.choice(['card', 'check', 'cash', '']), '', '',
+            f"{day.date().isoformat()}T{rng.randint(10, 19)}:00:00" if status == 'completed' else '',
+            (day - timedelta(days=rng.randint(1, 30))).isoformat(timespec='seconds'), 'Admin',
+            '', '', rng.choice(['', '', '4', '5']) if status == 'completed' else ''
+        ]
+
+def payment_rows(count, rng, now, customer_names, job_count):
+    for n in range(1, count + 1):
+        paid = now - timedelta(days=rng.randint(0, 365), seconds=rng.randint(0, 86399))
+        yield [
+            f"P{n:08d}", rng.choice(customer_names),
+            round(rng.uniform(90, 2500), 2), paid.isoformat(timespec='seconds'),
+            weighted(rng, [('card', 60), ('check', 25), ('cash', 15)]), f"INV-{n:07d}",
+            weighted(rng, [('completed', 95), ('refunded', 5)]),
+            f"J{rng.randint(1, job_count):08d}", ''
+        ]
+
+def activity_rows(count, rng, now):
+    for n in range(1, count + 1):
+        when = now - timedelta(seconds=rng.randint(0, 365 * 86400))
+        action = weighted(rng, LOG_ACTIONS)
+        yield [when.isoformat(timespec='seconds'), action, f"{action} #{n}",
+               rng.choice(['System', 'Admin', 'Web Form']), '']
+
+def catalog_rows(now):
+    for item_id, kind, category, name, unit, cost, price in CATALOG:
+        yield [item_id, kind, category, name, '', unit, cost, price, 'yes',
+               now.date().isoformat(), 'System', '', '', '', '']
+
+# ==================== OUTPUTS ====================
+
+class SqliteOutput:
+    """Writes each sheet to a table in a SQLite file (loadable by OfflineSpreadsheet)"""
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path)
+
+    def write(self, title, headers, rows):
+        write_sqlite_table(self.conn, title, headers, [])
+        placeholders = ', '.join('?' for _ in headers)
+        for chunk in chunks(rows):
+            self.conn.executemany(f'INSERT INTO "{title}" VALUES ({placeholders})', chunk)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+class CsvOutput:
+    """Writes each sheet to <directory>/<title>.csv"""
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def write(self, title, headers, rows):
+        with open(os.path.join(self.directory, f"{title}.csv"), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            for chunk in chunks(rows):
+                writer.writerows(chunk)
+
+    def close(self):
+        pass
+
+class SpreadsheetOutput:
+    """Appends each sheet to a gspread-compatible spreadsheet (e.g. OfflineSpreadsheet)"""
+    def __init__(self, spreadsheet):
+        self.spreadsheet = spreadsheet
+
+    def write(self, title, headers, rows):
+        sheet = self.spreadsheet.add_worksheet(title=title, rows=1000, cols=len(headers))
+        sheet.append_row(headers)
+        for chunk in chunks(rows):
+            sheet.append_rows(chunk)
+
+    def close(self):
+        pass
+
+def chunks(rows, size=CHUNK_SIZE):
+    rows = iter(rows)
+    while True:
+        chunk = [[str(v) for v in row] for row in islice(rows, size)]
+        if not chunk:
+            return
+        yield chunk
+
+def generate_dataset(output, counts, seed=42, now=None, verbose=False):
+    """Generate every sheet into an output object and return rows written per sheet"""
+    now = now or datetime(2026, 1, 1, 9, 0, 0)
+    counts = dict(counts)
+
+    def rng(entity):
+        return random.Random(f"{seed}:{entity}")
+
+    customer_names = []
+    sheets = [
+        ('Employees', EMPLOYEE_HEADERS, employee_rows(counts['employees'], rng('employees'), now)),
+        ('Customers', CUSTOMER_HEADERS, customer_rows(counts['customers'], rng('customers'), now,
+                                                            customer_names)),
+        ('Materials_Services', MATERIAL_HEADERS, catalog_rows(now)),
+        ('Quotes', QUOTE_HEADERS, quote_rows(counts['quotes'], rng('quotes'), now,
+                                             counts['customers'], counts['employees'])),
+        ('Jobs', JOB_HEADERS, job_rows(counts['jobs'], rng('jobs'), now,
+                                       customer_names, counts['employees'])),
+        ('Payments', PAYMENT_HEADERS, payment_rows(counts['payments'], rng('payments'), now,
+                                                   customer_names, max(1, counts['jobs']))),
+        ('Activity_Log', ACTIVITY_LOG_HEADERS, activity_rows(counts['activity'], rng('activity'), now)),
+    ]
+
+    written = {}
+    for title, headers, rows in sheets:
+        started = time.perf_counter()
+        counter = {'n': 0}
+
+        def counted(rows=rows):
+            for row in rows:
+                counter['n'] += 1
+                yield row
+
+        output.write(title, headers, counted())
+        written[title] = counter['n']
+        if verbose:
+            elapsed = time.perf_counter() - started
+            print(f"  ✅ {title}: {counter['n']:,} rows in {elapsed:.1f}s")
+
+    output.close()
+    return written
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Generate a seeded synthetic dataset')
+    parser.add_argument('--size', type=int, default=10000,
+                        help='headline volume; other sheets scale from it')
+    for entity in ENTITIES:
+        parser.add_argument(f'--{entity}', type=int, help=f'override the number of {entity} rows')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--out', required=True, help='SQLite file or CSV directory')
+    parser.add_argument('--format', choices=['sqlite', 'csv'],
+                        help='defaults to sqlite for .db/.sqlite paths, csv otherwise')
+    args = parser.parse_args()
+
+    counts = default_counts(args.size)
+    for entity in ENTITIES:
+        if getattr(args, entity) is not None:
+            counts[entity] = getattr(args, entity)
+
+    output_format = args.format or ('sqlite' if args.out.endswith(('.db', '.sqlite')) else 'csv')
+    if output_format == 'sqlite':
+        if os.path.exists(args.out):
+            os.remove(args.out)
+        output = SqliteOutput(args.out)
+    else:
+        output = CsvOutput(args.out)
+
+    print(f"🧪 Generating dataset (seed {args.seed}) into {args.out}...")
+    print("=" * 50)
+    started = time.perf_counter()
+    generate_dataset(output, counts, seed=args.seed, verbose=True)
+    print("=" * 50)
+    print(f"✅ Done in {time.perf_counter() - started:.1f}s")
@@ -34,10 +34,7 @@ def load_test_data():
     
     print("Adding employees...")
     for emp in employees:
-        emp_id = db.add_employee(
-            emp['name'], emp['email'], emp['phone'],
-            emp['username'], emp['password'], emp['hourly_rate']
-        )
+        emp_id = db.add_employee(emp)
         print(f"  ✅ Added employee: {emp['name']} (Username: {emp['username']})")
     
     # Sample customers
@@ -55,18 +52,18 @@ def load_test_data():
     ]
     
     print("\nAdding customers...")
-    customer_ids = []
-    for cust in customers:
-        cust_id = db.add_customer(
-            cust['name'], cust['email'], cust['phone'], cust['address'],
-            cust['type'], cust['sqft'], 'weekly'
-        )
-        customer_ids.append(cust_id)
-        print(f"  ✅ Added customer: {cust['name']}")
+    result = db.bulk_add_customers({
+        'name': cust['name'], 'email': cust['email'], 'phone': cust['phone'],
+        'address': cust['address'], 'type': cust['type'], 'frequency': 'weekly',
+        'source': 'Test Data'
+    } for cust in customers)
+    customer_ids = dict(zip((cust['name'] for cust in customers), result.get('ids', [])))
+    print(f"  ✅ Added {result.get('added', 0)} customers")
     
     # Sample jobs for the next 30 days
     print("\nScheduling jobs...")
-    job_count = 0
+    from modules.pricing import catalog_entries, price, quote_input
+    jobs = []
     for i in range(30):
         date = datetime.now() + timedelta(days=i)
         if date.weekday() < 5:  # Weekdays only
@@ -80,24 +77,20 @@ def load_test_data():
                 times = ['09:00', '11:00', '14:00', '16:00']
                 for j in range(min(num_jobs, len(available_customers))):
                     cust = available_customers[j]
-                    time = times[j] if j < len(times) else '10:00'
-                    
-                    # Calculate price
-                    from utils.helpers import calculate_price
-                    price = calculate_price(cust['type'], cust['sqft'], 'weekly')
-                    
-                    job_id = db.add_job(
-                        cust['name'],
-                        date.strftime('%Y-%m-%d'),
-                        time,
-                        emp['name'],
-                        cust['address'],
-                        'weekly',
-                        price
-                    )
-                    job_count += 1
-    
-    print(f"  ✅ Created {job_count} jobs")
+                    jobs.append({
+                        'customer_id': customer_ids.get(cust['name'], ''),
+                        'customer_name': cust['name'],
+                        'property_address': cust['address'],
+                        'date': date.strftime('%Y-%m-%d'),
+                        'time': times[j] if j < len(times) else '10:00',
+                        'employees': [emp['name']],
+                        'frequency': 'weekly',
+                        'total_price': round(price(quote_input(cust['type'], cust['sqft'], 'weekly')).total_amount, 2),
+                        'created_by': 'Test Data'
+                    })
+    
+    result = db.bulk_add_jobs(jobs)
+    print(f"  ✅ Created {result.get('added', 0)} jobs")
     
     # Sample quotes
     print("\nAdding sample quotes...")
@@ -110,15 +103,26 @@ def load_test_data():
          'type': 'medical', 'sqft': 6000, 'service': 'weekly'},
     ]
     
+    quote_rows = []
     for quote in quotes:
-        from utils.helpers import calculate_price
-        price = calculate_price(quote['type'], quote['sqft'], quote['service'])
-        
-        quote_id = db.add_quote(
-            quote['name'], quote['email'], quote['phone'],
-            quote['type'], quote['sqft'], quote['service'], price
-        )
-        print(f"  ✅ Added quote: {quote['name']} - ${price:.2f}")
+        quote_in = quote_input(quote['type'], quote['sqft'], quote['service'])
+        breakdown = price(quote_in)
+        materials, services = catalog_entries(quote_in)
+        quote_rows.append({
+            'Customer_Name': quote['name'],
+            'Customer_Email': quote['email'],
+            'Customer_Phone': quote['phone'],
+            'Properties': [{'facilityType': quote['type'], 'squareFeet': quote['sqft']}],
+            'Materials': materials,
+            'Services': services,
+            **breakdown.sheet_fields(),
+            'Frequency': quote_in.frequency,
+            'Created_By': 'Test Data'
+        })
+        print(f"  ✅ Quote: {quote['name']} - ${breakdown.total_amount:.2f}")
+    
+    result = db.bulk_add_quotes(quote_rows)
+    print(f"  ✅ Added {result.get('added', 0)} quotes")
     
     # Mark some past jobs as completed
     print("\nMarking some jobs as completed...")
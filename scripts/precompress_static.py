@@ -0,0 +1,90 @@
+"""
+Precompress Static Files
+Writes maximum-compression .gz (and .br, when the Brotli package is
+installed) copies next to every compressible file under static/, so the
+compression layer can serve them without compressing on each request.
+Run it as a build/deploy step after static files change.
+"""
+
+import argparse
+import mimetypes
+import os
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+from utils.compression import (COMPRESSIBLE_TYPES, PRECOMPRESSED_SUFFIXES, available_encodings,
+                               compress)
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'static')
+
+# User uploads are not build artifacts
+SKIP_DIRS = {'uploads'}
+
+MAX_LEVELS = {'br': 11, 'gzip': 9}
+
+def iter_static_files(static_dir):
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+        for name in files:
+            if not name.endswith(tuple(PRECOMPRESSED_SUFFIXES.values())):
+                yield os.path.join(root, name)
+
+def precompress_static(static_dir=STATIC_DIR, min_size=Config.COMPRESS_MIN_SIZE, clean=False):
+    """Write (or with clean=True, remove) precompressed copies of static files"""
+
+    print(f"🗜️  Precompressing {static_dir}...")
+    print("=" * 50)
+
+    written = skipped = 0
+    encodings = available_encodings()
+    if 'br' not in encodings:
+        print("  ⚠️  Brotli package not installed - writing .gz files only")
+
+    for path in iter_static_files(static_dir):
+        relative = os.path.relpath(path, static_dir)
+        targets = {encoding: path + suffix for encoding, suffix in PRECOMPRESSED_SUFFIXES.items()}
+
+        if clean:
+            for target in targets.values():
+                if os.path.exists(target):
+                    os.remove(target)
+            continue
+
+        mimetype = mimetypes.guess_type(path)[0] or ''
+        compressible = mimetype in COMPRESSIBLE_TYPES or mimetype.startswith('text/')
+        size = os.path.getsize(path)
+        if not compressible or size < min_size:
+            skipped += 1
+            continue
+
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        for encoding in encodings:
+            compressed = compress(data, encoding, MAX_LEVELS[encoding])
+            if len(compressed) >= size:
+                continue
+            with open(targets[encoding], 'wb') as f:
+                f.write(compressed)
+            written += 1
+            print(f"  ✅ {relative}{PRECOMPRESSED_SUFFIXES[encoding]}: "
+                  f"{size:,} -> {len(compressed):,} bytes")
+
+    print("=" * 50)
+    if clean:
+        print("✅ Removed precompressed files")
+    else:
+        print(f"✅ Wrote {written} files, skipped {skipped} small or binary files")
+    return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Precompress static files')
+    parser.add_argument('--static-dir', default=STATIC_DIR)
+    parser.add_argument('--min-size', type=int, default=Config.COMPRESS_MIN_SIZE,
+                        help='skip files smaller than this many bytes')
+    parser.add_argument('--clean', action='store_true', help='remove precompressed copies')
+    args = parser.parse_args()
+
+    sys.exit(0 if precompress_static(args.static_dir, args.min_size, args.clean) else 1)
@@ -0,0 +1,169 @@
+"""
+Startup Profiler
+Measures a cold start the way a worker restart sees it: a fresh interpreter
+imports the app and serves its first request. Reports import time per
+module (python -X importtime), time to build each shared service, and
+checks the cold start against Config.COLD_START_TARGET_MS. Exits non-zero
+when the target is missed or a deferred integration is imported at startup.
+
+    python scripts/profile_startup.py --runs 5 --top 25
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+from utils.benchmark import environment, save_results
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Integrations that must load on first use, never while the app starts
+DEFERRED_MODULES = ('google.generativeai', 'gspread', 'googleapiclient',
+                    'google.auth', 'google.oauth2')
+
+RESULT_MARKER = '@@startup@@'
+
+# Runs in the fresh interpreter being profiled
+PROBE = r'''
+import json, sys, time
+started = time.perf_counter()
+import app
+application = app.app  # built on first access
+imported = time.perf_counter()
+status = application.test_client().get('/').status_code
+served = time.perf_counter()
+deferred = [m for m in DEFERRED if m in sys.modules]
+
+services_ms = {}
+if WITH_SERVICES:
+    print(MARKER, file=sys.stderr, flush=True)
+    from modules import services
+    for name in services.PRELOADED_SERVICES:
+        began = time.perf_counter()
+        services.get_service(name)
+        services_ms[name] = round((time.perf_counter() - began) * 1000, 1)
+
+print(MARKER + json.dumps({
+    'import_ms': round((imported - started) * 1000, 1),
+    'first_request_ms': round((served - imported) * 1000, 1),
+    'first_request_status': status,
+    'deferred_loaded': deferred,
+    'services_ms': services_ms
+}))
+'''
+
+def run_probe(with_services):
+    """Profile one cold start in a new interpreter.
+
+    Returns (result, startup import rows, service import rows).
+    """
+    code = (f"DEFERRED = {DEFERRED_MODULES!r}\nWITH_SERVICES = {with_services!r}\n"
+            f"MARKER = {RESULT_MARKER!r}\n" + PROBE)
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                          cwd=ROOT, capture_output=True, text=True)
+    lines = [l for l in proc.stdout.splitlines() if l.startswith(RESULT_MARKER)]
+    if proc.returncode != 0 or not lines:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else 'probe failed')
+    startup, _, service = proc.stderr.partition(RESULT_MARKER)
+    return json.loads(lines[-1][len(RESULT_MARKER):]), parse_importtime(startup), parse_importtime(service)
+
+def parse_importtime(stderr):
+    """[(module, self_us, cumulative_us, depth)] from -X importtime output"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|')
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+def profile_startup(runs=3, top=20, target_ms=Config.COLD_START_TARGET_MS,
+                    with_services=True, save=False):
+    """Profile `runs` cold starts and print the report. Returns True when on target"""
+
+    print("🚀 Startup Profile")
+    print("=" * 50)
+
+    results, imports, service_imports = [], [], []
+    for _ in range(runs):
+        try:
+            result, rows, service_rows = run_probe(with_services)
+        except Exception as e:
+            print(f"❌ Could not start the app: {e}")
+            return False
+        results.append(result)
+        imports.append(rows)
+        service_imports.append(service_rows)
+
+    cold_start = [r['import_ms'] + r['first_request_ms'] for r in results]
+    median = statistics.median(cold_start)
+    on_target = median <= target_ms
+    deferred = sorted({m for r in results for m in r['deferred_loaded']})
+
+    print(f"{'✅' if on_target else '❌'} Cold start: {median:.0f} ms median of {runs} "
+          f"(target {target_ms} ms, range {min(cold_start):.0f}-{max(cold_start):.0f} ms)")
+    print(f"   import app: {statistics.median(r['import_ms'] for r in results):.0f} ms, "
+          f"first request: {statistics.median(r['first_request_ms'] for r in results):.0f} ms "
+          f"(HTTP {results[0]['first_request_status']})")
+    if deferred:
+        print(f"❌ Loaded at startup but should be deferred: {', '.join(deferred)}")
+    else:
+        print("✅ Google/Gemini integrations are deferred until first use")
+
+    # Per-module times from the fastest run (least scheduling noise)
+    fastest_run = cold_start.index(min(cold_start))
+    fastest = imports[fastest_run]
+
+    if with_services:
+        print("\n⏱️  Service initialization on first use (includes deferred imports):")
+        for name in results[0]['services_ms']:
+            print(f"   {name:<8} {statistics.median(r['services_ms'][name] for r in results):8.1f} ms")
+        top_level = [r for r in service_imports[fastest_run] if r[3] == 0]
+        for name, self_us, cumulative_us, depth in sorted(top_level, key=lambda r: -r[2])[:5]:
+            print(f"   {cumulative_us / 1000:8.1f} ms  import {name}")
+
+    print(f"\n📦 Slowest startup imports (cumulative ms):")
+    for name, self_us, cumulative_us, depth in sorted(fastest, key=lambda r: -r[2])[:top]:
+        print(f"   {cumulative_us / 1000:8.1f}  {'  ' * min(depth, 6)}{name}")
+
+    by_package = defaultdict(int)
+    for name, self_us, cumulative_us, depth in fastest:
+        by_package[name.split('.')[0]] += self_us
+    print(f"\n📦 Import time by top-level package (self ms):")
+    for package, self_us in sorted(by_package.items(), key=lambda p: -p[1])[:top]:
+        print(f"   {self_us / 1000:8.1f}  {package}")
+
+    if save:
+        path = save_results({
+            'environment': environment(),
+            'target_ms': target_ms,
+            'cold_start_ms': cold_start,
+            'runs': results,
+            'imports': [{'module': n, 'self_us': s, 'cumulative_us': c}
+                        for n, s, c, _ in fastest]
+        }, name='startup')
+        print(f"\n💾 Saved {path}")
+
+    print("=" * 50)
+    return on_target and not deferred
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Profile app cold start time')
+    parser.add_argument('--runs', type=int, default=3, help='cold starts to measure')
+    parser.add_argument('--top', type=int, default=20, help='modules to list')
+    parser.add_argument('--target-ms', type=int, default=Config.COLD_START_TARGET_MS)
+    parser.add_argument('--no-services', action='store_true',
+                        help='skip timing the Sheets/Gemini/email clients')
+    parser.add_argument('--save', action='store_true', help='write the results under benchmarks/')
+    args = parser.parse_args()
+
+    ok = profile_startup(args.runs, args.top, args.target_ms, not args.no_services, args.save)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,87 @@
+"""
+Re-price Pending Quotes
+Recomputes every pending quote with the current pricing rules and writes
+back the rows whose totals changed, in batched range updates. Run it with
+--dry-run first to see the diff. Meant to run after the rates change.
+"""
+
+import argparse
+import os
+import sys
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules.catalog import Catalog
+from modules.sheets_db import REPRICE_BATCH_SIZE, SheetsDatabase
+
+def print_diff(changes, limit):
+    """Print the largest total changes first"""
+    def delta(change):
+        try:
+            return change['new_total'] - float(change['old_total'])
+        except (TypeError, ValueError):
+            return change['new_total']
+
+    print(f"\n{'Quote':<18} {'Customer':<24} {'Old total':>12} {'New total':>12} {'Change':>11}")
+    for change in sorted(changes, key=lambda c: -abs(delta(c)))[:limit]:
+        print(f"{change['ID']:<18} {str(change['Customer_Name'])[:24]:<24} "
+              f"{str(change['old_total']):>12} {change['new_total']:>12,.2f} {delta(change):>+11,.2f}")
+    if len(changes) > limit:
+        print(f"... and {len(changes) - limit} more")
+
+    total = sum(delta(c) for c in changes)
+    print(f"Net change across {len(changes)} quotes: {total:+,.2f}")
+
+def reprice_quotes(dry_run=False, include_adjusted=False, batch_size=REPRICE_BATCH_SIZE, show=20):
+    """Re-price pending quotes and report the diff and throughput"""
+
+    print("💲 Re-pricing pending quotes...")
+    print("=" * 50)
+
+    db = SheetsDatabase()
+    if not db.spreadsheet:
+        print("❌ Could not connect to Google Sheets")
+        return False
+
+    # Price with the current Materials_Services catalog prices
+    catalog = Catalog(db)
+    catalog.refresh()
+    print(f"Catalog version: {catalog.version} ({len(catalog.items)} items)")
+
+    result = db.reprice_pending_quotes(dry_run=dry_run, include_adjusted=include_adjusted,
+                                       batch_size=batch_size)
+    if not result.get('success'):
+        print(f"❌ {result.get('error')}")
+        return False
+
+    print(f"Rules version: {result['rules_version']}")
+    print(f"  ✅ Scanned {result['scanned']:,} quotes ({result['pending']:,} pending) in "
+          f"{result['seconds']:.2f}s - {result['rows_per_second']:,.0f} rows/sec")
+    if result['adjusted']:
+        print(f"  ⏭️  Skipped {result['adjusted']:,} pending quotes with a negotiated price "
+              f"(--include-adjusted to re-price them too)")
+    verb = 'Would update' if dry_run else 'Updated'
+    count = result['changed'] if dry_run else result['updated']
+    print(f"  ✅ {verb} {count:,} quotes whose totals changed")
+    if result.get('skipped'):
+        print(f"  ⏭️  Skipped {result['skipped']:,} quotes changed or removed in the sheet while repricing")
+
+    if result['changes'] and (dry_run or show):
+        print_diff(result['changes'], show)
+
+    print("=" * 50)
+    return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--dry-run', action='store_true',
+                        help='only report the quotes whose totals would change')
+    parser.add_argument('--include-adjusted', action='store_true',
+                        help='also re-price quotes given a negotiated price in admin')
+    parser.add_argument('--batch-size', type=int, default=REPRICE_BATCH_SIZE,
+                        help='rows written per batch update call')
+    parser.add_argument('--show', type=int, default=20, help='changed quotes to list')
+    args = parser.parse_args()
+
+    ok = reprice_quotes(args.dry_run, args.include_adjusted, args.batch_size, args.show)
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,91 @@
+"""
+Run Quote Follow-Ups
+Sends the office a reminder digest for open quotes whose Follow_Up_Date
+has arrived and expires pending quotes past Valid_Until. Runs one pass
+by default (for cron); --watch keeps the schedule in memory and checks
+again every FOLLOW_UP_INTERVAL_SECONDS.
+
+Examples:
+  python scripts/run_followups.py --dry-run
+  python scripts/run_followups.py
+  python scripts/run_followups.py --watch --batch-size 100
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from config import Config
+from modules.email_service import EmailService
+from modules.followups import FollowUpScheduler
+from modules.sheets_db import SheetsDatabase
+
+def list_due(scheduler):
+    """Print what a run would act on, without writing"""
+    scheduler.sync()
+    due = scheduler.peek_due()
+    print(f"📅 {len(scheduler):,} scheduled, {len(due):,} due now")
+    for when, kind, quote_id in due:
+        print(f"  • {quote_id}: {kind.replace('_', '-')} due {when:%Y-%m-%d %H:%M}")
+    return True
+
+def run_once(scheduler, batch_size, email_service):
+    result = scheduler.run_due(batch_size=batch_size, email_service=email_service)
+    if not result.get('success'):
+        print(f"  ❌ {result.get('error')}")
+    if result['expired']:
+        print(f"  ⌛ Expired {len(result['expired']):,} quotes")
+    if result['reminded']:
+        print(f"  🔔 {len(result['reminded']):,} follow-ups due, {result['emailed']:,} emailed")
+    if result['failed']:
+        print(f"  📭 {len(result['failed']):,} follow-ups kept for the next run (email not sent)")
+    if result['skipped']:
+        print(f"  ↪️  Skipped {len(result['skipped']):,} quotes changed in the sheet")
+    next_due = scheduler.next_due()
+    print(f"  Next due: {next_due:%Y-%m-%d %H:%M}" if next_due else "  Nothing else scheduled")
+    return result.get('success')
+
+def run_followups(batch_size, watch=False, dry_run=False):
+    """Act on due follow-ups and expiries; True when every pass succeeded"""
+
+    print("🔔 Running quote follow-ups...")
+    print("=" * 50)
+
+    db = SheetsDatabase()
+    if not db.spreadsheet:
+        print("❌ Could not connect to Google Sheets")
+        return False
+
+    scheduler = FollowUpScheduler(db)
+    print(f"Loaded {scheduler.load():,} scheduled follow-ups and expiries")
+    if dry_run:
+        return list_due(scheduler)
+
+    email_service = EmailService()
+    ok = run_once(scheduler, batch_size, email_service)
+    try:
+        while watch:
+            time.sleep(Config.FOLLOW_UP_INTERVAL_SECONDS)
+            ok = run_once(scheduler, batch_size, email_service) and ok
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db.flush_log()
+
+    print("=" * 50)
+    return ok
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--batch-size', type=int, default=Config.FOLLOW_UP_BATCH_SIZE,
+                        help='quotes written per sheet update (default %(default)s)')
+    parser.add_argument('--watch', action='store_true',
+                        help=f'keep running, checking every {Config.FOLLOW_UP_INTERVAL_SECONDS}s')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='only list the quotes that are due')
+    args = parser.parse_args()
+
+    sys.exit(0 if run_followups(args.batch_size, args.watch, args.dry_run) else 1)
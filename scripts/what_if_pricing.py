@@ -0,0 +1,114 @@
+"""
+What-If Pricing
+Reprices the whole book of quotes under proposed rate changes and reports
+how totals would move, overall and per property type. Both the current
+and the proposed rules run through the vectorized batch pricer.
+
+    python scripts/what_if_pricing.py --set property_rates.office=0.06 \
+        --set frequency_discounts.weekly=0.25 --status pending
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Add parent directory to path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules import pricing
+
+def proposed_rules(changes, rules=None):
+    """Compile rules with 'table.key=value' / 'name=value' changes applied"""
+    tables = (rules or pricing.get_rules()).to_dict()
+    for change in changes:
+        path, _, value = change.partition('=')
+        *parents, key = path.strip().split('.')
+        target = tables
+        for name in parents:
+            target = target[name]
+        if not parents and key not in tables:
+            raise KeyError(f"Unknown rate table: {key}")
+        target[key] = float(value)
+    return pricing.PricingRules(tables)
+
+def what_if(records, proposed, rules=None):
+    """Price records under the current and proposed rules.
+
+    Returns (columns, current Breakdown, proposed Breakdown, seconds spent
+    in the two batch pricing calls).
+    """
+    rules = rules or pricing.get_rules()
+    columns = pricing.columns_from_records(records, rules)
+
+    started = time.perf_counter()
+    current = rules.price_batch(columns)
+    changed = proposed.price_batch(columns)
+    return columns, current, changed, time.perf_counter() - started
+
+def report(records, changes, top=10):
+    import numpy as np
+
+    print("📊 What-If Pricing")
+    print("=" * 50)
+
+    rules = pricing.get_rules()
+    try:
+        proposed = proposed_rules(changes, rules)
+    except (KeyError, TypeError, ValueError) as e:
+        print(f"❌ Invalid rate change: {e}")
+        return False
+
+    if not records:
+        print("No quotes to reprice")
+        return True
+
+    columns, current, changed, elapsed = what_if(records, proposed, rules)
+    before = current.total_amount.round(2)
+    after = changed.total_amount.round(2)
+    delta = after - before
+
+    print(f"Rules {rules.version} -> {proposed.version}: {', '.join(changes) or 'no changes'}")
+    print(f"Repriced {len(records):,} quotes twice in {elapsed * 1000:.1f} ms")
+    print(f"  Book total: ${before.sum():,.2f} -> ${after.sum():,.2f} "
+          f"({delta.sum():+,.2f}, {delta.sum() / before.sum() * 100 if before.sum() else 0:+.2f}%)")
+    print(f"  Quotes changed: {int(np.count_nonzero(delta)):,} "
+          f"(up {int((delta > 0).sum()):,}, down {int((delta < 0).sum()):,})")
+    print(f"  Average quote: ${before.mean():,.2f} -> ${after.mean():,.2f}")
+
+    types = np.asarray(columns['property_type'], dtype=object)
+    print(f"\nBy property type:")
+    rows = []
+    for property_type in set(columns['property_type']):
+        mask = types == property_type
+        rows.append((property_type or '(none)', int(mask.sum()), before[mask].sum(), delta[mask].sum()))
+    for property_type, count, total, change in sorted(rows, key=lambda r: -abs(r[3]))[:top]:
+        print(f"  {property_type:<12} {count:>8,} quotes  ${total:>14,.2f}  {change:+14,.2f}")
+
+    print("=" * 50)
+    return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--set', dest='changes', action='append', default=[],
+                        metavar='TABLE.KEY=VALUE',
+                        help='proposed rate, e.g. property_rates.office=0.06 or tax_rate=0.07')
+    parser.add_argument('--status', action='append',
+                        help='only quotes with this status (repeatable; default all)')
+    parser.add_argument('--include-archived', action='store_true',
+                        help='include quotes moved to the archive')
+    parser.add_argument('--top', type=int, default=10, help='property types to list')
+    args = parser.parse_args()
+
+    from modules.catalog import Catalog
+    from modules.sheets_db import SheetsDatabase
+    db = SheetsDatabase()
+    if not db.spreadsheet:
+        print("❌ Could not connect to Google Sheets")
+        sys.exit(1)
+    Catalog(db).refresh()  # current rules include the catalog prices
+
+    quotes = db.get_quotes(include_archived=args.include_archived)
+    if args.status:
+        quotes = [q for q in quotes if q.get('Status') in args.status]
+
+    sys.exit(0 if report(quotes, args.changes, args.top) else 1)
@@ -0,0 +1,105 @@
+"""
+Benchmark Helpers
+Timing, percentile and result-file helpers shared by the benchmark scripts
+"""
+
+import json
+import os
+import platform
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+def summarize(samples):
+    """Latency summary (milliseconds) for a list of durations in seconds"""
+    values = sorted(s * 1000 for s in samples)
+    return {
+        'runs': len(values),
+        'min_ms': round(values[0], 3) if values else 0.0,
+        'p50_ms': round(percentile(values, 50), 3),
+        'p95_ms': round(percentile(values, 95), 3),
+        'p99_ms': round(percentile(values, 99), 3),
+        'max_ms': round(values[-1], 3) if values else 0.0,
+        'mean_ms': round(sum(values) / len(values), 3) if values else 0.0
+    }
+
+def measure(fn, iterations=10, warmup=1, call_counter=None):
+    """Time fn() and report latency percentiles, API calls and peak memory.
+
+    call_counter is an optional Counter of API calls (for example
+    OfflineSpreadsheet.api_calls); calls are reported per iteration. Peak
+    memory comes from one extra traced run, so tracing never skews timings.
+    """
+    for _ in range(warmup):
+        fn()
+
+    calls_before = dict(call_counter) if call_counter is not None else {}
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+
+    result = summarize(samples)
+
+    if call_counter is not None:
+        calls = {name: (count - calls_before.get(name, 0)) / iterations
+                 for name, count in call_counter.items()
+                 if count != calls_before.get(name, 0)}
+        result['api_calls'] = round(sum(calls.values()), 2)
+        result['api_calls_by_method'] = {k: round(v, 2) for k, v in sorted(calls.items())}
+
+    tracemalloc.start()
+    try:
+        fn()
+        result['peak_memory_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+    finally:
+        tracemalloc.stop()
+
+    return result
+
+def git_commit():
+    """Short hash of the current commit, or None outside a git checkout"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except Exception:
+        return None
+
+def environment():
+    """Metadata recorded with every result file"""
+    return {
+        'commit': git_commit(),
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform()
+    }
+
+def save_results(results, path=None, name='benchmark'):
+    """Write results as JSON and return the path.
+
+    The default path is benchmarks/<name>-<commit>-<timestamp>.json so runs
+    from different commits can sit side by side.
+    """
+    if path is None:
+        meta = results.get('environment') or environment()
+        stamp = datetime.now().strftime('%Y%m%d%H%M%S')
+        path = os.path.join('benchmarks', f"{name}-{meta.get('commit') or 'nogit'}-{stamp}.json")
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+    return path
+
+def load_results(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
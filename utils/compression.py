@@ -0,0 +1,154 @@
+"""
+Response Compression
+App-wide gzip/brotli compression of responses. Small bodies are sent as
+they are, streamed responses are compressed chunk by chunk, and static
+files are served from the .br/.gz copies written by
+scripts/precompress_static.py when those exist.
+"""
+
+import os
+import zlib
+
+from flask import current_app, request, send_file
+from werkzeug.security import safe_join
+
+from config import Config
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+# Content types worth compressing (images, archives and PDFs already are)
+COMPRESSIBLE_TYPES = (
+    'text/html', 'text/css', 'text/plain', 'text/csv', 'text/javascript', 'text/xml',
+    'application/json', 'application/javascript', 'application/x-ndjson',
+    'application/xml', 'image/svg+xml'
+)
+
+# Precompressed sibling file suffix for each encoding
+PRECOMPRESSED_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+def available_encodings():
+    """Encodings this server can produce, best first"""
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+def negotiate_encoding(accept_encodings, encodings=None):
+    """Pick the best encoding the client accepts, or 'identity'"""
+    for encoding in encodings or available_encodings():
+        if accept_encodings[encoding]:
+            return encoding
+    return 'identity'
+
+def compress(data, encoding, level=None):
+    """Compress a whole body in one go"""
+    if encoding == 'br':
+        return brotli.compress(data, quality=level or Config.COMPRESS_BROTLI_QUALITY)
+    compressor = _gzip_compressor(level)
+    return compressor.compress(data) + compressor.flush()
+
+def _gzip_compressor(level=None):
+    """gzip-framed (wbits=31) deflate compressor"""
+    return zlib.compressobj(level or Config.COMPRESS_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+def iter_compressed(chunks, encoding, close=None):
+    """Compress a stream, flushing after every chunk so nothing is held back"""
+    try:
+        if encoding == 'br':
+            compressor = brotli.Compressor(quality=Config.COMPRESS_BROTLI_QUALITY)
+            for chunk in chunks:
+                data = compressor.process(chunk) + compressor.flush()
+                if data:
+                    yield data
+            yield compressor.finish()
+        else:
+            compressor = _gzip_compressor()
+            for chunk in chunks:
+                data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+                if data:
+                    yield data
+            yield compressor.flush()
+    finally:
+        if close is not None:
+            close()
+
+class Compression:
+    def __init__(self, app=None, min_size=None):
+        """Compress responses of app bigger than min_size bytes"""
+        self.min_size = Config.COMPRESS_MIN_SIZE if min_size is None else min_size
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.after_request(self.after_request)
+        app.extensions['compression'] = self
+
+    @staticmethod
+    def is_compressible(response):
+        mimetype = response.mimetype or ''
+        return mimetype in COMPRESSIBLE_TYPES or (
+            mimetype.startswith('text/') and mimetype != 'text/event-stream')
+
+    def after_request(self, response):
+        if (response.status_code != 200
+                or 'Content-Encoding' in response.headers
+                or 'no-transform' in response.headers.get('Cache-Control', '')
+                or not self.is_compressible(response)):
+            return response
+
+        if response.direct_passthrough:
+            # Files are never compressed on the fly; static ones may have a precompressed copy
+            if request.endpoint == 'static':
+                return self.precompressed_static(response)
+            return response
+
+        response.vary.add('Accept-Encoding')
+        encoding = negotiate_encoding(request.accept_encodings)
+        if encoding == 'identity':
+            return response
+
+        if response.is_streamed:
+            original = response.response
+            response.response = iter_compressed(response.iter_encoded(), encoding,
+                                                getattr(original, 'close', None))
+            response.headers.pop('Content-Length', None)
+        else:
+            data = response.get_data()
+            if len(data) < self.min_size:
+                return response
+            response.set_data(compress(data, encoding))
+
+        response.headers['Content-Encoding'] = encoding
+        self._weaken_etag(response)
+        return response
+
+    @staticmethod
+    def _weaken_etag(response):
+        """A compressed body is no longer byte-identical to the strong ETag"""
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+
+    @staticmethod
+    def precompressed_static(response):
+        """Swap a static file response for its .br/.gz copy, if it is up to date"""
+        response.vary.add('Accept-Encoding')
+        path = safe_join(current_app.static_folder, request.view_args.get('filename', ''))
+        if path is None:
+            return response
+
+        for encoding, suffix in PRECOMPRESSED_SUFFIXES.items():
+            if not request.accept_encodings[encoding]:
+                continue
+            compressed = path + suffix
+            if (os.path.isfile(compressed) and os.path.isfile(path)
+                    and os.path.getmtime(compressed) >= os.path.getmtime(path)):
+                response.close()
+                precompressed = send_file(compressed, mimetype=response.mimetype,
+                                          max_age=current_app.get_send_file_max_age(path),
+                                          conditional=True)
+                if precompressed.status_code == 200:
+                    precompressed.headers['Content-Encoding'] = encoding
+                precompressed.vary.add('Accept-Encoding')
+                return precompressed
+        return response
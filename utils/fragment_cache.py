@@ -0,0 +1,84 @@
+"""
+Fragment Cache
+Rendered HTML fragments (dashboard widgets) cached per process under a key
+that includes the data version of the sheets they are built from, so a
+write to one sheet only invalidates the fragments that read it.
+Concurrent requests for a missing fragment share a single rendering.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from markupsafe import Markup
+
+from config import Config
+
+class FragmentCache:
+    def __init__(self, max_entries=128, max_age=300):
+        """Keep up to max_entries fragments, each for at most max_age seconds (0 = no limit)"""
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (stored_at, html)
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def _lookup(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, html = entry
+        if self.max_age and time.monotonic() - stored_at > self.max_age:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return html
+
+    def get_or_render(self, key, render):
+        """Return the cached fragment for key, calling render() once on a miss"""
+        if not self.max_entries:
+            return Markup(render())
+
+        with self._lock:
+            html = self._lookup(key)
+            if html is not None:
+                self.hits += 1
+                return html
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # One request renders; concurrent requests for the same key wait for it
+        with key_lock:
+            with self._lock:
+                html = self._lookup(key)
+                if html is not None:
+                    self.hits += 1
+                    return html
+
+            try:
+                html = Markup(render())
+            except Exception:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+                raise
+
+            with self._lock:
+                self.misses += 1
+                self._entries[key] = (time.monotonic(), html)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                self._key_locks.pop(key, None)
+        return html
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        return {'size': len(self._entries), 'max_entries': self.max_entries,
+                'hits': self.hits, 'misses': self.misses}
+
+fragment_cache = FragmentCache(Config.FRAGMENT_CACHE_SIZE, Config.DATA_VERSION_MAX_AGE)
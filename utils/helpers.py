@@ -12,24 +12,6 @@ def generate_id(prefix='ID'):
     random_str = ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
     return f"{prefix}{timestamp}{random_str}"
 
-def calculate_price(property_type, square_feet, frequency='weekly'):
-    """Calculate cleaning price"""
-    from config import Config
-    
-    # Base rate per square foot
-    base_rates = Config.PRICING
-    base_rate = base_rates.get(property_type, 0.10)
-    
-    # Frequency multipliers
-    multipliers = Config.FREQUENCY_MULTIPLIERS
-    multiplier = multipliers.get(frequency, 1.0)
-    
-    # Calculate price
-    price = square_feet * base_rate * multiplier
-    
-    # Apply minimum charge
-    return max(price, Config.MINIMUM_CHARGE)
-
 def get_time_slots(date_str, duration_hours=2):
     """Generate available time slots for a date"""
     slots = []
@@ -0,0 +1,129 @@
+"""
+Minimal PDF Writer
+Just enough of PDF 1.4 for text documents: pages of Helvetica text, lines
+and filled rectangles, using the standard fonts every viewer ships (nothing
+is embedded). Text is Latin-1; other characters are replaced with '?'.
+"""
+
+import zlib
+
+# US Letter, in points
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+
+FONTS = {'regular': 'Helvetica', 'bold': 'Helvetica-Bold'}
+
+# Helvetica advance widths (1/1000 em) for printable ASCII, to right-align
+# and wrap text; other characters use the average width
+_HELVETICA_WIDTHS = (
+    278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+    556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+    1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+    667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+    333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+    556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584
+)
+
+
+def text_width(text, size, bold=False):
+    """Approximate width of text in points (bold runs about 5% wider)"""
+    units = sum(_HELVETICA_WIDTHS[ord(c) - 32] if 32 <= ord(c) < 127 else 556 for c in text)
+    return units * size / 1000 * (1.05 if bold else 1.0)
+
+def wrap(text, size, max_width, bold=False):
+    """Split text into lines that fit max_width points"""
+    lines = []
+    for paragraph in str(text).splitlines() or ['']:
+        line = ''
+        for word in paragraph.split(' '):
+            candidate = f"{line} {word}" if line else word
+            if line and text_width(candidate, size, bold) > max_width:
+                lines.append(line)
+                line = word
+            else:
+                line = candidate
+        lines.append(line)
+    return lines
+
+def _escape(text):
+    data = str(text).encode('latin-1', 'replace')
+    return data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)')
+
+
+class PDFDocument:
+    """Pages of drawing operations, serialized by to_bytes()"""
+
+    def __init__(self, title=''):
+        self.title = title
+        self.pages = []
+        self.add_page()
+
+    def add_page(self):
+        self.pages.append([])
+
+    def text(self, x, y, text, size=11, bold=False, color=(0, 0, 0)):
+        """Draw text with its baseline at (x, y), measured from the top-left corner"""
+        font = 'F2' if bold else 'F1'
+        self.pages[-1].append(
+            b'BT %s rg /%s %g Tf %g %g Td (%s) Tj ET' % (
+                self._color(color), font.encode(), size, x, PAGE_HEIGHT - y, _escape(text)))
+
+    def text_right(self, x, y, text, size=11, bold=False, color=(0, 0, 0)):
+        """Draw text ending at x"""
+        self.text(x - text_width(text, size, bold), y, text, size, bold, color)
+
+    def line(self, x1, y1, x2, y2, width=0.5, color=(0.8, 0.8, 0.8)):
+        self.pages[-1].append(b'%s RG %g w %g %g m %g %g l S' % (
+            self._color(color), width, x1, PAGE_HEIGHT - y1, x2, PAGE_HEIGHT - y2))
+
+    def rect(self, x, y, width, height, color=(0.95, 0.95, 0.95)):
+        """Filled rectangle with its top-left corner at (x, y)"""
+        self.pages[-1].append(b'%s rg %g %g %g %g re f' % (
+            self._color(color), x, PAGE_HEIGHT - y - height, width, height))
+
+    @staticmethod
+    def _color(rgb):
+        return b'%g %g %g' % tuple(rgb)
+
+    def to_bytes(self):
+        """Serialize the document (compressed content streams, one xref table)"""
+        objects = []
+
+        def add(body):
+            objects.append(body)
+            return len(objects)
+
+        catalog = add(None)
+        pages = add(None)
+        regular = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>'
+                      % FONTS['regular'].encode())
+        bold = add(b'<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>'
+                   % FONTS['bold'].encode())
+        info = add(b'<< /Title (%s) >>' % _escape(self.title))
+
+        page_ids = []
+        for operations in self.pages:
+            stream = zlib.compress(b'\n'.join(operations))
+            content = add(b'<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream'
+                          % (len(stream), stream))
+            page_ids.append(add(
+                b'<< /Type /Page /Parent %d 0 R /MediaBox [0 0 %d %d] /Contents %d 0 R '
+                b'/Resources << /Font << /F1 %d 0 R /F2 %d 0 R >> >> >>'
+                % (pages, PAGE_WIDTH, PAGE_HEIGHT, content, regular, bold)))
+
+        objects[catalog - 1] = b'<< /Type /Catalog /Pages %d 0 R >>' % pages
+        objects[pages - 1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (
+            b' '.join(b'%d 0 R' % p for p in page_ids), len(page_ids))
+
+        out = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(out))
+            out += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+
+        xref = len(out)
+        out += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+        out += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+        out += (b'trailer\n<< /Size %d /Root %d 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n'
+                % (len(objects) + 1, catalog, info, xref))
+        return bytes(out)
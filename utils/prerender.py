@@ -0,0 +1,50 @@
+"""
+Prerendered Pages
+Holds a page rendered once (at startup or deploy time) together with its
+gzip and brotli encodings and strong ETags, and serves it with long cache
+headers and 304 revalidation.
+"""
+
+import hashlib
+
+from flask import Response, request
+
+from config import Config
+from utils.compression import available_encodings, compress, negotiate_encoding
+
+class PrerenderedPage:
+    def __init__(self, html, content_type='text/html; charset=utf-8',
+                 max_age=Config.PUBLIC_PAGE_MAX_AGE):
+        """Encode html once and precompute every variant and its ETag"""
+        body = html.encode('utf-8') if isinstance(html, str) else html
+        digest = hashlib.sha256(body).hexdigest()[:32]
+
+        self.content_type = content_type
+        self.max_age = max_age
+        # encoding -> (body, etag); each representation gets its own strong ETag
+        self.variants = {'identity': (body, digest)}
+        self.encodings = available_encodings()
+        for encoding in self.encodings:
+            level = 11 if encoding == 'br' else 9
+            self.variants[encoding] = (compress(body, encoding, level), f"{digest}-{encoding}")
+
+    @property
+    def etag(self):
+        return self.variants['identity'][1]
+
+    def serve(self):
+        """Response for the current request: the best variant or a 304"""
+        encoding = negotiate_encoding(request.accept_encodings, self.encodings)
+        body, etag = self.variants[encoding]
+
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            response = Response(body, content_type=self.content_type)
+            if encoding != 'identity':
+                response.headers['Content-Encoding'] = encoding
+
+        response.set_etag(etag)
+        response.headers['Cache-Control'] = f"public, max-age={self.max_age}"
+        response.vary.add('Accept-Encoding')
+        return response
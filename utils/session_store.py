@@ -0,0 +1,241 @@
+"""
+Server-Side Sessions
+Session data is kept in a SQLite file on the server and the cookie only
+carries a signed, random session ID. Sessions expire after the app's
+permanent_session_lifetime without a request, and once the store holds
+more than SESSION_STORE_MAX_ENTRIES the least recently used are dropped.
+Logins and logouts call regenerate_session() so a session ID planted
+before login is never the one that ends up authenticated.
+Enabled when Config.SESSION_TYPE is 'filesystem' or 'sqlite'.
+"""
+
+import os
+import secrets
+import sqlite3
+import threading
+import time
+
+from flask import session as current_session
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SecureCookieSession, SessionInterface
+from itsdangerous import BadSignature, Signer
+
+from config import Config
+
+# Session types served from the server-side store
+SERVER_SIDE_TYPES = ('filesystem', 'sqlite')
+
+# Unmodified sessions get their expiry pushed back at most this often (seconds)
+TOUCH_INTERVAL = 60
+
+# Expired and least recently used sessions are pruned every this many writes
+PRUNE_EVERY = 100
+
+
+class SessionStore:
+    def __init__(self, path='sessions.db', max_entries=10000):
+        """Serialized sessions in the SQLite file at path, at most max_entries of them"""
+        self.path = path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        self._writes = 0
+
+    def _connection(self):
+        """One connection per thread and process (connections must not cross a fork)"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+
+        conn = sqlite3.connect(self.path, timeout=5)
+        conn.execute('CREATE TABLE IF NOT EXISTS sessions (id TEXT PRIMARY KEY, data TEXT NOT NULL, '
+                     'expires REAL NOT NULL, last_seen REAL NOT NULL)')
+        conn.execute('CREATE INDEX IF NOT EXISTS sessions_last_seen ON sessions (last_seen)')
+        conn.commit()
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def load(self, sid):
+        """(data, last_seen) of a live session, or None"""
+        try:
+            row = self._connection().execute(
+                'SELECT data, last_seen FROM sessions WHERE id = ? AND expires > ?',
+                (sid, time.time())).fetchone()
+        except Exception as e:
+            print(f"Error loading session: {e}")
+            return None
+        return row
+
+    def save(self, sid, data, expires):
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute('INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?)',
+                             (sid, data, expires, time.time()))
+            self._writes += 1
+            if self._writes % PRUNE_EVERY == 0:
+                self.prune()
+        except Exception as e:
+            print(f"Error saving session: {e}")
+
+    def touch(self, sid, expires):
+        """Extend a session's expiry and mark it as recently used"""
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute('UPDATE sessions SET expires = ?, last_seen = ? WHERE id = ?',
+                             (expires, time.time(), sid))
+        except Exception as e:
+            print(f"Error refreshing session: {e}")
+
+    def delete(self, sid):
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute('DELETE FROM sessions WHERE id = ?', (sid,))
+        except Exception as e:
+            print(f"Error deleting session: {e}")
+
+    def prune(self):
+        """Drop expired sessions, then the least recently used beyond max_entries"""
+        try:
+            conn = self._connection()
+            with conn:
+                conn.execute('DELETE FROM sessions WHERE expires <= ?', (time.time(),))
+                conn.execute('DELETE FROM sessions WHERE id IN (SELECT id FROM sessions '
+                             'ORDER BY last_seen DESC LIMIT -1 OFFSET ?)', (self.max_entries,))
+        except Exception as e:
+            print(f"Error pruning sessions: {e}")
+
+    def count(self):
+        return self._connection().execute('SELECT COUNT(*) FROM sessions').fetchone()[0]
+
+
+class ServerSideSession(SecureCookieSession):
+    """Session dict identified by sid, tracking reads and writes like Flask's own"""
+
+    def __init__(self, initial=None, sid=None, new=False, last_seen=0):
+        super().__init__(initial)
+        self.sid = sid
+        self.new = new
+        self.last_seen = last_seen
+        self.previous_sid = None
+
+    def regenerate(self):
+        """Move the session to a new random ID; the old one is deleted when the response is saved"""
+        if not self.new and self.previous_sid is None:
+            self.previous_sid = self.sid
+        self.sid = secrets.token_urlsafe(32)
+        self.modified = True
+
+
+def regenerate_session():
+    """Give the current session a new ID (on every login and logout).
+
+    Cookie sessions carry their data rather than an ID, so only server-side
+    sessions need it.
+    """
+    regenerate = getattr(current_session, 'regenerate', None)
+    if regenerate is not None:
+        regenerate()
+
+
+class ServerSideSessionInterface(SessionInterface):
+    """Flask session interface backed by a SessionStore"""
+
+    serializer = TaggedJSONSerializer()
+    salt = 'server-side-session'
+
+    def __init__(self, store):
+        self.store = store
+
+    @staticmethod
+    def lifetime(app):
+        """Seconds a session lives without a request: the app's permanent_session_lifetime"""
+        return app.permanent_session_lifetime.total_seconds()
+
+    def get_signer(self, app):
+        if not app.secret_key:
+            return None
+        return Signer(app.secret_key, salt=self.salt, key_derivation='hmac')
+
+    def open_session(self, app, request):
+        signer = self.get_signer(app)
+        if signer is None:
+            return None
+
+        cookie = request.cookies.get(self.get_cookie_name(app))
+        if cookie:
+            try:
+                sid = signer.unsign(cookie).decode('ascii')
+            except BadSignature:
+                sid = None
+            row = self.store.load(sid) if sid else None
+            # Stored expiries were set under the lifetime in effect back then
+            if row is not None and time.time() - row[1] <= self.lifetime(app) + TOUCH_INTERVAL:
+                data, last_seen = row
+                try:
+                    return ServerSideSession(self.serializer.loads(data), sid, last_seen=last_seen)
+                except Exception as e:
+                    print(f"Error reading session data: {e}")
+
+        return ServerSideSession(sid=secrets.token_urlsafe(32), new=True)
+
+    def save_session(self, app, session, response):
+        name = self.get_cookie_name(app)
+        domain = self.get_cookie_domain(app)
+        path = self.get_cookie_path(app)
+
+        if session.accessed:
+            response.vary.add('Cookie')
+
+        # A regenerated session no longer answers to its old ID
+        if getattr(session, 'previous_sid', None):
+            self.store.delete(session.previous_sid)
+            session.previous_sid = None
+
+        # Emptied sessions (logout) are removed from the store and the browser
+        if not session:
+            if session.modified and not session.new:
+                self.store.delete(session.sid)
+                response.delete_cookie(name, domain=domain, path=path,
+                                       secure=self.get_cookie_secure(app),
+                                       samesite=self.get_cookie_samesite(app),
+                                       httponly=self.get_cookie_httponly(app))
+            return
+
+        now = time.time()
+        expires = now + self.lifetime(app)
+        if session.modified or session.new:
+            self.store.save(session.sid, self.serializer.dumps(dict(session)), expires)
+        elif now - session.last_seen > TOUCH_INTERVAL:
+            self.store.touch(session.sid, expires)
+
+        if not (session.new or self.should_set_cookie(app, session)):
+            return
+
+        response.set_cookie(
+            name,
+            self.get_signer(app).sign(session.sid.encode('ascii')).decode('ascii'),
+            expires=self.get_expiration_time(app, session),
+            httponly=self.get_cookie_httponly(app),
+            domain=domain,
+            path=path,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app)
+        )
+
+
+class ServerSideSessions:
+    def __init__(self, app=None, session_type=None):
+        """Serve app's sessions from the server-side store when session_type asks for it"""
+        self.session_type = session_type or Config.SESSION_TYPE
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        if self.session_type not in SERVER_SIDE_TYPES:
+            return
+        store = SessionStore(Config.SESSION_DB, Config.SESSION_STORE_MAX_ENTRIES)
+        app.session_interface = ServerSideSessionInterface(store)
+        app.extensions['server_side_sessions'] = store
@@ -0,0 +1,75 @@
+"""
+Template Cache
+Bounded LRU cache of compiled Jinja templates for pages that keep their
+markup in inline strings. Templates are keyed by a hash of their source,
+so each page is lexed, parsed and compiled once per process instead of on
+every request.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+
+from flask import current_app
+from flask.signals import before_render_template, template_rendered
+
+from config import Config
+
+class TemplateCache:
+    def __init__(self, max_templates=64):
+        """Cache up to max_templates compiled templates (0 disables caching)"""
+        self.max_templates = max_templates
+        self.hits = 0
+        self.misses = 0
+        self._templates = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def source_key(env, source):
+        """Cache key: the Jinja environment plus a hash of the template source"""
+        return id(env), hashlib.sha1(source.encode('utf-8')).hexdigest()
+
+    def get_template(self, env, source):
+        """Return the compiled template for source, compiling it on a miss"""
+        if not self.max_templates:
+            self.misses += 1
+            return env.from_string(source)
+
+        key = self.source_key(env, source)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+                return template
+
+        # Compile outside the lock; a concurrent miss just compiles twice
+        template = env.from_string(source)
+        with self._lock:
+            self.misses += 1
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+        return template
+
+    def clear(self):
+        with self._lock:
+            self._templates.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        return {'size': len(self._templates), 'max_templates': self.max_templates,
+                'hits': self.hits, 'misses': self.misses}
+
+template_cache = TemplateCache(Config.TEMPLATE_CACHE_SIZE)
+
+def render_cached(source, **context):
+    """Drop-in replacement for flask.render_template_string using the cache"""
+    app = current_app._get_current_object()
+    template = template_cache.get_template(app.jinja_env, source)
+    app.update_template_context(context)
+    before_render_template.send(app, template=template, context=context)
+    rendered = template.render(context)
+    template_rendered.send(app, template=template, context=context)
+    return rendered